@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Compare @-path completion start-up with and without the saved file index.
+
+Generates a synthetic repository and times a full walk, a start from the
+saved snapshot with nothing changed, one after a single directory changed,
+and a fuzzy completion query over the resulting index.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import os
+from pathlib import Path
+import tempfile
+import time
+
+from vibe.core.autocompletion.completers import PathCompleter
+from vibe.core.autocompletion.file_indexer import FileIndexStats, FileIndexStore
+from vibe.core.autocompletion.file_indexer.ignore_rules import IgnoreRules
+from vibe.core.paths import FILE_INDEX_DIR
+
+
+def generate_repo(root: Path, files: int) -> None:
+    past = time.time() - 60
+    for i in range(files):
+        directory = root / f"pkg{i % 100}" / f"mod{i // 100 % 100}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"file_{i}.py").touch()
+    # Fresh directories sit inside the window where a saved listing is not
+    # trusted; age them as if the repository had been checked out earlier.
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, (past, past))
+
+
+def timed[T](fn: Callable[[], T]) -> tuple[T, float]:
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+def report(label: str, seconds: float, stats: FileIndexStats | None = None) -> None:
+    suffix = f"  {stats.rescanned_dirs} dirs listed" if stats is not None else ""
+    print(f"{label:32} {seconds * 1000:10.1f} ms{suffix}")
+
+
+def start(root: Path, cache_dir: Path | None) -> FileIndexStats:
+    stats = FileIndexStats()
+    FileIndexStore(IgnoreRules(), stats, cache_dir=cache_dir).rebuild(root)
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--query", default="mod42file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "repo"
+        root.mkdir()
+        _, seconds = timed(lambda: generate_repo(root, args.files))
+        report(f"generate {args.files:,} files", seconds)
+        os.environ["VIBE_HOME"] = str(Path(tmp) / "home")
+        cache_dir = FILE_INDEX_DIR.path
+
+        stats, seconds = timed(lambda: start(root, None))
+        report("full walk, no snapshot", seconds, stats)
+        stats, seconds = timed(lambda: start(root, cache_dir))
+        report("full walk, saving snapshot", seconds, stats)
+        stats, seconds = timed(lambda: start(root, cache_dir))
+        report("start from snapshot", seconds, stats)
+        (root / "pkg7" / "mod3" / "added.py").touch()
+        stats, seconds = timed(lambda: start(root, cache_dir))
+        report("start after one dir changed", seconds, stats)
+
+        os.chdir(root)
+        completer = PathCompleter()
+        text = f"@{args.query}"
+        completer.get_completions(text, len(text))
+        for label in ("completion query", "completion query, again"):
+            matches, seconds = timed(lambda: completer.get_completions(text, len(text)))
+            print(f"{label:32} {seconds * 1000:10.1f} ms  {len(matches)} matches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Compare encode/decode time of the available JSON codecs.
+
+Builds a synthetic conversation (200 messages, ~500 KB by default) shaped like
+the payloads the backends send and the session logger persists, then times a
+whole-payload encode/decode and a per-message (JSONL) encode/decode with each
+installed codec.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import time
+from typing import Any, cast
+
+from vibe.core.utils import jsoncodec
+
+
+def synthetic_conversation(messages: int, total_kb: float) -> list[dict[str, Any]]:
+    body = "lorem ipsum dolor sit amet — café 日本 "
+    size = max(1, int(total_kb * 1024 / messages))
+    text = (body * (size // len(body.encode()) + 1))[:size]
+    conversation: list[dict[str, Any]] = []
+    for i in range(messages):
+        match i % 4:
+            case 0:
+                conversation.append({"role": "user", "content": text})
+            case 1:
+                conversation.append({
+                    "role": "assistant",
+                    "content": text[: size // 2],
+                    "tool_calls": [
+                        {
+                            "id": f"call_{i}",
+                            "type": "function",
+                            "function": {
+                                "name": "read_file",
+                                "arguments": f'{{"path": "src/module_{i}.py"}}',
+                            },
+                        }
+                    ],
+                })
+            case 2:
+                conversation.append({
+                    "role": "tool",
+                    "tool_call_id": f"call_{i - 1}",
+                    "content": text,
+                })
+            case _:
+                conversation.append({
+                    "role": "assistant",
+                    "content": text,
+                    "reasoning_content": text[: size // 4],
+                })
+    return conversation
+
+
+def best_of(repeat: int, fn: Any) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(name: jsoncodec.CodecName, messages: list[dict[str, Any]], repeat: int) -> None:
+    jsoncodec.use_codec(name)
+    payload = {"model": "devstral", "messages": messages, "stream": True}
+    body = jsoncodec.dumpb(payload)
+    lines = [jsoncodec.dumps(m) for m in messages]
+    assert jsoncodec.loads(body) == payload
+
+    encode = best_of(repeat, lambda: jsoncodec.dumpb(payload))
+    decode = best_of(repeat, lambda: jsoncodec.loads(body))
+    encode_lines = best_of(repeat, lambda: [jsoncodec.dumps(m) for m in messages])
+    decode_lines = best_of(repeat, lambda: [jsoncodec.loads(line) for line in lines])
+    print(
+        f"{name:<8} {encode * 1000:8.2f} {decode * 1000:8.2f} "
+        f"{encode_lines * 1000:10.2f} {decode_lines * 1000:10.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--kb", type=float, default=500.0, help="conversation size")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    messages = synthetic_conversation(args.messages, args.kb)
+    size = len(jsoncodec.dumpb(messages))
+    print(f"{len(messages)} messages, {size / 1024:.0f} KB (best of {args.repeat})")
+    print(f"{'codec':<8} {'enc ms':>8} {'dec ms':>8} {'jsonl enc':>10} {'jsonl dec':>10}")
+
+    previous = jsoncodec.codec_name()
+    for name in ("json", "orjson", "msgspec"):
+        if name != "json" and importlib.util.find_spec(name) is None:
+            print(f"{name:<8} not installed")
+            continue
+        bench(cast(jsoncodec.CodecName, name), messages, args.repeat)
+    jsoncodec.use_codec(previous)
+
+
+if __name__ == "__main__":
+    main()
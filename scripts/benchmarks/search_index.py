@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Compare grep searches with and without the trigram search index.
+
+Generates a synthetic repository, then times the grep tool without the
+index (first run, then warm) and with it, after building the index from
+scratch and reloading it from its saved copy. The files were just written,
+so the "cold" run still finds them in the page cache; drop the caches
+(``sync; echo 3 > /proc/sys/vm/drop_caches`` on Linux) before it for a
+truly cold number.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import os
+from pathlib import Path
+import random
+import tempfile
+import time
+
+from vibe.core.search import TrigramIndex
+from vibe.core.tools.base import BaseToolState
+from vibe.core.tools.builtins import grep as grep_module
+from vibe.core.tools.builtins.grep import Grep, GrepArgs, GrepResult, GrepToolConfig
+
+WORDS = [
+    "request",
+    "response",
+    "handler",
+    "config",
+    "session",
+    "message",
+    "buffer",
+    "stream",
+    "parser",
+    "token",
+    "client",
+    "server",
+]
+
+
+def generate_repo(root: Path, files: int, lines: int, seed: int) -> None:
+    rng = random.Random(seed)
+    for i in range(files):
+        directory = root / f"pkg{i % 100}" / f"mod{i // 100 % 100}"
+        directory.mkdir(parents=True, exist_ok=True)
+        body = [
+            f"def {rng.choice(WORDS)}_{rng.choice(WORDS)}_{rng.randrange(10_000)}"
+            f"(value):\n    return value + {rng.randrange(1000)}\n"
+            for _ in range(lines // 2)
+        ]
+        if i % 10_000 == 0:
+            body.append("RARE_MARKER_SYMBOL = True\n")
+        (directory / f"file{i}.py").write_text("".join(body))
+
+
+async def search(config: GrepToolConfig, pattern: str) -> GrepResult:
+    grep = Grep(config_getter=lambda: config, state=BaseToolState())
+    result = None
+    async for item in grep.run(GrepArgs(pattern=pattern)):
+        result = item
+    assert isinstance(result, GrepResult)
+    return result
+
+
+def timed[T](fn: Callable[[], T]) -> tuple[T, float]:
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+def report(label: str, seconds: float, result: GrepResult | None = None) -> None:
+    suffix = f"  {result.match_count} matches" if result is not None else ""
+    print(f"{label:32} {seconds * 1000:10.1f} ms{suffix}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--lines", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--pattern", default="RARE_MARKER_SYMBOL")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "repo"
+        root.mkdir()
+        _, seconds = timed(
+            lambda: generate_repo(root, args.files, args.lines, args.seed)
+        )
+        report(f"generate {args.files:,} files", seconds)
+        os.chdir(root)
+
+        plain = GrepToolConfig()
+        exclude_patterns = Grep(
+            config_getter=lambda: plain, state=BaseToolState()
+        )._collect_exclude_patterns()
+        cache_path = Path(tmp) / "search.idx"
+
+        for label in ("grep, first run", "grep, warm"):
+            result, seconds = timed(lambda: asyncio.run(search(plain, args.pattern)))
+            report(label, seconds, result)
+
+        index = TrigramIndex(root, exclude_patterns, cache_path=cache_path, watch=False)
+        _, seconds = timed(index.build)
+        report(f"index build ({index.file_count:,} files)", seconds)
+        index = TrigramIndex(root, exclude_patterns, cache_path=cache_path, watch=False)
+        _, seconds = timed(index.build)
+        report("index load and reconcile", seconds)
+        print(f"{'index size':32} {cache_path.stat().st_size / 1e6:10.1f} MB")
+
+        grep_module.shared_search_index = lambda *_: index
+        indexed = GrepToolConfig(use_search_index=True)
+        for label, pattern in (
+            ("indexed grep", args.pattern),
+            ("indexed, broad", "handler"),
+        ):
+            result, seconds = timed(
+                lambda pattern=pattern: asyncio.run(search(indexed, pattern))
+            )
+            report(label, seconds, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Compare the SSE line framer against the previous whole-buffer implementation.
+
+Builds a multi-MB synthetic ``text/event-stream`` body, slices it into small
+network-sized reads and measures lines/s and MB/s for both parsers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from vibe.core.utils.sse import SSEEventDecoder, SSELineDecoder
+
+
+def legacy_lines(chunks: list[bytes]) -> list[bytes]:
+    lines: list[bytes] = []
+    buffer = b""
+    for chunk in chunks:
+        buffer += chunk
+        held_cr = buffer.endswith(b"\r")
+        if held_cr:
+            buffer = buffer[:-1]
+        *new_lines, buffer = (
+            buffer.replace(b"\r\n", b"\n").replace(b"\r", b"\n").split(b"\n")
+        )
+        if held_cr:
+            buffer += b"\r"
+        lines.extend(new_lines)
+    if buffer:
+        lines.append(buffer.removesuffix(b"\r"))
+    return lines
+
+
+def framer_lines(chunks: list[bytes]) -> list[bytes]:
+    decoder = SSELineDecoder()
+    lines: list[bytes] = []
+    for chunk in chunks:
+        lines.extend(decoder.feed(chunk))
+    if (tail := decoder.flush()) is not None:
+        lines.append(tail)
+    return lines
+
+
+def synthetic_stream(total_mb: float, line_kb: float) -> bytes:
+    text = "x" * int(line_kb * 1024)
+    event = f"data: {json.dumps({'choices': [{'delta': {'content': text}}]})}\n\n"
+    count = max(1, int(total_mb * 1024 * 1024 / len(event)))
+    return event.encode() * count
+
+
+def run(name: str, fn: object, chunks: list[bytes], size: int) -> list[bytes]:
+    assert callable(fn)
+    start = time.perf_counter()
+    lines = fn(chunks)
+    elapsed = time.perf_counter() - start
+    mb = size / (1024 * 1024)
+    print(
+        f"{name:<14} {elapsed * 1000:9.1f} ms  {mb / elapsed:8.1f} MB/s  "
+        f"{len(lines) / elapsed:12.0f} lines/s"
+    )
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=float, default=8.0, help="stream size in MB")
+    parser.add_argument("--line-kb", type=float, default=64.0, help="event size")
+    parser.add_argument("--read-size", type=int, default=1024, help="bytes per read")
+    args = parser.parse_args()
+
+    body = synthetic_stream(args.mb, args.line_kb)
+    chunks = [body[i : i + args.read_size] for i in range(0, len(body), args.read_size)]
+    print(f"{len(body) / (1024 * 1024):.1f} MB in {len(chunks)} reads")
+
+    legacy = run("legacy", legacy_lines, chunks, len(body))
+    framed = run("SSELineDecoder", framer_lines, chunks, len(body))
+    assert legacy == framed
+
+    decoder = SSEEventDecoder()
+    start = time.perf_counter()
+    events = [e for line in framed if (e := decoder.decode(line.decode()))]
+    print(
+        f"event framing  {(time.perf_counter() - start) * 1000:9.1f} ms  "
+        f"{len(events)} events"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Compare folding streamed chunks with ``LLMChunk.__add__`` and ``StreamAccumulator``.
+
+Replays a recorded stream (a JSONL file of ``LLMChunk`` dumps) or, by default,
+a synthetic reasoning-heavy stream of 10k deltas ending in a tool call.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import time
+
+from vibe.core.types import (
+    FunctionCall,
+    LLMChunk,
+    LLMMessage,
+    LLMUsage,
+    Role,
+    StreamAccumulator,
+    ToolCall,
+)
+
+
+def synthetic_stream(n_deltas: int) -> list[LLMChunk]:
+    chunks: list[LLMChunk] = []
+    reasoning = n_deltas // 2
+    for i in range(n_deltas - 1):
+        if i < reasoning:
+            msg = LLMMessage(role=Role.assistant, reasoning_content=f"thought {i} ")
+        elif i < n_deltas - 200:
+            msg = LLMMessage(role=Role.assistant, content=f"token {i} ")
+        else:
+            msg = LLMMessage(
+                role=Role.assistant,
+                tool_calls=[
+                    ToolCall(
+                        index=0,
+                        id="call_0" if i == n_deltas - 200 else None,
+                        function=FunctionCall(
+                            name="write_file" if i == n_deltas - 200 else None,
+                            arguments=f'"part{i}",',
+                        ),
+                    )
+                ],
+            )
+        chunks.append(LLMChunk(message=msg))
+    chunks.append(
+        LLMChunk(
+            message=LLMMessage(role=Role.assistant),
+            usage=LLMUsage(prompt_tokens=1000, completion_tokens=n_deltas),
+        )
+    )
+    return chunks
+
+
+def load_recording(path: Path) -> list[LLMChunk]:
+    with path.open(encoding="utf-8") as f:
+        return [LLMChunk.model_validate_json(line) for line in f if line.strip()]
+
+
+def fold(chunks: list[LLMChunk]) -> LLMChunk:
+    agg: LLMChunk | None = None
+    for chunk in chunks:
+        agg = chunk if agg is None else agg + chunk
+    assert agg is not None
+    return agg
+
+
+def accumulate(chunks: list[LLMChunk]) -> LLMChunk:
+    acc = StreamAccumulator()
+    for chunk in chunks:
+        acc.add(chunk)
+    return acc.build()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--recording", type=Path, help="JSONL file of LLMChunk dumps")
+    parser.add_argument("--deltas", type=int, default=10_000)
+    args = parser.parse_args()
+
+    chunks = (
+        load_recording(args.recording)
+        if args.recording
+        else synthetic_stream(args.deltas)
+    )
+    print(f"replaying {len(chunks)} deltas")
+
+    start = time.perf_counter()
+    folded = fold(chunks)
+    fold_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    built = accumulate(chunks)
+    acc_s = time.perf_counter() - start
+
+    assert folded.message.content == built.message.content
+    assert folded.message.reasoning_content == built.message.reasoning_content
+    assert folded.message.tool_calls == built.message.tool_calls
+
+    print(f"LLMChunk.__add__ fold: {fold_s * 1000:9.1f} ms")
+    print(f"StreamAccumulator:     {acc_s * 1000:9.1f} ms")
+    print(f"speedup:               {fold_s / acc_s:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
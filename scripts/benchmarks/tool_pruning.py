@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Measure the context saved by pruning stale tool results.
+
+Replays recorded sessions (directories holding a ``messages.jsonl``, or a
+save directory of them) or, by default, a synthetic coding session, and
+reports the approximate tokens before and after ``prune_tool_results``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import time
+
+# isort: off
+# vibe.core.prompts and vibe.core.config import each other; the app always
+# loads the config first.
+import vibe.core.config  # noqa: F401
+from vibe.core.compaction import PRUNE_KEEP_RECENT, PRUNE_MIN_CHARS, prune_tool_results
+
+# isort: on
+from vibe.core.types import FunctionCall, LLMMessage, Role, ToolCall
+from vibe.core.utils.tokens import approx_token_count
+
+
+def synthetic_session(rounds: int) -> list[LLMMessage]:
+    messages = [
+        LLMMessage(role=Role.system, content="system prompt"),
+        LLMMessage(role=Role.user, content="fix the failing tests"),
+    ]
+    tools = [
+        ("read_file", lambda i: {"path": f"src/mod{i % 7}.py"}, 12_000),
+        ("grep", lambda i: {"pattern": f"symbol{i}"}, 6_000),
+        ("bash", lambda i: {"command": "pytest -q"}, 20_000),
+    ]
+    for i in range(rounds):
+        name, arguments, size = tools[i % len(tools)]
+        call_id = f"call_{i}"
+        messages.append(
+            LLMMessage(
+                role=Role.assistant,
+                content="checking",
+                tool_calls=[
+                    ToolCall(
+                        id=call_id,
+                        index=0,
+                        function=FunctionCall(
+                            name=name, arguments=json.dumps(arguments(i))
+                        ),
+                    )
+                ],
+            )
+        )
+        # Files are re-read unchanged; other outputs differ every time.
+        body = f"{name} output {i % 7 if name == 'read_file' else i}\n"
+        messages.append(
+            LLMMessage(
+                role=Role.tool,
+                tool_call_id=call_id,
+                name=name,
+                content=body * (size // len(body)),
+            )
+        )
+    return messages
+
+
+def load_sessions(path: Path) -> list[tuple[str, list[LLMMessage]]]:
+    logs = (
+        [path / "messages.jsonl"]
+        if (path / "messages.jsonl").is_file()
+        else sorted(path.glob("*/messages.jsonl"))
+    )
+    sessions = []
+    for log in logs:
+        with log.open(encoding="utf-8") as f:
+            messages = [
+                LLMMessage.model_validate_json(line) for line in f if line.strip()
+            ]
+        sessions.append((log.parent.name, messages))
+    return sessions
+
+
+def context_tokens(messages: list[LLMMessage]) -> int:
+    return sum(approx_token_count(message.content or "") for message in messages)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=Path, help="session or save directory")
+    parser.add_argument("--rounds", type=int, default=120)
+    parser.add_argument("--keep-recent", type=int, default=PRUNE_KEEP_RECENT)
+    parser.add_argument("--min-chars", type=int, default=PRUNE_MIN_CHARS)
+    args = parser.parse_args()
+
+    sessions = (
+        load_sessions(args.sessions)
+        if args.sessions
+        else [("synthetic", synthetic_session(args.rounds))]
+    )
+    total_before = total_after = 0
+    for name, messages in sessions:
+        start = time.perf_counter()
+        pruned = prune_tool_results(
+            messages,
+            Path(name) / "messages.jsonl",
+            keep_recent=args.keep_recent,
+            min_chars=args.min_chars,
+        )
+        elapsed = time.perf_counter() - start
+        before = context_tokens(messages)
+        after = before - sum(result.tokens_saved for result in pruned)
+        total_before += before
+        total_after += after
+        print(
+            f"{name:40} {len(messages):6} msgs {before:10,} -> {after:10,} tokens "
+            f"({len(pruned)} pruned, {elapsed * 1000:.1f} ms)"
+        )
+
+    if total_before:
+        saved = 1 - total_after / total_before
+        print(f"total: {total_before:,} -> {total_after:,} tokens ({saved:.0%} saved)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from acp.schema import SessionInfoUpdate
@@ -11,6 +10,7 @@ from tests.conftest import get_base_config
 from tests.stubs.fake_client import FakeClient
 from vibe.acp.acp_agent_loop import VibeAcpAgentLoop
 from vibe.acp.exceptions import InternalError, InvalidRequestError, SessionNotFoundError
+from vibe.core.session.session_store import read_metadata
 
 
 class TestSessionSetTitle:
@@ -85,7 +85,7 @@ class TestSessionSetTitle:
         assert metadata.end_time == "2024-01-01T12:05:00Z"
         assert session.agent_loop.session_id == saved_session_id
 
-        saved_metadata = json.loads((session_dir / "meta.json").read_text())
+        saved_metadata = read_metadata(session_dir)
         assert saved_metadata["title"] == "Renamed session"
         assert saved_metadata["title_source"] == "manual"
         assert saved_metadata["end_time"] == "2024-01-01T12:05:00Z"
@@ -174,7 +174,7 @@ class TestSessionSetTitle:
 
         assert result == {}
 
-        saved_metadata = json.loads((session_dir / "meta.json").read_text())
+        saved_metadata = read_metadata(session_dir)
         assert saved_metadata["title"] == "Renamed session"
         assert saved_metadata["title_source"] == "manual"
 
@@ -227,7 +227,7 @@ class TestSessionSetTitle:
         )
 
         assert result == {}
-        saved_metadata = json.loads((session_dir / "meta.json").read_text())
+        saved_metadata = read_metadata(session_dir)
         assert saved_metadata["title"] == "Renamed without key"
         assert saved_metadata["title_source"] == "manual"
 
@@ -297,7 +297,7 @@ class TestSessionSetTitle:
         )
 
         assert result == {}
-        saved_metadata = json.loads((session_dir / "meta.json").read_text())
+        saved_metadata = read_metadata(session_dir)
         assert saved_metadata["title"] == "Renamed session"
         assert saved_metadata["title_source"] == "manual"
 
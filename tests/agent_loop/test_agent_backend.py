@@ -13,6 +13,7 @@ import pytest
 from tests.conftest import (
     ConfigBuilder,
     build_test_agent_loop,
+    build_test_vibe_config,
     make_test_models,
     set_agent_config,
 )
@@ -20,7 +21,12 @@ from tests.mock.utils import mock_llm_chunk
 from tests.stubs.fake_backend import FakeBackend
 from vibe import __version__
 from vibe.core.agents.models import BuiltinAgentName
-from vibe.core.config import ModelConfig, ProviderConfig, VibeConfigSchema
+from vibe.core.config import (
+    HTTPPoolConfig,
+    ModelConfig,
+    ProviderConfig,
+    VibeConfigSchema,
+)
 from vibe.core.telemetry.types import LaunchContext, TerminalEmulator
 from vibe.core.tools.base import BaseToolConfig, ToolPermission
 from vibe.core.types import (
@@ -581,3 +587,96 @@ async def test_refusal_error_carries_category_and_explanation_streaming(
     assert err.explanation == "This request was declined for safety reasons."
     assert "This request was declined for safety reasons." in str(err)
     assert "cyber" in str(err)
+
+
+class _PrewarmingBackend(FakeBackend):
+    def __init__(self, saved: float | None) -> None:
+        super().__init__([mock_llm_chunk(content="Response")])
+        self.saved = saved
+        self.prewarm_calls = 0
+
+    async def prewarm(self) -> float | None:
+        self.prewarm_calls += 1
+        return self.saved
+
+
+@pytest.mark.asyncio
+async def test_prewarm_alone_records_no_time_saved() -> None:
+    backend = _PrewarmingBackend(saved=0.25)
+    agent = build_test_agent_loop(
+        config=build_test_vibe_config(http_pool=HTTPPoolConfig()), backend=backend
+    )
+    assert agent._prewarm_task is not None
+    await agent._prewarm_task
+
+    assert backend.prewarm_calls == 1
+    assert agent.stats.prewarm_time_saved == 0.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("enable_streaming", [False, True])
+async def test_completion_records_time_saved_by_reused_connection(
+    monkeypatch: pytest.MonkeyPatch, enable_streaming: bool
+) -> None:
+    # Before and after the completion, as the pool reports them.
+    readings = iter([0.5, 0.75])
+    monkeypatch.setattr(
+        "vibe.core.agent_loop._loop._prewarm_time_saved", lambda: next(readings)
+    )
+    agent = build_test_agent_loop(
+        backend=FakeBackend([mock_llm_chunk(content="Response")]),
+        enable_streaming=enable_streaming,
+    )
+
+    [_ async for _ in agent.act("Hello")]
+
+    assert agent.stats.prewarm_time_saved == pytest.approx(0.25)
+
+
+@pytest.mark.asyncio
+async def test_prewarm_connection_keeps_warm_while_composing() -> None:
+    backend = _PrewarmingBackend(saved=0.0)
+    agent = build_test_agent_loop(
+        config=build_test_vibe_config(http_pool=HTTPPoolConfig(keepalive_expiry=0.01)),
+        backend=backend,
+    )
+    assert agent._prewarm_task is not None
+    await agent._prewarm_task
+    composing = iter([True, True, False])
+
+    agent.prewarm_connection(keep_warm=lambda: next(composing))
+    assert agent._prewarm_task is not None
+    await agent._prewarm_task
+
+    assert backend.prewarm_calls == 4
+
+
+@pytest.mark.asyncio
+async def test_prewarm_connection_stops_keeping_warm_when_unreachable() -> None:
+    backend = _PrewarmingBackend(saved=None)
+    agent = build_test_agent_loop(
+        config=build_test_vibe_config(http_pool=HTTPPoolConfig(keepalive_expiry=0.01)),
+        backend=backend,
+    )
+    assert agent._prewarm_task is not None
+    await agent._prewarm_task
+
+    agent.prewarm_connection(keep_warm=lambda: True)
+    assert agent._prewarm_task is not None
+    await agent._prewarm_task
+
+    assert backend.prewarm_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_prewarm_connection_respects_config() -> None:
+    backend = _PrewarmingBackend(saved=0.25)
+    agent = build_test_agent_loop(
+        config=build_test_vibe_config(http_pool=HTTPPoolConfig(prewarm=False)),
+        backend=backend,
+    )
+
+    agent.prewarm_connection()
+
+    assert agent._prewarm_task is None
+    assert backend.prewarm_calls == 0
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import time
+
+import pytest
+
+from vibe.core.autocompletion.file_indexer import (
+    FileIndexStats,
+    FileIndexStore,
+    IndexSnapshot,
+)
+from vibe.core.autocompletion.file_indexer.ignore_rules import IgnoreRules
+from vibe.core.autocompletion.file_indexer.store import build_ascii_mask
+from vibe.core.autocompletion.file_indexer.watcher import Change
+
+
+def _age(root: Path) -> None:
+    """Move every mtime out of the window in which a listing is distrusted."""
+    past = time.time() - 60
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, (past, past))
+
+
+def _make_tree(root: Path) -> None:
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "src" / "pkg" / "module.py").write_text("")
+    (root / "src" / "main.py").write_text("")
+    (root / "README.md").write_text("")
+    _age(root)
+
+
+def _store(cache_dir: Path) -> tuple[FileIndexStore, FileIndexStats]:
+    stats = FileIndexStats()
+    return FileIndexStore(IgnoreRules(), stats, cache_dir=cache_dir), stats
+
+
+def _rels(store: FileIndexStore) -> list[str]:
+    return [entry.rel for entry in store.snapshot()]
+
+
+def test_snapshot_round_trips_through_a_mapped_file(tmp_path: Path) -> None:
+    rels = ["a", "a/b.py", "a/c", "a/c/d", "ab", "é.txt"]
+    mask_with_high_bits = build_ascii_mask("~z") | build_ascii_mask("a")
+    records = [
+        (rel, rel in {"a", "a/c"}, 7 if rel in {"a", "a/c"} else 0, mask)
+        for rel, mask in zip(
+            rels, [mask_with_high_bits, *map(build_ascii_mask, rels[1:])], strict=True
+        )
+    ]
+    IndexSnapshot.from_records(
+        records, root_mtime_ns=1, walk_started_ns=2, rules_digest=b"d" * 16
+    ).save(tmp_path / "index")
+
+    loaded = IndexSnapshot.load(tmp_path / "index")
+
+    assert loaded is not None
+    assert list(loaded.records()) == records
+    assert (loaded.root_mtime_ns, loaded.walk_started_ns) == (1, 2)
+    assert loaded.rules_digest == b"d" * 16
+    assert loaded.index_of("a/c") == 2
+    assert loaded.index_of("a/x") is None
+    assert [loaded.rel(i) for i in loaded.subtree("a")] == ["a/b.py", "a/c", "a/c/d"]
+
+
+def test_unreadable_snapshot_is_ignored(tmp_path: Path) -> None:
+    (tmp_path / "index").write_bytes(b"not an index")
+
+    assert IndexSnapshot.load(tmp_path / "index") is None
+    assert IndexSnapshot.load(tmp_path / "missing") is None
+
+
+def test_unchanged_tree_is_served_from_the_saved_snapshot(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    root.mkdir()
+    _make_tree(root)
+    first, first_stats = _store(tmp_path / "cache")
+    first.rebuild(root)
+    assert first_stats.rescanned_dirs == 3
+
+    second, stats = _store(tmp_path / "cache")
+    second.rebuild(root)
+
+    assert stats.rescanned_dirs == 0
+    assert _rels(second) == _rels(first)
+    assert _rels(second) == [
+        "README.md",
+        "src",
+        "src/main.py",
+        "src/pkg",
+        "src/pkg/module.py",
+    ]
+
+
+def test_only_changed_directories_are_rescanned(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    root.mkdir()
+    _make_tree(root)
+    _store(tmp_path / "cache")[0].rebuild(root)
+
+    (root / "src" / "pkg" / "module.py").unlink()
+    (root / "src" / "pkg" / "new.py").write_text("")
+    store, stats = _store(tmp_path / "cache")
+    store.rebuild(root)
+
+    assert stats.rescanned_dirs == 1
+    assert "src/pkg/new.py" in _rels(store)
+    assert "src/pkg/module.py" not in _rels(store)
+
+
+def test_gitignore_change_invalidates_the_snapshot(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    root.mkdir()
+    _make_tree(root)
+    _store(tmp_path / "cache")[0].rebuild(root)
+
+    (root / ".gitignore").write_text("src/\n")
+    _age(root)
+    store, stats = _store(tmp_path / "cache")
+    store.rebuild(root)
+
+    assert stats.rescanned_dirs == 1
+    assert _rels(store) == [".gitignore", "README.md"]
+
+
+@pytest.mark.parametrize("recreate", [False, True])
+def test_changes_are_layered_over_the_snapshot(tmp_path: Path, recreate: bool) -> None:
+    root = tmp_path / "repo"
+    root.mkdir()
+    _make_tree(root)
+    store, _ = _store(tmp_path / "cache")
+    store.rebuild(root)
+    resolved = root.resolve()
+
+    store.apply_changes([(Change.deleted, resolved / "src")])
+    assert _rels(store) == ["README.md"]
+
+    (root / "src").rename(root / "lib")
+    store.apply_changes([(Change.added, resolved / "lib")])
+    if recreate:
+        (root / "lib").rename(root / "src")
+        store.apply_changes([
+            (Change.deleted, resolved / "lib"),
+            (Change.added, resolved / "src"),
+        ])
+    name = "src" if recreate else "lib"
+
+    assert _rels(store) == [
+        "README.md",
+        name,
+        f"{name}/main.py",
+        f"{name}/pkg",
+        f"{name}/pkg/module.py",
+    ]
+    view = store.view()
+    assert len(view) == len(_rels(store))
+    assert {rel for rel, _ in view.paths()} == set(_rels(store))
@@ -259,6 +259,66 @@ class TestBackend:
 
         assert [result.message.content for result in results] == [content]
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "stream",
+        [
+            pytest.param(
+                b'data: {"n": 0}\ndata: {"n": 1}\ndata: [DONE]\n\n',
+                id="one-document-per-data-line",
+            ),
+            pytest.param(
+                b'data: {"n":\ndata: 0}\n\ndata: {"n": 1}\n\ndata: [DONE]\n\n',
+                id="document-split-over-data-lines",
+            ),
+        ],
+    )
+    async def test_streaming_request_decodes_data_lines(self, stream: bytes):
+        with respx.mock(base_url="https://api.fireworks.ai") as mock_api:
+            mock_api.post("/v1/chat/completions").mock(
+                return_value=httpx.Response(
+                    status_code=200,
+                    stream=httpx.ByteStream(stream=stream),
+                    headers={"Content-Type": "text/event-stream"},
+                )
+            )
+            provider = ProviderConfig(
+                name="provider_name",
+                api_base="https://api.fireworks.ai/v1",
+                api_key_env_var="API_KEY",
+            )
+            backend = GenericBackend(provider=provider)
+            payloads = [
+                payload
+                async for payload in backend._make_streaming_request(
+                    "https://api.fireworks.ai/v1/chat/completions", b"{}", {}
+                )
+            ]
+
+        assert payloads == [{"n": 0}, {"n": 1}]
+
+    @pytest.mark.asyncio
+    async def test_streaming_request_rejects_malformed_line(self):
+        with respx.mock(base_url="https://api.fireworks.ai") as mock_api:
+            mock_api.post("/v1/chat/completions").mock(
+                return_value=httpx.Response(
+                    status_code=200,
+                    stream=httpx.ByteStream(stream=b"not-an-sse-line\n\n"),
+                    headers={"Content-Type": "text/event-stream"},
+                )
+            )
+            provider = ProviderConfig(
+                name="provider_name",
+                api_base="https://api.fireworks.ai/v1",
+                api_key_env_var="API_KEY",
+            )
+            backend = GenericBackend(provider=provider)
+            with pytest.raises(ValueError, match="improperly formatted"):
+                async for _ in backend._make_streaming_request(
+                    "https://api.fireworks.ai/v1/chat/completions", b"{}", {}
+                ):
+                    pass
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "base_url,backend_class,response",
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+import gc
+import json
+from typing import Any
+
+import pytest
+
+from vibe.core.config import ModelConfig, ProviderConfig, ThinkingLevel
+from vibe.core.llm.backend._message_cache import MessageCache
+from vibe.core.llm.backend.anthropic import AnthropicAdapter
+from vibe.core.llm.backend.base import APIAdapter
+from vibe.core.llm.backend.factory import create_backend
+from vibe.core.llm.backend.generic import GenericBackend, OpenAIAdapter
+from vibe.core.llm.backend.mistral import MistralBackend, MistralMapper
+from vibe.core.llm.backend.openai_responses import OpenAIResponsesAdapter
+from vibe.core.llm.backend.reasoning_adapter import ReasoningAdapter
+from vibe.core.types import (
+    Backend,
+    FunctionCall,
+    ImageAttachment,
+    InlineImageSource,
+    LLMMessage,
+    MessageList,
+    Role,
+    ToolCall,
+)
+
+
+class _FakeProvider:
+    name = "mistral"
+    reasoning_field_name = "reasoning_content"
+
+
+def _conversation() -> list[LLMMessage]:
+    return [
+        LLMMessage(role=Role.system, content="be helpful"),
+        LLMMessage(role=Role.user, content="read the file — café"),
+        LLMMessage(
+            role=Role.assistant,
+            content="reading",
+            reasoning_content="need to read it",
+            tool_calls=[
+                ToolCall(
+                    id="call_1",
+                    index=0,
+                    function=FunctionCall(name="read_file", arguments='{"path": "a"}'),
+                )
+            ],
+        ),
+        LLMMessage(
+            role=Role.tool, content="contents", tool_call_id="call_1", name="read_file"
+        ),
+    ]
+
+
+def _payload(
+    adapter: APIAdapter,
+    messages: Sequence[LLMMessage],
+    cache: MessageCache | None,
+    **overrides: Any,
+) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {
+        "model_name": "gpt-4o",
+        "messages": list(messages),
+        "temperature": 0.0,
+        "tools": None,
+        "max_tokens": None,
+        "tool_choice": None,
+        "enable_streaming": True,
+        "provider": _FakeProvider(),
+        "api_key": "k",
+        "message_cache": cache,
+    }
+    kwargs.update(overrides)
+    return json.loads(adapter.prepare_request(**kwargs).body)
+
+
+ADAPTERS = [
+    pytest.param(OpenAIAdapter, id="openai"),
+    pytest.param(ReasoningAdapter, id="reasoning"),
+    pytest.param(OpenAIResponsesAdapter, id="responses"),
+    pytest.param(AnthropicAdapter, id="anthropic"),
+]
+
+
+@pytest.mark.parametrize("adapter_cls", ADAPTERS)
+def test_cached_payload_matches_uncached(adapter_cls: type[APIAdapter]) -> None:
+    messages = _conversation()
+    cache = MessageCache()
+
+    expected = _payload(adapter_cls(), messages, None)
+
+    assert _payload(adapter_cls(), messages, cache) == expected
+    assert _payload(adapter_cls(), messages, cache) == expected
+    assert len(cache) > 0
+
+
+@pytest.mark.parametrize("adapter_cls", ADAPTERS)
+def test_spliced_body_matches_encoded_payload(adapter_cls: type[APIAdapter]) -> None:
+    messages = _conversation()
+
+    expected = _payload(adapter_cls(), messages, None)
+
+    cache = MessageCache(splice_json=True)
+    assert _payload(adapter_cls(), messages, cache) == expected
+    assert _payload(adapter_cls(), messages, cache) == expected
+
+
+@pytest.mark.parametrize("thinking", ["off", "high"])
+def test_mistral_cached_messages_match_uncached(thinking: ThinkingLevel) -> None:
+    backend = MistralBackend(
+        provider=ProviderConfig(
+            name="mistral",
+            api_base="https://api.mistral.ai/v1",
+            api_key_env_var="API_KEY",
+        )
+    )
+    model = ModelConfig(
+        name="mistral-large", provider="mistral", alias="large", thinking=thinking
+    )
+    messages = _conversation()
+    include_reasoning_content = thinking != "off"
+    uncached = [
+        MistralMapper().prepare_message(
+            msg, include_reasoning_content=include_reasoning_content
+        )
+        for msg in messages
+    ]
+
+    assert backend._prepare_messages(messages, model) == uncached
+    assert backend._prepare_messages(messages, model) == uncached
+
+
+def test_unchanged_messages_are_converted_once() -> None:
+    cache = MessageCache()
+    msg = LLMMessage(role=Role.user, content="hi")
+    calls: list[LLMMessage] = []
+
+    def convert(m: LLMMessage) -> dict[str, Any]:
+        calls.append(m)
+        return {"content": m.content}
+
+    first = cache.convert(msg, "k", convert)
+    second = cache.convert(msg, "k", convert)
+
+    assert first is second
+    assert calls == [msg]
+
+
+def test_reassigned_field_invalidates_entry() -> None:
+    messages = _conversation()
+    cache = MessageCache()
+    adapter = OpenAIAdapter()
+    _payload(adapter, messages, cache)
+
+    messages[1].content = "edited"
+
+    assert _payload(adapter, messages, cache)["messages"][1]["content"] == "edited"
+
+
+def test_patched_tool_call_arguments_invalidate_entry() -> None:
+    messages = _conversation()
+    cache = MessageCache(splice_json=True)
+    adapter = OpenAIAdapter()
+    _payload(adapter, messages, cache)
+
+    assert messages[2].tool_calls is not None
+    messages[2].tool_calls[0].function.arguments = '{"path": "b"}'
+
+    payload = _payload(adapter, messages, cache)
+    assert payload["messages"][2]["tool_calls"][0]["function"]["arguments"] == (
+        '{"path": "b"}'
+    )
+
+
+def test_replaced_list_element_invalidates_entry() -> None:
+    def image(data: str) -> ImageAttachment:
+        return ImageAttachment(
+            source=InlineImageSource(data=data), alias="a.png", mime_type="image/png"
+        )
+
+    msg = LLMMessage(
+        role=Role.user, content="look", images=[image("AAAA")], reasoning_state=["s1"]
+    )
+    cache = MessageCache()
+    adapter = OpenAIAdapter()
+    _payload(adapter, [msg], cache)
+    seen = cache.convert(msg, "state", lambda m: list(m.reasoning_state or ()))
+
+    assert msg.images is not None and msg.reasoning_state is not None
+    msg.images[0] = image("BBBB")
+    msg.reasoning_state[0] = "s2"
+
+    parts = _payload(adapter, [msg], cache)["messages"][0]["content"]
+    assert parts[1]["image_url"]["url"] == "data:image/png;base64,BBBB"
+    assert cache.convert(msg, "state", lambda m: list(m.reasoning_state or ())) == [
+        "s2"
+    ]
+    assert seen == ["s1"]
+
+
+def test_options_are_cached_separately() -> None:
+    messages = _conversation()
+    cache = MessageCache()
+    adapter = OpenAIAdapter()
+
+    class _ReasoningProvider(_FakeProvider):
+        reasoning_field_name = "reasoning"
+
+    default = _payload(adapter, messages, cache)
+    renamed = _payload(adapter, messages, cache, provider=_ReasoningProvider())
+
+    assert "reasoning_content" in default["messages"][2]
+    assert "reasoning" in renamed["messages"][2]
+
+
+def test_anthropic_cache_control_does_not_leak_into_cache() -> None:
+    messages = _conversation()[:2]
+    cache = MessageCache()
+    adapter = AnthropicAdapter()
+
+    first = _payload(adapter, messages, cache)
+    assert first["messages"][-1]["content"][-1]["cache_control"] == {
+        "type": "ephemeral"
+    }
+
+    messages.append(LLMMessage(role=Role.assistant, content="ok"))
+    second = _payload(adapter, messages, cache)
+
+    assert "cache_control" not in second["messages"][0]["content"][-1]
+
+
+def test_anthropic_tool_results_do_not_mutate_cached_user_message() -> None:
+    messages = [
+        LLMMessage(role=Role.user, content="go"),
+        LLMMessage(role=Role.tool, content="one", tool_call_id="a"),
+    ]
+    cache = MessageCache()
+    adapter = AnthropicAdapter()
+
+    _payload(adapter, messages, cache)
+    payload = _payload(adapter, messages[:1], cache)
+
+    assert [block["type"] for block in payload["messages"][0]["content"]] == ["text"]
+
+
+def test_entries_are_dropped_with_their_message() -> None:
+    cache = MessageCache()
+    msg = LLMMessage(role=Role.user, content="hi")
+    cache.convert(msg, "k", lambda m: m.content)
+    assert len(cache) == 1
+
+    del msg
+    gc.collect()
+
+    assert len(cache) == 0
+
+
+def test_create_backend_passes_splice_option() -> None:
+    provider = ProviderConfig(
+        name="test_provider",
+        api_base="https://api.example.com/v1",
+        api_key_env_var="API_KEY",
+        backend=Backend.GENERIC,
+    )
+
+    for splice in (False, True):
+        backend = create_backend(provider=provider, splice_message_json=splice)
+        assert isinstance(backend, GenericBackend)
+        assert backend._message_cache.splice_json is splice
+
+
+def test_message_list_reset_clears_cache_and_system_prompt_misses() -> None:
+    cache = MessageCache()
+    messages = MessageList([LLMMessage(role=Role.system, content="old")])
+    messages.on_reset(cache.clear)
+
+    def convert(msg: LLMMessage) -> str | None:
+        return msg.content
+
+    assert cache.convert(messages[0], "k", convert) == "old"
+    messages.update_system_prompt("new")
+    assert cache.convert(messages[0], "k", convert) == "new"
+
+    messages.reset([])
+    assert len(cache) == 0
@@ -8,6 +8,7 @@ import pytest
 from tests.conftest import build_test_vibe_app, build_test_vibe_config
 from vibe.cli.textual_ui.widgets.messages import ErrorMessage, UserCommandMessage
 from vibe.core.config import SessionLoggingConfig
+from vibe.core.session.session_store import read_metadata
 
 
 def _enabled_session_config(save_dir: Path) -> SessionLoggingConfig:
@@ -68,7 +69,7 @@ async def test_rename_command_persists_existing_session_metadata(
     assert metadata.title == "Persisted title"
     assert metadata.title_source == "manual"
 
-    saved_metadata = json.loads(logger.metadata_filepath.read_text())
+    saved_metadata = read_metadata(logger.session_dir)
     assert saved_metadata["title"] == "Persisted title"
     assert saved_metadata["title_source"] == "manual"
     assert saved_metadata["end_time"] == "2024-01-01T12:05:00Z"
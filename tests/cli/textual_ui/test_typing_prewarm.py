@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+
+from tests.conftest import build_test_vibe_app
+from vibe.cli.textual_ui.app import VibeApp
+
+
+@pytest.fixture
+def vibe_app() -> VibeApp:
+    return build_test_vibe_app()
+
+
+@pytest.mark.asyncio
+async def test_typing_prewarms_once_per_prompt(
+    vibe_app: VibeApp, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[Callable[[], bool] | None] = []
+    monkeypatch.setattr(
+        vibe_app.agent_loop,
+        "prewarm_connection",
+        lambda keep_warm=None: calls.append(keep_warm),
+    )
+
+    async with vibe_app.run_test() as pilot:
+        await pilot.press("h", "i")
+        await pilot.pause()
+        assert len(calls) == 1
+        keep_warm = calls[0]
+        assert keep_warm is not None and keep_warm()
+
+        await pilot.press("backspace", "backspace")
+        await pilot.pause()
+        assert not keep_warm()
+        await pilot.press("a")
+        await pilot.pause()
+        assert len(calls) == 2
@@ -27,6 +27,7 @@ from vibe.core.agent_loop import AgentLoop
 from vibe.core.agents.models import BuiltinAgentName
 from vibe.core.config import (
     DEFAULT_MODELS,
+    HTTPPoolConfig,
     ModelConfig,
     SessionLoggingConfig,
     VibeConfigSchema,
@@ -129,6 +130,7 @@ def get_base_config() -> dict[str, Any]:
             }
         ],
         "enable_telemetry": False,
+        "http_pool": {"prewarm": False},
     }
 
 
@@ -406,6 +408,8 @@ def _prepare_test_config_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
     # detail unless a test opts in.
     kwargs.setdefault("include_project_context", False)
     kwargs.setdefault("include_prompt_detail", False)
+    # Pre-warming opens a connection to the provider; tests opt in explicitly.
+    kwargs.setdefault("http_pool", HTTPPoolConfig(prewarm=False))
     return kwargs
 
 
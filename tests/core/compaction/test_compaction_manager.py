@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import cast
 
 import pytest
@@ -31,13 +32,16 @@ class _FakeComplete:
         self._stats = stats
         self.calls: list[dict] = []
 
-    async def __call__(self, *, model, messages, tools, tool_choice, call_type):
+    async def __call__(
+        self, *, model, messages, tools, tool_choice, call_type, background=False
+    ):
         self.calls.append({
             "model": model,
             "messages": list(messages),
             "tools": tools,
             "tool_choice": tool_choice,
             "call_type": call_type,
+            "background": background,
         })
         item = self._results.pop(0)
         if isinstance(item, Exception):
@@ -336,3 +340,89 @@ async def test_terminal_failure_reports_empty_when_primary_empty() -> None:
 
     assert summary == "(no summary available)"
     assert telemetry.failures == ["empty_summary"]
+
+
+@pytest.mark.asyncio
+async def test_speculative_summary_is_swapped_in_with_tail() -> None:
+    messages = _conversation()
+    stats = AgentStats()
+    manager, complete, _ = _build_manager(
+        [mock_llm_chunk(content="<summary>early</summary>")],
+        messages=messages,
+        stats=stats,
+    )
+
+    manager.speculate()
+    manager.speculate()  # already pending for this prefix
+    messages.append(LLMMessage(role=Role.assistant, content="more work"))
+    messages.append(LLMMessage(role=Role.user, content="after freeze"))
+
+    summary = await manager.compact()
+
+    assert summary == "early"
+    assert len(complete.calls) == 1
+    assert complete.calls[0]["background"] is True
+    assert [m.content for m in messages[2:]] == ["more work", "after freeze"]
+    # Only the summarized prefix's user messages go into the envelope.
+    assert parse_previous_user_messages(messages[1].content or "") == [
+        "oldest ask",
+        "newest ask",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_speculative_summary_is_discarded_when_prefix_changes() -> None:
+    messages = _conversation()
+    stats = AgentStats()
+    manager, complete, _ = _build_manager(
+        [
+            mock_llm_chunk(content="<summary>stale</summary>"),
+            mock_llm_chunk(content="<summary>fresh</summary>"),
+        ],
+        messages=messages,
+        stats=stats,
+    )
+
+    manager.speculate()
+    await asyncio.sleep(0)
+    messages[2].content = "edited work"
+
+    summary = await manager.compact()
+
+    assert summary == "fresh"
+    assert [call["background"] for call in complete.calls] == [True, False]
+    assert [m.role for m in messages] == [Role.system, Role.user]
+
+
+@pytest.mark.asyncio
+async def test_failed_speculation_falls_back_to_compaction() -> None:
+    messages = _conversation()
+    stats = AgentStats()
+    manager, complete, telemetry = _build_manager(
+        [RuntimeError("boom"), mock_llm_chunk(content="<summary>sync</summary>")],
+        messages=messages,
+        stats=stats,
+    )
+
+    manager.speculate()
+
+    assert await manager.compact() == "sync"
+    assert len(complete.calls) == 2
+    assert not telemetry.failures
+
+
+@pytest.mark.asyncio
+async def test_reset_cancels_speculation() -> None:
+    messages = _conversation()
+    stats = AgentStats()
+    manager, complete, _ = _build_manager(
+        [mock_llm_chunk(content="<summary>never</summary>")],
+        messages=messages,
+        stats=stats,
+    )
+
+    manager.speculate()
+    messages.reset(list(messages[:2]))
+    await asyncio.sleep(0)
+
+    assert complete.calls == []
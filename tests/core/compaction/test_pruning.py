@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+import json
+from pathlib import Path
+
+from vibe.core.compaction import PRUNED_MARKER, ToolResultPruner, prune_tool_results
+from vibe.core.types import FunctionCall, LLMMessage, MessageList, Role, ToolCall
+
+
+def _call(call_id: str, name: str, **arguments: object) -> LLMMessage:
+    return LLMMessage(
+        role=Role.assistant,
+        content="",
+        tool_calls=[
+            ToolCall(
+                id=call_id,
+                index=0,
+                function=FunctionCall(name=name, arguments=json.dumps(arguments)),
+            )
+        ],
+    )
+
+
+def _result(call_id: str, name: str, content: str) -> LLMMessage:
+    return LLMMessage(role=Role.tool, tool_call_id=call_id, name=name, content=content)
+
+
+def _conversation(*rounds: tuple[str, Mapping[str, object], str]) -> list[LLMMessage]:
+    messages = [
+        LLMMessage(role=Role.system, content="sys"),
+        LLMMessage(role=Role.user, content="go"),
+    ]
+    for i, (name, arguments, content) in enumerate(rounds):
+        messages.append(_call(f"c{i}", name, **arguments))
+        messages.append(_result(f"c{i}", name, content))
+    return messages
+
+
+def test_old_large_results_are_stubbed_with_log_pointer() -> None:
+    messages = _conversation(
+        ("bash", {"command": "make"}, "x" * 5000),
+        ("grep", {"pattern": "foo"}, "small"),
+        ("bash", {"command": "ls"}, "y" * 5000),
+    )
+
+    pruned = prune_tool_results(
+        messages, Path("/s/messages.jsonl"), keep_recent=1, min_chars=100
+    )
+
+    assert [result.index for result in pruned] == [3]
+    stub = pruned[0].message.content or ""
+    assert stub.startswith(PRUNED_MARKER)
+    assert 'bash({"command": "make"})' in stub
+    assert "5,000 bytes" in stub
+    # Line 3 of the log: the user message, the call, then this result.
+    assert "line 3 of /s/messages.jsonl" in stub
+    assert pruned[0].message.tool_call_id == "c0"
+    assert pruned[0].tokens_saved > 1000
+
+
+def test_repeated_reads_of_same_range_are_deduped() -> None:
+    page = "line\n" * 100
+    messages = _conversation(
+        ("read_file", {"path": "a.py", "offset": 0}, page),
+        ("read_file", {"offset": 0, "path": "a.py"}, page),
+        ("read_file", {"path": "a.py", "offset": 0}, page + "edited"),
+    )
+
+    pruned = prune_tool_results(messages, None, keep_recent=10, min_chars=10_000)
+
+    # Only the first read: the last one returned different content.
+    assert [result.index for result in pruned] == [3]
+    assert "same as a later call" in (pruned[0].message.content or "")
+
+
+def test_pruner_replaces_in_place_and_is_idempotent() -> None:
+    messages = MessageList(
+        _conversation(
+            ("bash", {"command": "make"}, "x" * 5000),
+            *[("bash", {"command": "true"}, "ok")] * 6,
+        )
+    )
+    pruner = ToolResultPruner(messages, lambda: None)
+
+    assert pruner.prune() > 0
+    assert (messages[3].content or "").startswith(PRUNED_MARKER)
+    assert "Run the call again" in (messages[3].content or "")
+    assert pruner.prune() == 0
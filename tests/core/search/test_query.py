@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+
+from vibe.core.search.query import literal_trigrams, trigram_query
+
+
+def _trigrams(*literals: str) -> frozenset[int]:
+    return frozenset().union(*(literal_trigrams(text.encode()) for text in literals))
+
+
+@pytest.mark.parametrize(
+    ("pattern", "literals"),
+    [
+        ("Hello", [["hello"]]),
+        (r"def\s+main\(", [["def", "main("]]),
+        ("foo|barbaz", [["foo"], ["barbaz"]]),
+        ("(a|b)qux[0-9]zed", [["qux", "zed"]]),
+        ("colou?rful", [["colo", "rful"]]),
+        (r"a\.bc", [["a.bc"]]),
+        (r"\bclass Foo\b", [["class foo"]]),
+    ],
+)
+def test_required_literals(pattern: str, literals: list[list[str]]) -> None:
+    assert trigram_query(pattern) == [_trigrams(*branch) for branch in literals]
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["ab", "a.*b", "foo|x", r"\x41bcd", r"(abc)\1", "x+yz", "thé", "abc)", "[abc"],
+)
+def test_patterns_that_cannot_narrow(pattern: str) -> None:
+    assert trigram_query(pattern) is None
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from watchfiles import Change
+
+from tests.mock.utils import collect_result
+from vibe.core.search import trigram_index
+from vibe.core.search.trigram_index import TrigramIndex
+from vibe.core.tools.base import BaseToolState
+from vibe.core.tools.builtins import grep as grep_module
+from vibe.core.tools.builtins.grep import Grep, GrepArgs, GrepToolConfig
+
+
+def _tree(root: Path) -> None:
+    (root / "src").mkdir()
+    (root / "src" / "alpha.py").write_text("def alpha_handler():\n    pass\n")
+    (root / "src" / "beta.py").write_text("BETA_HANDLER = 1\n")
+    (root / "node_modules").mkdir()
+    (root / "node_modules" / "dep.js").write_text("alpha_handler\n")
+    (root / "blob.bin").write_bytes(b"\0alpha_handler")
+
+
+def _index(root: Path, **kwargs) -> TrigramIndex:
+    index = TrigramIndex(root, ["node_modules/"], watch=False, **kwargs)
+    index.build()
+    return index
+
+
+def _names(paths: list[Path] | None) -> list[str] | None:
+    return None if paths is None else [path.name for path in paths]
+
+
+def test_candidates_narrow_to_files_with_the_literals(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    index = _index(tmp_path)
+
+    assert _names(index.candidates("alpha_hand")) == ["alpha.py"]
+    # Case-folded: a smart-case search for either spelling finds both.
+    assert _names(index.candidates("(?i)unused|handler")) == ["alpha.py", "beta.py"]
+    assert _names(index.candidates("nowhere_to_be_found")) == []
+    assert index.candidates("a.*b") is None
+    assert _names(index.candidates("handler", tmp_path / "src" / "..")) == [
+        "alpha.py",
+        "beta.py",
+    ]
+
+
+def test_large_files_are_always_candidates(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    (tmp_path / "big.txt").write_text("x" * 100)
+
+    index = _index(tmp_path, max_file_bytes=64)
+
+    assert _names(index.candidates("nowhere_to_be_found")) == ["big.txt"]
+
+
+def test_watch_changes_update_the_index(tmp_path: Path) -> None:
+    _tree(tmp_path)
+    index = _index(tmp_path)
+    alpha = tmp_path / "src" / "alpha.py"
+    gamma = tmp_path / "src" / "gamma.py"
+    alpha.write_text("nothing here\n")
+    gamma.write_text("alpha_handler()\n")
+
+    index._handle_watch_changes(
+        index.root, [(Change.modified, str(alpha)), (Change.added, str(gamma))]
+    )
+    assert _names(index.candidates("alpha_handler")) == ["gamma.py"]
+
+    gamma.unlink()
+    index._handle_watch_changes(index.root, [(Change.deleted, str(gamma))])
+    assert _names(index.candidates("alpha_handler")) == []
+
+
+def test_saved_index_only_rereads_changed_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "repo"
+    root.mkdir()
+    _tree(root)
+    cache = tmp_path / "cache" / "index.idx"
+    _index(root, cache_path=cache)
+    (root / "src" / "beta.py").write_text("beta_handler = 2\nalpha_handler\n")
+
+    read: list[int] = []
+    original = trigram_index.literal_trigrams
+    monkeypatch.setattr(
+        trigram_index,
+        "literal_trigrams",
+        lambda data: read.append(len(data)) or original(data),
+    )
+    index = _index(root, cache_path=cache)
+
+    assert len(read) == 1
+    assert _names(index.candidates("alpha_handler")) == ["alpha.py", "beta.py"]
+
+
+@pytest.mark.asyncio
+async def test_grep_searches_only_index_candidates(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    _tree(tmp_path)
+    config = GrepToolConfig(use_search_index=True)
+    index = _index(tmp_path)
+    monkeypatch.setattr(grep_module, "shared_search_index", lambda *_: index)
+    grep = Grep(config_getter=lambda: config, state=BaseToolState())
+    commands: list[list[str]] = []
+    build = grep._build_command
+    monkeypatch.setattr(
+        grep, "_build_command", lambda *a: commands.append(build(*a)) or commands[-1]
+    )
+
+    result = await collect_result(grep.run(GrepArgs(pattern="alpha_handler")))
+    missing = await collect_result(grep.run(GrepArgs(pattern="nowhere_to_be_found")))
+
+    assert result.match_count == 1
+    assert "src/alpha.py:1:" in result.matches
+    assert commands[0][-1] == "./src/alpha.py"
+    assert missing.match_count == 0
+    assert len(commands) == 1
@@ -26,7 +26,12 @@ from vibe.core.telemetry.types import (
 )
 from vibe.core.tools.base import BaseTool, ToolPermission
 from vibe.core.types import Backend
-from vibe.core.utils import get_platform_id, get_platform_version, get_user_agent
+from vibe.core.utils import (
+    get_platform_id,
+    get_platform_version,
+    get_user_agent,
+    jsoncodec,
+)
 
 _original_send_telemetry_event = TelemetryClient.send_telemetry_event
 from vibe.core.tools.builtins.edit import Edit, EditArgs
@@ -97,6 +102,16 @@ def _assert_system_metadata(
     assert properties["terminal_emulator"] == terminal_emulator
 
 
+def _assert_posted(
+    mock_post: AsyncMock, url: str, *, json: dict[str, Any], headers: dict[str, str]
+) -> None:
+    mock_post.assert_called_once()
+    assert mock_post.call_args.args == (url,)
+    assert mock_post.call_args.kwargs.keys() == {"content", "headers"}
+    assert jsoncodec.loads(mock_post.call_args.kwargs["content"]) == json
+    assert mock_post.call_args.kwargs["headers"] == headers
+
+
 class TestExtractFileExtension:
     @pytest.mark.parametrize(
         ("path", "expected"),
@@ -189,7 +204,8 @@ class TestTelemetryClient:
         client.send_telemetry_event("vibe.test_event", {"key": "value"})
         await client.aclose()
 
-        mock_post.assert_called_once_with(
+        _assert_posted(
+            mock_post,
             "https://api.mistral.ai/v1/datalake/events",
             json={
                 "event": "vibe.test_event",
@@ -751,7 +767,8 @@ class TestTelemetryClient:
         client.send_session_closed()
         await client.aclose()
 
-        mock_post.assert_called_once_with(
+        _assert_posted(
+            mock_post,
             "https://api.mistral.ai/v1/datalake/events",
             json={
                 "event": "vibe.session_closed",
@@ -852,7 +869,8 @@ class TestTelemetryClient:
         client.send_telemetry_event("vibe.test_event", {"key": "value"})
         await client.aclose()
 
-        mock_post.assert_called_once_with(
+        _assert_posted(
+            mock_post,
             "https://api.mistral.ai/v1/datalake/events",
             json={
                 "event": "vibe.test_event",
@@ -893,7 +911,8 @@ class TestTelemetryClient:
         client.send_telemetry_event("vibe.test_event", {"key": "value"})
         await client.aclose()
 
-        mock_post.assert_called_once_with(
+        _assert_posted(
+            mock_post,
             "https://api.mistral.ai/v1/datalake/events",
             json={
                 "event": "vibe.test_event",
@@ -929,7 +948,8 @@ class TestTelemetryClient:
         client.send_telemetry_event("vibe.test_event", {"key": "value"})
         await client.aclose()
 
-        mock_post.assert_called_once_with(
+        _assert_posted(
+            mock_post,
             "https://api.mistral.ai/v1/datalake/events",
             json={
                 "event": "vibe.test_event",
@@ -967,9 +987,13 @@ class TestTelemetryClient:
         await client.aclose()
 
         calls = mock_post.call_args_list
-        assert calls[0].kwargs["json"]["properties"]["session_id"] == "first-session-id"
         assert (
-            calls[1].kwargs["json"]["properties"]["session_id"] == "second-session-id"
+            jsoncodec.loads(calls[0].kwargs["content"])["properties"]["session_id"]
+            == "first-session-id"
+        )
+        assert (
+            jsoncodec.loads(calls[1].kwargs["content"])["properties"]["session_id"]
+            == "second-session-id"
         )
 
     def test_send_auto_compact_triggered_overrides_session_metadata(
@@ -54,3 +54,49 @@ def test_update_system_prompt_notifies_only_when_requested() -> None:
     messages.update_system_prompt("loud", notify=True)
     assert len(observed) == 1
     assert observed[0].content == "loud"
+
+
+class _CountingEstimator:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def count(self, text: str) -> int:
+        self.calls += 1
+        return len(text)
+
+
+def test_estimate_tokens_only_counts_new_or_changed_messages() -> None:
+    estimator = _CountingEstimator()
+    messages = MessageList(
+        initial=[
+            LLMMessage(role=Role.system, content="system"),
+            LLMMessage(role=Role.user, content="hello"),
+        ]
+    )
+
+    first = messages.estimate_tokens(estimator)
+    assert estimator.calls == 2
+    assert messages.estimate_tokens(estimator) == first
+    assert estimator.calls == 2
+
+    messages.append(LLMMessage(role=Role.assistant, content="hi"))
+    messages[1].content = "hello there"
+    total = messages.estimate_tokens(estimator)
+
+    assert estimator.calls == 4
+    assert total == first + len(" there") + len("hi") + 4
+
+
+def test_projected_tokens_use_calibrated_overhead() -> None:
+    estimator = _CountingEstimator()
+    messages = MessageList(initial=[LLMMessage(role=Role.user, content="hello")])
+    assert messages.projected_tokens(estimator) == 0
+
+    messages.calibrate_tokens(messages.estimate_tokens(estimator) + 100, estimator)
+    messages.append(LLMMessage(role=Role.tool, content="x" * 50))
+
+    assert messages.projected_tokens(estimator) == (
+        messages.estimate_tokens(estimator) + 100
+    )
+    messages.reset([LLMMessage(role=Role.user, content="hi")])
+    assert messages.projected_tokens(estimator) == len("hi") + 4 + 100
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from functools import reduce
+
+import pytest
+
+from vibe.core.types import (
+    FunctionCall,
+    LLMChunk,
+    LLMMessage,
+    LLMUsage,
+    Role,
+    StopInfo,
+    StreamAccumulator,
+    ToolCall,
+)
+
+
+def _chunk(
+    content: str | None = None,
+    *,
+    reasoning: str | None = None,
+    signature: str | None = None,
+    tool_calls: list[ToolCall] | None = None,
+    usage: LLMUsage | None = None,
+    correlation_id: str | None = None,
+    stop: StopInfo | None = None,
+) -> LLMChunk:
+    return LLMChunk(
+        message=LLMMessage(
+            role=Role.assistant,
+            content=content,
+            reasoning_content=reasoning,
+            reasoning_signature=signature,
+            tool_calls=tool_calls,
+        ),
+        usage=usage,
+        correlation_id=correlation_id,
+        stop=stop,
+    )
+
+
+def _tool_delta(
+    index: int, *, id: str | None = None, name: str | None = None, args: str = ""
+) -> ToolCall:
+    return ToolCall(
+        id=id, index=index, function=FunctionCall(name=name, arguments=args)
+    )
+
+
+def _accumulate(chunks: list[LLMChunk]) -> LLMChunk:
+    acc = StreamAccumulator()
+    for chunk in chunks:
+        acc.add(chunk)
+    return acc.build()
+
+
+def _fold(chunks: list[LLMChunk]) -> LLMChunk:
+    return reduce(lambda a, b: a + b, chunks)
+
+
+def test_matches_fold_for_text_and_reasoning_deltas() -> None:
+    chunks = [
+        _chunk(reasoning="Let me ", signature="sig-"),
+        _chunk(reasoning="think.", signature="1"),
+        _chunk("Hello"),
+        _chunk(", world", correlation_id="corr-1"),
+        _chunk(usage=LLMUsage(prompt_tokens=10, completion_tokens=4)),
+    ]
+
+    built = _accumulate(chunks)
+    folded = _fold(chunks)
+
+    assert built.model_dump() == folded.model_dump()
+    assert built.message.content == "Hello, world"
+    assert built.message.reasoning_content == "Let me think."
+    assert built.message.reasoning_signature == "sig-1"
+    assert built.correlation_id == "corr-1"
+
+
+def test_merges_tool_call_fragments_by_index() -> None:
+    chunks = [
+        _chunk(tool_calls=[_tool_delta(0, id="call_a", name="grep", args='{"pa')]),
+        _chunk(tool_calls=[_tool_delta(1, id="call_b", name="bash", args="{")]),
+        _chunk(tool_calls=[_tool_delta(0, args='ttern": "x"}')]),
+        _chunk(tool_calls=[_tool_delta(1, args='"command": "ls"}')]),
+        _chunk(usage=LLMUsage(prompt_tokens=1, completion_tokens=1)),
+    ]
+
+    built = _accumulate(chunks)
+
+    assert built.model_dump() == _fold(chunks).model_dump()
+    assert built.message.tool_calls is not None
+    assert [tc.function.arguments for tc in built.message.tool_calls] == [
+        '{"pattern": "x"}',
+        '{"command": "ls"}',
+    ]
+
+
+def test_empty_text_collapses_to_none() -> None:
+    built = _accumulate([_chunk(""), _chunk("")])
+
+    assert built.message.content is None
+    assert built.message.reasoning_content is None
+
+
+def test_single_chunk_is_returned_unchanged() -> None:
+    chunk = _chunk("", usage=LLMUsage(prompt_tokens=1))
+
+    assert _accumulate([chunk]) is chunk
+
+
+def test_usage_is_summed_and_last_stop_wins() -> None:
+    acc = StreamAccumulator()
+    acc.add(_chunk("a"))
+    assert acc.usage is None
+
+    acc.add(_chunk("b", usage=LLMUsage(prompt_tokens=3, completion_tokens=1)))
+    acc.add(
+        _chunk(usage=LLMUsage(completion_tokens=2), stop=StopInfo(reason="refusal"))
+    )
+
+    assert acc.usage == LLMUsage(prompt_tokens=3, completion_tokens=3)
+    built = acc.build()
+    assert built.usage == acc.usage
+    assert built.stop is not None and built.stop.is_refusal
+
+
+def test_rejects_conflicting_tool_call_names() -> None:
+    acc = StreamAccumulator()
+    acc.add(_chunk(tool_calls=[_tool_delta(0, name="grep")]))
+
+    with pytest.raises(ValueError, match="different tool call names"):
+        acc.add(_chunk(tool_calls=[_tool_delta(0, name="bash")]))
+
+
+def test_rejects_tool_call_without_index() -> None:
+    acc = StreamAccumulator()
+
+    with pytest.raises(ValueError, match="missing index"):
+        acc.add(_chunk(tool_calls=[ToolCall(function=FunctionCall(name="grep"))]))
+
+
+def test_rejects_mixed_roles() -> None:
+    acc = StreamAccumulator()
+    acc.add(_chunk("a"))
+
+    with pytest.raises(ValueError, match="different roles"):
+        acc.add(LLMChunk(message=LLMMessage(role=Role.user, content="b")))
+
+
+def test_build_on_empty_stream_raises() -> None:
+    with pytest.raises(ValueError, match="empty stream"):
+        StreamAccumulator().build()
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import replace
+
+import httpx
+import pytest
+
+from vibe.core.utils.http import (
+    HTTPPoolRegistry,
+    HTTPPoolSettings,
+    HTTPPoolStats,
+    VibeAsyncHTTPClient,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_proxies(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("vibe.core.utils.http.getproxies", dict)
+
+
+async def _serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    # Minimal keep-alive HTTP/1.1 server: answers every request with "ok".
+    try:
+        while head := await reader.readuntil(b"\r\n\r\n"):
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n")
+            if not head.startswith(b"HEAD"):
+                writer.write(b"ok")
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+@asynccontextmanager
+async def _server() -> AsyncIterator[str]:
+    server = await asyncio.start_server(_serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.close()
+
+
+async def _get(registry: HTTPPoolRegistry, url: str) -> str:
+    async with VibeAsyncHTTPClient(transport=registry.transport()) as client:
+        response = await client.get(url)
+        return response.text
+
+
+@pytest.mark.asyncio
+async def test_clients_share_pooled_connections() -> None:
+    registry = HTTPPoolRegistry()
+    async with _server() as server_url:
+        assert await _get(registry, f"{server_url}/a") == "ok"
+        assert await _get(registry, f"{server_url}/b") == "ok"
+        await registry.aclose()
+
+    assert registry.total_stats() == HTTPPoolStats(
+        requests=2, connections_opened=1, connections_reused=1
+    )
+
+
+@pytest.mark.asyncio
+async def test_prewarm_opens_connection_for_first_request() -> None:
+    registry = HTTPPoolRegistry()
+    async with _server() as server_url:
+        assert (await registry.prewarm(f"{server_url}/v1") or 0.0) > 0.0
+        before = registry.total_stats()
+        assert await registry.prewarm(f"{server_url}/v1") == 0.0
+        await _get(registry, f"{server_url}/v1/chat")
+        await registry.aclose()
+
+    delta = registry.total_stats() - before
+    assert delta.prewarm_time_saved > 0.0
+    assert replace(delta, prewarm_time_saved=0.0) == HTTPPoolStats(
+        requests=1, connections_reused=1
+    )
+
+
+@pytest.mark.asyncio
+async def test_prewarm_saving_is_credited_to_reusing_request() -> None:
+    registry = HTTPPoolRegistry()
+    async with _server() as server_url:
+        handshake = await registry.prewarm(server_url)
+        assert handshake
+        assert registry.total_stats().prewarm_time_saved == 0.0
+        await _get(registry, server_url)
+        await _get(registry, server_url)
+        await registry.aclose()
+
+    assert registry.total_stats().prewarm_time_saved == pytest.approx(handshake)
+
+
+@pytest.mark.asyncio
+async def test_prewarm_saving_is_dropped_when_connection_is_not_reused() -> None:
+    registry = HTTPPoolRegistry()
+    async with _server() as server_url:
+        assert await registry.prewarm(server_url)
+        await registry.aclose()
+        await _get(registry, server_url)
+        await registry.aclose()
+
+    assert registry.total_stats().prewarm_time_saved == 0.0
+
+
+@pytest.mark.asyncio
+async def test_prewarm_is_not_counted_as_request() -> None:
+    registry = HTTPPoolRegistry()
+    async with _server() as server_url:
+        await registry.prewarm(server_url)
+        await registry.prewarm(server_url)
+        await registry.aclose()
+
+    assert registry.total_stats() == HTTPPoolStats(connections_opened=1)
+
+
+@pytest.mark.asyncio
+async def test_prewarm_failure_is_reported_not_raised() -> None:
+    server = await asyncio.start_server(_serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    server.close()
+    await server.wait_closed()
+
+    registry = HTTPPoolRegistry()
+    assert await registry.prewarm(f"http://127.0.0.1:{port}") is None
+
+
+@pytest.mark.asyncio
+async def test_stats_are_kept_per_origin() -> None:
+    registry = HTTPPoolRegistry()
+    async with _server() as server_url:
+        await _get(registry, server_url)
+        await registry.aclose()
+
+    assert list(registry.stats()) == [server_url]
+
+
+@pytest.mark.asyncio
+async def test_reconfigure_drops_existing_pools() -> None:
+    registry = HTTPPoolRegistry()
+    async with _server() as server_url:
+        await _get(registry, server_url)
+        registry.configure(HTTPPoolSettings())
+        await _get(registry, server_url)
+        registry.configure(HTTPPoolSettings(max_connections=5))
+        await _get(registry, server_url)
+        await registry.aclose()
+
+    stats = registry.total_stats()
+    assert stats.connections_opened == 2
+    assert stats.connections_reused == 1
+
+
+@pytest.mark.asyncio
+async def test_reconfigure_closes_replaced_pools() -> None:
+    registry = HTTPPoolRegistry()
+    async with _server() as server_url:
+        await _get(registry, server_url)
+        (replaced,) = registry._pools[asyncio.get_running_loop()].values()
+        registry.configure(HTTPPoolSettings(max_connections=5))
+        await asyncio.sleep(0)
+        await asyncio.gather(*registry._closing)
+        await registry.aclose()
+
+    assert isinstance(replaced.transport, httpx.AsyncHTTPTransport)
+    assert replaced.transport._pool.connections == []
+
+
+@pytest.mark.asyncio
+async def test_reconfigure_keeps_streaming_response_open() -> None:
+    registry = HTTPPoolRegistry()
+    async with _server() as server_url:
+        async with VibeAsyncHTTPClient(transport=registry.transport()) as client:
+            async with client.stream("GET", server_url) as response:
+                registry.configure(HTTPPoolSettings(max_connections=5))
+                await asyncio.sleep(0)
+                assert await response.aread() == b"ok"
+        await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_idle_origins_are_evicted(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("vibe.core.utils.http.IDLE_ORIGIN_TTL", 0.0)
+    registry = HTTPPoolRegistry(HTTPPoolSettings(keepalive_expiry=0.0))
+    async with _server() as first_url, _server() as second_url:
+        await _get(registry, first_url)
+        await _get(registry, second_url)
+        await _get(registry, second_url)
+        pools = registry._pools[asyncio.get_running_loop()]
+        assert [origin for origin, _ in pools] == [second_url]
+        await registry.aclose()
+
+    assert list(registry.stats()) == [second_url]
+    assert registry.total_stats().requests == 3
+
+
+@pytest.mark.asyncio
+async def test_http2_without_h2_falls_back_to_http1(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+    registry = HTTPPoolRegistry(HTTPPoolSettings(http2=True))
+    async with _server() as server_url:
+        assert await _get(registry, server_url) == "ok"
+        await registry.aclose()
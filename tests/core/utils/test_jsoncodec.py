@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+import importlib.util
+import json
+import math
+
+import pytest
+
+from vibe.core.utils import jsoncodec
+
+_CODECS = [
+    pytest.param(
+        name,
+        marks=pytest.mark.skipif(
+            name != "json" and importlib.util.find_spec(name) is None,
+            reason=f"{name} not installed",
+        ),
+    )
+    for name in ("json", "orjson", "msgspec")
+]
+
+
+@pytest.fixture(params=_CODECS)
+def codec(request: pytest.FixtureRequest) -> Iterator[str]:
+    previous = jsoncodec.codec_name()
+    jsoncodec.use_codec(request.param)
+    yield request.param
+    jsoncodec.use_codec(previous)
+
+
+def test_roundtrips_unicode_without_escaping(codec: str) -> None:
+    payload = {"content": "café   日本", "n": [1, 2.5, None, True]}
+
+    encoded = jsoncodec.dumpb(payload)
+
+    assert "café".encode() in encoded
+    assert jsoncodec.loads(encoded) == payload
+    assert jsoncodec.loads(jsoncodec.dumps(payload)) == payload
+
+
+def test_indent_output_is_valid_json(codec: str) -> None:
+    text = jsoncodec.dumps({"a": {"b": 1}}, indent=True)
+
+    assert "\n" in text
+    assert json.loads(text) == {"a": {"b": 1}}
+
+
+def test_invalid_input_raises_stdlib_decode_error(codec: str) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        jsoncodec.loads('{"a": ')
+
+
+def test_loads_accepts_bytearray(codec: str) -> None:
+    assert jsoncodec.loads(bytearray(b'{"a": 1}')) == {"a": 1}
+
+
+def test_use_codec_rejects_missing_codec(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(jsoncodec, "_is_available", lambda name: name == "json")
+
+    with pytest.raises(ValueError, match="not installed"):
+        jsoncodec.use_codec("orjson")
+
+
+def test_env_var_selects_codec(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("VIBE_JSON_CODEC", "json")
+
+    assert jsoncodec._select_codec().name == "json"
+
+
+def test_fast_codec_defers_to_stdlib_on_edge_cases() -> None:
+    def dumpb(obj: object, indent: bool) -> bytes:
+        raise OverflowError("Integer exceeds 64-bit range")
+
+    def loads(data: str | bytes) -> object:
+        raise json.JSONDecodeError("unexpected character", str(data), 0)
+
+    codec = jsoncodec._with_stdlib_fallback(jsoncodec._Codec("orjson", dumpb, loads))
+
+    assert codec.dumpb({"n": 2**70}, False) == b'{"n": 1180591620717411303424}'
+    assert math.isnan(codec.loads('{"x": NaN}')["x"])
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads('{"a": ')
@@ -5,7 +5,12 @@ from collections.abc import AsyncIterator
 import httpx
 import pytest
 
-from vibe.core.utils.sse import iter_sse_lines
+from vibe.core.utils.sse import (
+    SSEEvent,
+    SSELineDecoder,
+    iter_sse_events,
+    iter_sse_lines,
+)
 
 
 class _ChunkedStream(httpx.AsyncByteStream):
@@ -73,3 +78,65 @@ class TestIterSseLines:
     async def test_replaces_undecodable_bytes(self) -> None:
         lines = await _collect([b"data: a\xff b\n"])
         assert lines == ["data: a� b"]
+
+
+async def _collect_events(
+    chunks: list[bytes], *, strict: bool = False
+) -> list[SSEEvent]:
+    response = httpx.Response(
+        status_code=200,
+        stream=_ChunkedStream(chunks),
+        request=httpx.Request("POST", "https://example.com"),
+    )
+    return [event async for event in iter_sse_events(response, strict=strict)]
+
+
+class TestSSELineDecoder:
+    def test_holds_partial_line_until_delimiter(self) -> None:
+        decoder = SSELineDecoder()
+        assert decoder.feed(b"data: ") == []
+        assert decoder.feed(b"x" * 1000) == []
+        assert decoder.feed(b"y\nda") == [b"data: " + b"x" * 1000 + b"y"]
+        assert decoder.flush() == b"da"
+        assert decoder.flush() is None
+
+    def test_single_byte_feeds(self) -> None:
+        decoder = SSELineDecoder()
+        lines: list[bytes] = []
+        for byte in b"a\r\nb\rc\n":
+            lines.extend(decoder.feed(bytes([byte])))
+        assert lines == [b"a", b"b", b"c"]
+
+
+class TestIterSseEvents:
+    @pytest.mark.asyncio
+    async def test_joins_multiline_data_and_keeps_fields(self) -> None:
+        events = await _collect_events([
+            b'event: delta\nid: 7\ndata: {"a":\ndata: 1}\n\n'
+        ])
+        assert events == [SSEEvent(data='{"a":\n1}', event="delta", id="7")]
+
+    @pytest.mark.asyncio
+    async def test_skips_comments_and_events_without_data(self) -> None:
+        events = await _collect_events([b": keep-alive\n\nevent: ping\n\ndata: a\n\n"])
+        assert events == [SSEEvent(data="a")]
+
+    @pytest.mark.asyncio
+    async def test_value_without_leading_space(self) -> None:
+        events = await _collect_events([b"data:a\ndata\n\n"])
+        assert events == [SSEEvent(data="a\n")]
+
+    @pytest.mark.asyncio
+    async def test_id_persists_across_events(self) -> None:
+        events = await _collect_events([b"id: 1\ndata: a\n\ndata: b\n\n"])
+        assert [e.id for e in events] == ["1", "1"]
+
+    @pytest.mark.asyncio
+    async def test_dispatches_unterminated_final_event(self) -> None:
+        events = await _collect_events([b"data: a\n\ndata: b"])
+        assert [e.data for e in events] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_strict_rejects_line_without_separator(self) -> None:
+        with pytest.raises(ValueError, match="improperly formatted"):
+            await _collect_events([b"data: a\n{}\n\n"], strict=True)
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from vibe.core.utils.tokens import approx_token_count, truncate_middle_to_tokens
+import pytest
+
+from vibe.core.utils import tokens
+from vibe.core.utils.tokens import (
+    CharRatioEstimator,
+    approx_token_count,
+    register_token_estimator,
+    token_estimator_for,
+    truncate_middle_to_tokens,
+)
 
 _MARKER = "\n\n[... truncated ...]\n\n"
 
@@ -48,3 +57,24 @@ def test_truncate_middle_tight_budget_falls_back_to_head_cut() -> None:
     assert _MARKER not in out
     assert out == "abcdefgh"
     assert len(out) == 8
+
+
+def test_char_ratio_estimator_charges_non_ascii_bytes() -> None:
+    estimator = CharRatioEstimator(chars_per_token=4)
+
+    assert estimator.count("") == 0
+    assert estimator.count("a" * 8) == 2
+    # 4 chars / 4 + 8 continuation bytes / 2
+    assert estimator.count("日本語字") == 5
+
+
+def test_token_estimator_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tokens, "_ESTIMATORS", dict(tokens._ESTIMATORS))
+    exact = CharRatioEstimator(chars_per_token=1)
+
+    register_token_estimator("custom", exact)
+
+    assert token_estimator_for("custom") is exact
+    assert token_estimator_for("unknown") is token_estimator_for(
+        tokens.DEFAULT_TOKEN_FAMILY
+    )
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from collections.abc import Callable
 import io
-import json
 import os
 from pathlib import Path
 import re
@@ -21,7 +20,7 @@ from tests.e2e.common import (
     wait_for_request_count,
 )
 from tests.e2e.mock_server import StreamingMockServer
-from vibe.core.utils.io import read_safe
+from vibe.core.session.session_store import read_metadata
 
 
 def _usage_by_run_factory(
@@ -55,8 +54,8 @@ def _saved_session_has_usage(
 
     for metadata_path in session_log_dir.glob("session_*/meta.json"):
         try:
-            metadata = json.loads(read_safe(metadata_path).text)
-        except (OSError, json.JSONDecodeError):
+            metadata = read_metadata(metadata_path.parent)
+        except (OSError, ValueError):
             continue
 
         stats = metadata.get("stats", {})
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from vibe.core.session import durability
+from vibe.core.session.durability import DurabilityPolicy
+from vibe.core.session.session_store import append_journal, write_metadata
+
+
+@pytest.fixture
+def fsynced(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls: list[int] = []
+    monkeypatch.setattr(durability.os, "fsync", calls.append)
+    return calls
+
+
+@pytest.fixture
+def policy(monkeypatch: pytest.MonkeyPatch) -> Iterator[DurabilityPolicy]:
+    policy = DurabilityPolicy()
+    # Exit hooks are process-wide; keep them out of the test process.
+    monkeypatch.setattr(policy, "_install_exit_hooks", lambda: None)
+    monkeypatch.setattr(durability, "session_durability", policy)
+    monkeypatch.setattr("vibe.core.session.session_store.session_durability", policy)
+    yield policy
+    policy.configure("always")
+
+
+def test_always_fsyncs_every_append(
+    tmp_path: Path, policy: DurabilityPolicy, fsynced: list[int]
+) -> None:
+    append_journal(tmp_path, {"title": "A"})
+    append_journal(tmp_path, {"title": "B"})
+
+    assert len(fsynced) == 2
+
+
+def test_os_mode_never_fsyncs(
+    tmp_path: Path, policy: DurabilityPolicy, fsynced: list[int]
+) -> None:
+    policy.configure("os")
+
+    write_metadata({"title": "A"}, tmp_path)
+    append_journal(tmp_path, {"title": "B"})
+
+    assert fsynced == []
+
+
+def test_batched_mode_defers_appends_until_flush(
+    tmp_path: Path, policy: DurabilityPolicy, fsynced: list[int]
+) -> None:
+    policy.configure("batched", interval=3600.0, max_commits=100)
+
+    write_metadata({"title": "A"}, tmp_path)
+    assert len(fsynced) == 1
+    append_journal(tmp_path, {"title": "B"})
+    append_journal(tmp_path, {"title": "C"})
+    assert len(fsynced) == 1
+
+    policy.flush()
+    # Both appends went to the same file: one group commit.
+    assert len(fsynced) == 2
+    policy.flush()
+    assert len(fsynced) == 2
+
+
+def test_batched_writer_commits_after_max_appends(
+    tmp_path: Path, policy: DurabilityPolicy, fsynced: list[int]
+) -> None:
+    policy.configure("batched", interval=3600.0, max_commits=2)
+    writer = policy._writer
+    assert writer is not None
+
+    append_journal(tmp_path, {"title": "A"})
+    append_journal(tmp_path, {"title": "B"})
+    policy.configure("always")
+    writer.join(timeout=5)
+
+    assert not writer.is_alive()
+    assert len(fsynced) == 1
+    assert not policy._pending
@@ -11,6 +11,7 @@ from vibe.core.session.saved_sessions import (
     delete_saved_session,
     update_saved_session_title,
 )
+from vibe.core.session.session_store import read_metadata
 
 
 @pytest.fixture
@@ -87,7 +88,7 @@ class TestUpdateSavedSessionTitle:
             "title": "Renamed session",
             "title_source": "manual",
         }
-        assert json.loads(metadata_file.read_text(encoding="utf-8")) == updated_metadata
+        assert read_metadata(saved_session_dir) == updated_metadata
 
     @pytest.mark.asyncio
     async def test_rejects_empty_title(
@@ -153,7 +154,7 @@ class TestUpdateSavedSessionTitle:
             "title": "Renamed session",
             "title_source": "manual",
         }
-        assert json.loads(metadata_file.read_text(encoding="utf-8")) == updated_metadata
+        assert read_metadata(saved_session_dir) == updated_metadata
 
     @pytest.mark.asyncio
     async def test_raises_for_missing_saved_session(
@@ -208,9 +209,7 @@ class TestUpdateSavedSessionTitle:
         with pytest.raises(ValueError, match="Session not found: dddddddd"):
             await update_saved_session_title("dddddddd", "Renamed", session_config)
 
-        assert (
-            json.loads(metadata_file.read_text(encoding="utf-8")) == original_metadata
-        )
+        assert read_metadata(saved_session_dir) == original_metadata
 
 
 class TestDeleteSavedSession:
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import shutil
+
+import pytest
+
+from vibe.core.config import SessionLoggingConfig
+from vibe.core.session import session_catalog
+from vibe.core.session.saved_sessions import (
+    delete_saved_session,
+    update_saved_session_title,
+)
+from vibe.core.session.session_catalog import (
+    CATALOG_FILENAME,
+    read_catalog,
+    record_entry,
+)
+from vibe.core.session.session_loader import SessionLoader
+
+
+@pytest.fixture
+def session_config(tmp_path: Path) -> SessionLoggingConfig:
+    return SessionLoggingConfig(
+        save_dir=str(tmp_path), session_prefix="test", enabled=True
+    )
+
+
+def _create_session(
+    save_dir: Path, session_id: str, *, cwd: str = "/project", title: str = "T"
+) -> Path:
+    session_dir = save_dir / f"test_20240101_120000_{session_id[:8]}"
+    session_dir.mkdir()
+    (session_dir / "messages.jsonl").write_text(
+        json.dumps({"role": "user", "content": "hi"}) + "\n"
+    )
+    (session_dir / "meta.json").write_text(
+        json.dumps({
+            "session_id": session_id,
+            "title": title,
+            "end_time": "2024-01-01T12:00:00+00:00",
+            "total_messages": 1,
+            "environment": {"working_directory": cwd},
+        })
+    )
+    return session_dir
+
+
+def _catalog_lines(save_dir: Path) -> list[str]:
+    return (save_dir / CATALOG_FILENAME).read_text().splitlines()
+
+
+def test_catalog_is_built_once_and_then_read(
+    session_config: SessionLoggingConfig, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    save_dir = Path(session_config.save_dir)
+    _create_session(save_dir, "aaaaaaaa-1", cwd="/a")
+    _create_session(save_dir, "bbbbbbbb-2", cwd="/b")
+
+    assert [s["session_id"] for s in SessionLoader.list_sessions(session_config)]
+    monkeypatch.setattr(
+        SessionLoader,
+        "_read_validated_session",
+        staticmethod(lambda *args: pytest.fail("indexed session was re-read")),
+    )
+
+    sessions = SessionLoader.list_sessions(session_config, cwd="/b")
+
+    assert [s["session_id"] for s in sessions] == ["bbbbbbbb-2"]
+    assert sessions[0]["title"] == "T"
+
+
+def test_new_and_removed_sessions_are_reconciled(
+    session_config: SessionLoggingConfig,
+) -> None:
+    save_dir = Path(session_config.save_dir)
+    first = _create_session(save_dir, "aaaaaaaa-1")
+    SessionLoader.list_sessions(session_config)
+
+    shutil.rmtree(first)
+    _create_session(save_dir, "bbbbbbbb-2")
+
+    assert [s["session_id"] for s in SessionLoader.list_sessions(session_config)] == [
+        "bbbbbbbb-2"
+    ]
+    entries, _ = read_catalog(save_dir) or ({}, 0)
+    assert [entry["session_id"] for entry in entries.values()] == ["bbbbbbbb-2"]
+
+
+def test_appended_records_update_entries(session_config: SessionLoggingConfig) -> None:
+    save_dir = Path(session_config.save_dir)
+    session_dir = _create_session(save_dir, "aaaaaaaa-1")
+    SessionLoader.list_sessions(session_config)
+
+    record_entry(
+        session_dir,
+        {
+            "session_id": "aaaaaaaa-1",
+            "cwd": "/project",
+            "title": "Renamed",
+            "end_time": "2024-01-02T12:00:00+00:00",
+            "total_messages": 4,
+        },
+    )
+    with (save_dir / CATALOG_FILENAME).open("a") as f:
+        f.write('{"dir": "test_torn"')
+
+    (session,) = SessionLoader.list_sessions(session_config)
+    assert session["title"] == "Renamed"
+    assert session["end_time"] == "2024-01-02T12:00:00+00:00"
+
+
+def test_catalog_is_compacted(
+    session_config: SessionLoggingConfig, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(session_catalog, "CATALOG_COMPACT_SLACK", 2)
+    save_dir = Path(session_config.save_dir)
+    session_dir = _create_session(save_dir, "aaaaaaaa-1")
+    SessionLoader.list_sessions(session_config)
+    entries, _ = read_catalog(save_dir) or ({}, 0)
+    for _ in range(3):
+        record_entry(session_dir, entries[session_dir.name])
+    assert len(_catalog_lines(save_dir)) == 4
+
+    SessionLoader.list_sessions(session_config)
+
+    assert len(_catalog_lines(save_dir)) == 1
+
+
+def test_find_latest_session_uses_catalog_cwd(
+    session_config: SessionLoggingConfig,
+) -> None:
+    save_dir = Path(session_config.save_dir)
+    _create_session(save_dir, "aaaaaaaa-1", cwd=str(save_dir))
+    other = _create_session(save_dir, "bbbbbbbb-2", cwd="/elsewhere")
+
+    assert SessionLoader.find_latest_session(session_config, save_dir) is not None
+    assert SessionLoader.find_latest_session(session_config) is not None
+    assert (
+        SessionLoader.find_latest_session(session_config, Path("/elsewhere")) == other
+    )
+
+
+@pytest.mark.asyncio
+async def test_saved_session_changes_update_catalog(
+    session_config: SessionLoggingConfig,
+) -> None:
+    save_dir = Path(session_config.save_dir)
+    _create_session(save_dir, "aaaaaaaa-1")
+    _create_session(save_dir, "bbbbbbbb-2")
+    SessionLoader.list_sessions(session_config)
+
+    await update_saved_session_title("aaaaaaaa-1", "New title", session_config)
+    await delete_saved_session("bbbbbbbb-2", session_config)
+
+    entries, _ = read_catalog(save_dir) or ({}, 0)
+    assert [(e["session_id"], e["title"]) for e in entries.values()] == [
+        ("aaaaaaaa-1", "New title")
+    ]
@@ -9,6 +9,7 @@ import pytest
 
 from vibe.core.config import SessionLoggingConfig
 from vibe.core.session.session_loader import SessionLoader
+from vibe.core.session.session_store import MESSAGES_INDEX_FILENAME
 from vibe.core.types import LLMMessage, Role, SessionMetadata, ToolCall
 from vibe.core.utils.io import read_safe
 
@@ -698,6 +699,67 @@ class TestSessionLoaderLoadSession:
             SessionLoader.load_session(nonexistent_dir)
 
 
+class TestSessionLoaderIterMessages:
+    @staticmethod
+    def _messages(count: int) -> list[LLMMessage]:
+        return [LLMMessage(role=Role.system, content="System prompt")] + [
+            LLMMessage(role=Role.user, content=f"m{i}") for i in range(count)
+        ]
+
+    def test_chunks_from_start(
+        self, session_config: SessionLoggingConfig, create_test_session
+    ) -> None:
+        session_folder = create_test_session(
+            Path(session_config.save_dir), "iter-start", messages=self._messages(5)
+        )
+
+        chunks = list(SessionLoader.iter_messages(session_folder, chunk_size=3))
+
+        # The system prompt shares the first chunk's lines.
+        assert [[m.content for m in chunk] for chunk in chunks] == [
+            ["m0", "m1"],
+            ["m2", "m3", "m4"],
+        ]
+
+    def test_chunks_from_end_use_index(
+        self, session_config: SessionLoggingConfig, create_test_session
+    ) -> None:
+        session_folder = create_test_session(
+            Path(session_config.save_dir), "iter-end", messages=self._messages(5)
+        )
+
+        chunks = list(
+            SessionLoader.iter_messages(session_folder, chunk_size=2, from_end=True)
+        )
+
+        assert [[m.content for m in chunk] for chunk in chunks] == [
+            ["m3", "m4"],
+            ["m1", "m2"],
+            ["m0"],
+        ]
+        assert (session_folder / MESSAGES_INDEX_FILENAME).is_file()
+
+    def test_first_user_message_reads_only_first_chunk(
+        self,
+        session_config: SessionLoggingConfig,
+        create_test_session,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        session_folder = create_test_session(
+            Path(session_config.save_dir), "preview", messages=self._messages(40)
+        )
+        # A corrupt line past the first chunk is never parsed.
+        with (session_folder / "messages.jsonl").open("a") as f:
+            f.write("{invalid json}\n")
+        monkeypatch.setattr(
+            SessionLoader,
+            "find_session_by_id",
+            staticmethod(lambda *args, **kwargs: session_folder),
+        )
+
+        assert SessionLoader.get_first_user_message("preview", session_config) == "m0"
+
+
 class TestSessionLoaderEdgeCases:
     def test_find_latest_session_with_different_prefixes(
         self, session_config: SessionLoggingConfig
@@ -4,6 +4,7 @@ from datetime import UTC, datetime, timedelta
 import json
 import os
 from pathlib import Path
+import shutil
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -15,6 +16,7 @@ from vibe.core.experiments.models import EvalResponse
 from vibe.core.loop import ScheduledLoop
 from vibe.core.session.session_loader import SessionLoader
 from vibe.core.session.session_logger import SessionLogger
+from vibe.core.session.session_store import read_journal, read_metadata
 from vibe.core.tools.manager import ToolManager
 from vibe.core.types import AgentStats, LLMMessage, Role, SessionMetadata
 
@@ -348,15 +350,14 @@ class TestSessionLoggerSaveInteraction:
         assert messages_file.exists()
         assert metadata_file.exists()
 
-        with open(metadata_file) as f:
-            metadata = json.load(f)
-            assert metadata["session_id"] == session_id
-            assert metadata["total_messages"] == 2
-            assert metadata["stats"]["steps"] == stats.steps
-            assert "title" in metadata
-            assert metadata["title"] == "Hello"
-            assert metadata["title_source"] == "auto"
-            assert "system_prompt" in metadata
+        metadata = read_metadata(logger.session_dir)
+        assert metadata["session_id"] == session_id
+        assert metadata["total_messages"] == 2
+        assert metadata["stats"]["steps"] == stats.steps
+        assert "title" in metadata
+        assert metadata["title"] == "Hello"
+        assert metadata["title_source"] == "auto"
+        assert "system_prompt" in metadata
 
     @pytest.mark.asyncio
     async def test_save_interaction_system_prompt_in_metadata(
@@ -391,11 +392,10 @@ class TestSessionLoggerSaveInteraction:
         assert logger.session_dir is not None
         metadata_file = logger.session_dir / "meta.json"
         assert metadata_file.exists()
-        with open(metadata_file) as f:
-            metadata = json.load(f)
-            assert "system_prompt" in metadata
-            assert metadata["system_prompt"]["content"] == "System prompt"
-            assert metadata["system_prompt"]["role"] == "system"
+        metadata = read_metadata(logger.session_dir)
+        assert "system_prompt" in metadata
+        assert metadata["system_prompt"]["content"] == "System prompt"
+        assert metadata["system_prompt"]["role"] == "system"
 
         messages_file = logger.session_dir / "messages.jsonl"
         assert messages_file.exists()
@@ -461,10 +461,9 @@ class TestSessionLoggerSaveInteraction:
         assert logger.session_dir is not None
         metadata_file = logger.session_dir / "meta.json"
         assert metadata_file.exists()
-        with open(metadata_file) as f:
-            metadata = json.load(f)
-            assert metadata["total_messages"] == 4
-            assert metadata["stats"]["steps"] == updated_stats.steps
+        metadata = read_metadata(logger.session_dir)
+        assert metadata["total_messages"] == 4
+        assert metadata["stats"]["steps"] == updated_stats.steps
 
         messages_file = logger.session_dir / "messages.jsonl"
         assert messages_file.exists()
@@ -502,11 +501,9 @@ class TestSessionLoggerSaveInteraction:
         )
 
         assert logger.session_dir is not None
-        metadata_file = logger.session_dir / "meta.json"
         messages_file = logger.session_dir / "messages.jsonl"
 
-        with open(metadata_file) as f:
-            meta_before = json.load(f)
+        meta_before = read_metadata(logger.session_dir)
         with open(messages_file) as f:
             lines_before = f.readlines()
 
@@ -519,8 +516,7 @@ class TestSessionLoggerSaveInteraction:
             agent_profile=mock_agent_profile,
         )
 
-        with open(metadata_file) as f:
-            meta_after = json.load(f)
+        meta_after = read_metadata(logger.session_dir)
         with open(messages_file) as f:
             lines_after = f.readlines()
 
@@ -563,13 +559,12 @@ class TestSessionLoggerSaveInteraction:
         assert logger.session_dir is not None
         metadata_file = logger.session_dir / "meta.json"
         assert metadata_file.exists()
-        with open(metadata_file) as f:
-            metadata = json.load(f)
-            assert metadata["session_id"] == session_id
-            assert metadata["total_messages"] == 1
-            assert metadata["stats"]["steps"] == stats.steps
-            assert metadata["title"] == "Untitled session"
-            assert metadata["title_source"] == "auto"
+        metadata = read_metadata(logger.session_dir)
+        assert metadata["session_id"] == session_id
+        assert metadata["total_messages"] == 1
+        assert metadata["stats"]["steps"] == stats.steps
+        assert metadata["title"] == "Untitled session"
+        assert metadata["title_source"] == "auto"
 
         messages_file = logger.session_dir / "messages.jsonl"
         assert messages_file.exists()
@@ -612,14 +607,13 @@ class TestSessionLoggerSaveInteraction:
         assert logger.session_dir is not None
         metadata_file = logger.session_dir / "meta.json"
         assert metadata_file.exists()
-        with open(metadata_file) as f:
-            metadata = json.load(f)
-            assert metadata["session_id"] == session_id
-            assert metadata["total_messages"] == 2
-            assert metadata["stats"]["steps"] == stats.steps
-            expected_title = long_message[:50] + "…"
-            assert metadata["title"] == expected_title
-            assert metadata["title_source"] == "auto"
+        metadata = read_metadata(logger.session_dir)
+        assert metadata["session_id"] == session_id
+        assert metadata["total_messages"] == 2
+        assert metadata["stats"]["steps"] == stats.steps
+        expected_title = long_message[:50] + "…"
+        assert metadata["title"] == expected_title
+        assert metadata["title_source"] == "auto"
 
     @pytest.mark.asyncio
     async def test_save_interaction_preserves_preset_auto_title(
@@ -655,9 +649,7 @@ class TestSessionLoggerSaveInteraction:
         )
 
         assert logger.session_dir is not None
-        metadata_file = logger.session_dir / "meta.json"
-        with open(metadata_file) as f:
-            metadata = json.load(f)
+        metadata = read_metadata(logger.session_dir)
 
         assert metadata["title"] == "Pretty @foo.py title"
         assert metadata["title_source"] == "auto"
@@ -694,9 +686,7 @@ class TestSessionLoggerSaveInteraction:
         )
 
         assert logger.session_dir is not None
-        metadata_file = logger.session_dir / "meta.json"
-        with open(metadata_file) as f:
-            metadata = json.load(f)
+        metadata = read_metadata(logger.session_dir)
 
         assert metadata["title"] == "Manual title"
         assert metadata["title_source"] == "manual"
@@ -730,6 +720,7 @@ class TestSessionLoggerSaveInteraction:
             patch.object(
                 SessionLogger, "_persist_metadata_sync"
             ) as persist_metadata_mock,
+            patch.object(SessionLogger, "_append_record") as append_record_mock,
             patch.object(logger, "cleanup_tmp_files", cleanup_spy),
             patch(
                 "vibe.core.session.session_logger.utc_now",
@@ -750,7 +741,7 @@ class TestSessionLoggerSaveInteraction:
                 agent_profile=mock_agent_profile,
             )
             await logger.save_interaction(
-                messages=messages,
+                messages=[*messages, LLMMessage(role=Role.user, content="Again")],
                 stats=AgentStats(steps=2),
                 base_config=mock_vibe_config,
                 tool_manager=mock_tool_manager,
@@ -758,7 +749,8 @@ class TestSessionLoggerSaveInteraction:
             )
 
         assert persist_messages_mock.call_count == 2
-        assert persist_metadata_mock.call_count == 2
+        assert persist_metadata_mock.call_count == 1
+        assert append_record_mock.call_count == 1
         assert cleanup_spy.call_count == 1
 
     @pytest.mark.asyncio
@@ -798,8 +790,7 @@ class TestSessionLoggerSaveInteraction:
         with open(logger.session_dir / "messages.jsonl") as f:
             lines = [json.loads(line) for line in f]
         assert [m["content"] for m in lines] == ["A", "response A"]
-        with open(logger.session_dir / "meta.json") as f:
-            assert json.load(f)["total_messages"] == 2
+        assert read_metadata(logger.session_dir)["total_messages"] == 2
 
     @pytest.mark.asyncio
     async def test_save_interaction_replaces_tail_after_shrink_and_regrow(
@@ -962,10 +953,14 @@ class TestSessionLoggerSaveInteraction:
             LLMMessage(role=Role.assistant, content="response A"),
         ])
 
-        # Simulate a session written before fingerprints existed.
-        metadata = json.loads(logger.metadata_filepath.read_text(encoding="utf-8"))
+        # Simulate a (v1) session written before fingerprints existed.
+        assert logger.session_dir is not None
+        metadata = read_metadata(logger.session_dir)
         del metadata["last_message_fingerprint"]
+        del metadata["format_version"]
+        shutil.rmtree(logger.session_dir / "blobs")
         logger.metadata_filepath.write_text(json.dumps(metadata), encoding="utf-8")
+        logger.resume_existing_session(logger.session_id, logger.session_dir)
 
         # Same count, edited tail: with no fingerprint the boundary can't be
         # verified, so the log must be fully rewritten rather than no-op'd.
@@ -1023,6 +1018,69 @@ class TestSessionLoggerSaveInteraction:
         assert loaded == []
         assert metadata["total_messages"] == 0
 
+    @pytest.mark.asyncio
+    async def test_save_interaction_journals_turns_and_stores_blobs_once(
+        self,
+        session_config: SessionLoggingConfig,
+        mock_vibe_config: VibeConfigSchema,
+        mock_tool_manager: ToolManager,
+        mock_agent_profile: AgentProfile,
+    ) -> None:
+        logger = SessionLogger(session_config, "journaled-session")
+        messages = [LLMMessage(role=Role.system, content="System prompt")]
+
+        for turn in range(3):
+            messages.append(LLMMessage(role=Role.user, content=f"turn {turn}"))
+            await logger.save_interaction(
+                messages=messages,
+                stats=AgentStats(steps=turn + 1),
+                base_config=mock_vibe_config,
+                tool_manager=mock_tool_manager,
+                agent_profile=mock_agent_profile,
+            )
+
+        assert logger.session_dir is not None
+        assert len(list((logger.session_dir / "blobs").iterdir())) == 3
+        header = json.loads(logger.metadata_filepath.read_text(encoding="utf-8"))
+        assert "config" not in header
+        assert header["total_messages"] == 1
+
+        records = read_journal(logger.session_dir)
+        assert [r["total_messages"] for r in records] == [2, 3]
+        assert all("blobs" not in r and "agent_profile" not in r for r in records)
+
+        metadata = read_metadata(logger.session_dir)
+        assert metadata["stats"]["steps"] == 3
+        assert metadata["system_prompt"]["content"] == "System prompt"
+
+    @pytest.mark.asyncio
+    async def test_save_interaction_compacts_journal(
+        self,
+        session_config: SessionLoggingConfig,
+        mock_vibe_config: VibeConfigSchema,
+        mock_tool_manager: ToolManager,
+        mock_agent_profile: AgentProfile,
+    ) -> None:
+        logger = SessionLogger(session_config, "compacted-session")
+        messages: list[LLMMessage] = []
+
+        with patch("vibe.core.session.session_logger.JOURNAL_COMPACT_THRESHOLD", 2):
+            for turn in range(3):
+                messages.append(LLMMessage(role=Role.user, content=f"turn {turn}"))
+                await logger.save_interaction(
+                    messages=messages,
+                    stats=AgentStats(steps=turn + 1),
+                    base_config=mock_vibe_config,
+                    tool_manager=mock_tool_manager,
+                    agent_profile=mock_agent_profile,
+                )
+
+        assert logger.session_dir is not None
+        assert read_journal(logger.session_dir) == []
+        header = json.loads(logger.metadata_filepath.read_text(encoding="utf-8"))
+        assert header["total_messages"] == 3
+        assert header["stats"]["steps"] == 3
+
 
 class TestSessionLoggerResetSession:
     def test_reset_session(self, session_config: SessionLoggingConfig) -> None:
@@ -1283,8 +1341,7 @@ class TestPersistLoops:
         await logger.persist_loops()
 
         assert logger.session_dir is not None
-        with open(logger.session_dir / "meta.json") as f:
-            metadata = json.load(f)
+        metadata = read_metadata(logger.session_dir)
 
         assert metadata["session_id"] == "test-session-loops"
         assert metadata["total_messages"] == 2
@@ -1375,8 +1432,7 @@ class TestPersistLoops:
         )
 
         assert logger.session_dir is not None
-        with open(logger.session_dir / "meta.json") as f:
-            metadata = json.load(f)
+        metadata = read_metadata(logger.session_dir)
         assert len(metadata["loops"]) == 1
         assert metadata["loops"][0]["id"] == "aabbccdd"
 
@@ -1431,8 +1487,7 @@ class TestPersistExperiments:
         await logger.persist_experiments(sample_response)
 
         assert logger.session_dir is not None
-        with open(logger.session_dir / "meta.json") as f:
-            metadata = json.load(f)
+        metadata = read_metadata(logger.session_dir)
         assert "experiments" in metadata
         assert (
             metadata["experiments"]["features"]["vibe_code_cli_test_ab"]["defaultValue"]
@@ -1462,8 +1517,7 @@ class TestPersistExperiments:
         await logger.persist_experiments(None)
 
         assert logger.session_dir is not None
-        with open(logger.session_dir / "meta.json") as f:
-            metadata = json.load(f)
+        metadata = read_metadata(logger.session_dir)
         assert metadata.get("experiments") is None
 
     @pytest.mark.asyncio
@@ -1522,8 +1576,7 @@ class TestPersistExperiments:
             agent_profile=mock_agent_profile,
         )
 
-        with open(logger.session_dir / "meta.json") as f:
-            metadata = json.load(f)
+        metadata = read_metadata(logger.session_dir)
         assert metadata["total_messages"] == 2
         assert (
             metadata["experiments"]["features"]["vibe_code_cli_test_ab"]["defaultValue"]
@@ -6,7 +6,13 @@ from pathlib import Path
 import pytest
 
 from vibe.core.config import SessionLoggingConfig
-from vibe.core.session.session_migration import migrate_sessions
+from vibe.core.session.session_migration import migrate_session_to_v2, migrate_sessions
+from vibe.core.session.session_store import (
+    BLOBS_DIRNAME,
+    SESSION_FORMAT_VERSION,
+    append_journal,
+    read_metadata,
+)
 
 
 @pytest.fixture
@@ -100,9 +106,10 @@ class TestSessionMigration:
         metadata_file = session_subdir / "meta.json"
         assert metadata_file.is_file()
 
-        with open(metadata_file) as f:
-            metadata = json.load(f)
-            assert metadata == old_session_data["metadata"]
+        assert read_metadata(session_subdir) == {
+            **old_session_data["metadata"],
+            "format_version": SESSION_FORMAT_VERSION,
+        }
 
         messages_file = session_subdir / "messages.jsonl"
         assert messages_file.exists()
@@ -175,3 +182,75 @@ class TestSessionMigration:
         assert valid_session_subdir.exists()
         assert not valid_session_file.exists()
         assert invalid_session_file.exists()
+
+
+@pytest.fixture
+def v1_metadata() -> dict:
+    return {
+        "session_id": "v1-session",
+        "title": "Old title",
+        "total_messages": 1,
+        "config": {"active_model": "test-model"},
+        "tools_available": [{"type": "function", "function": {"name": "bash"}}],
+        "system_prompt": {"role": "system", "content": "You are helpful"},
+    }
+
+
+class TestMigrateSessionToV2:
+    def test_moves_large_values_to_blobs(
+        self, temp_session_dir: Path, v1_metadata: dict
+    ) -> None:
+        (temp_session_dir / "meta.json").write_text(json.dumps(v1_metadata))
+
+        migrated = migrate_session_to_v2(temp_session_dir)
+
+        header = json.loads((temp_session_dir / "meta.json").read_text())
+        assert header == migrated
+        assert header["format_version"] == SESSION_FORMAT_VERSION
+        assert set(header["blobs"]) == {"config", "tools_available", "system_prompt"}
+        assert "config" not in header
+        assert len(list((temp_session_dir / BLOBS_DIRNAME).iterdir())) == 3
+        assert read_metadata(temp_session_dir) == {
+            **v1_metadata,
+            "format_version": SESSION_FORMAT_VERSION,
+        }
+
+    def test_keeps_journaled_title_edits(
+        self, temp_session_dir: Path, v1_metadata: dict
+    ) -> None:
+        (temp_session_dir / "meta.json").write_text(json.dumps(v1_metadata))
+        append_journal(temp_session_dir, {"title": "Renamed"})
+
+        migrate_session_to_v2(temp_session_dir)
+
+        header = json.loads((temp_session_dir / "meta.json").read_text())
+        assert header["title"] == "Renamed"
+        assert read_metadata(temp_session_dir)["title"] == "Renamed"
+
+    def test_leaves_v2_sessions_untouched(
+        self, temp_session_dir: Path, v1_metadata: dict
+    ) -> None:
+        (temp_session_dir / "meta.json").write_text(json.dumps(v1_metadata))
+        migrate_session_to_v2(temp_session_dir)
+        header_before = (temp_session_dir / "meta.json").read_bytes()
+
+        migrate_session_to_v2(temp_session_dir)
+
+        assert (temp_session_dir / "meta.json").read_bytes() == header_before
+
+    @pytest.mark.asyncio
+    async def test_migrate_sessions_upgrades_v1_session_dirs(
+        self,
+        session_config: SessionLoggingConfig,
+        temp_session_dir: Path,
+        v1_metadata: dict,
+    ) -> None:
+        session_subdir = temp_session_dir / "test_20240101_120000_v1session"
+        session_subdir.mkdir()
+        (session_subdir / "meta.json").write_text(json.dumps(v1_metadata))
+
+        assert await migrate_sessions(session_config) == 1
+        assert await migrate_sessions(session_config) == 0
+
+        header = json.loads((session_subdir / "meta.json").read_text())
+        assert header["format_version"] == SESSION_FORMAT_VERSION
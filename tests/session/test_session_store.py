@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from vibe.core.session.session_store import (
+    BLOBS_DIRNAME,
+    MESSAGES_FILENAME,
+    MESSAGES_INDEX_FILENAME,
+    METADATA_JOURNAL_FILENAME,
+    append_journal,
+    append_message_index,
+    compact_metadata,
+    read_journal,
+    read_message_index,
+    read_metadata,
+    write_blob,
+    write_message_index,
+    write_metadata,
+)
+
+
+@pytest.fixture
+def session_dir(tmp_path: Path) -> Path:
+    session_dir = tmp_path / "session"
+    session_dir.mkdir()
+    return session_dir
+
+
+def _blob_files(session_dir: Path) -> list[Path]:
+    return sorted((session_dir / BLOBS_DIRNAME).iterdir())
+
+
+class TestBlobs:
+    def test_identical_values_are_stored_once(self, session_dir: Path) -> None:
+        first = write_blob(session_dir, {"active_model": "a"})
+        second = write_blob(session_dir, {"active_model": "a"})
+        third = write_blob(session_dir, {"active_model": "b"})
+
+        assert first == second != third
+        assert [p.stem for p in _blob_files(session_dir)] == sorted([first, third])
+
+    def test_known_digest_skips_rewrite(self, session_dir: Path) -> None:
+        digest = write_blob(session_dir, ["tool"])
+        blob_path = session_dir / BLOBS_DIRNAME / f"{digest}.json"
+        blob_path.unlink()
+
+        assert write_blob(session_dir, ["tool"], known=digest) == digest
+        assert not blob_path.exists()
+
+
+class TestJournal:
+    def test_records_fold_over_header(self, session_dir: Path) -> None:
+        config_digest = write_blob(session_dir, {"active_model": "a"})
+        write_metadata(
+            {"session_id": "s", "title": "A", "blobs": {"config": config_digest}},
+            session_dir,
+        )
+        append_journal(session_dir, {"title": "B"}, {"total_messages": 3})
+
+        assert read_metadata(session_dir) == {
+            "session_id": "s",
+            "title": "B",
+            "total_messages": 3,
+            "config": {"active_model": "a"},
+        }
+        assert read_metadata(session_dir, resolve_blobs=False)["blobs"] == {
+            "config": config_digest
+        }
+
+    def test_blob_references_merge_across_records(self, session_dir: Path) -> None:
+        config_digest = write_blob(session_dir, {"active_model": "a"})
+        prompt_digest = write_blob(session_dir, "old prompt")
+        new_prompt_digest = write_blob(session_dir, "new prompt")
+        write_metadata(
+            {"blobs": {"config": config_digest, "system_prompt": prompt_digest}},
+            session_dir,
+        )
+        append_journal(session_dir, {"blobs": {"system_prompt": new_prompt_digest}})
+
+        metadata = read_metadata(session_dir)
+
+        assert metadata["config"] == {"active_model": "a"}
+        assert metadata["system_prompt"] == "new prompt"
+
+    def test_torn_final_record_is_ignored(self, session_dir: Path) -> None:
+        write_metadata({"title": "A"}, session_dir)
+        append_journal(session_dir, {"title": "B"})
+        with (session_dir / METADATA_JOURNAL_FILENAME).open("a") as f:
+            f.write('{"title": "C"')
+
+        assert read_journal(session_dir) == [{"title": "B"}]
+        assert read_metadata(session_dir)["title"] == "B"
+
+    def test_compaction_folds_journal_into_header(self, session_dir: Path) -> None:
+        write_metadata({"title": "A", "total_messages": 1}, session_dir)
+        append_journal(session_dir, {"title": "B"}, {"total_messages": 2})
+        before = read_metadata(session_dir)
+
+        compact_metadata(session_dir)
+
+        assert not (session_dir / METADATA_JOURNAL_FILENAME).exists()
+        assert json.loads((session_dir / "meta.json").read_text()) == before
+        assert read_metadata(session_dir) == before
+
+
+class TestMessageIndex:
+    def test_appends_extend_index(self, session_dir: Path) -> None:
+        (session_dir / MESSAGES_FILENAME).write_bytes(b"a\nbb\nccc\n")
+        write_message_index(session_dir, [2, 5])
+        append_message_index(session_dir, 5, [9])
+
+        assert read_message_index(session_dir) == [2, 5, 9]
+
+    def test_append_at_wrong_offset_is_skipped(self, session_dir: Path) -> None:
+        write_message_index(session_dir, [2])
+        append_message_index(session_dir, 5, [9])
+
+        assert (session_dir / MESSAGES_INDEX_FILENAME).stat().st_size == 8
+
+    def test_stale_index_is_rebuilt(self, session_dir: Path) -> None:
+        (session_dir / MESSAGES_FILENAME).write_bytes(b"a\nbb\nccc")
+        write_message_index(session_dir, [2])
+
+        assert read_message_index(session_dir) == [2, 5, 8]
+        # The rebuilt index was written back.
+        assert (session_dir / MESSAGES_INDEX_FILENAME).stat().st_size == 24
@@ -9,6 +9,7 @@ from vibe.core.middleware import (
     CHAT_AGENT_EXIT,
     CHAT_AGENT_REMINDER,
     PLAN_AGENT_EXIT,
+    AutoCompactMiddleware,
     ConversationContext,
     MiddlewareAction,
     MiddlewarePipeline,
@@ -638,3 +639,80 @@ class TestTokenLimitMiddleware:
 
         assert result.action == MiddlewareAction.CONTINUE
         assert result.reason is None
+
+
+class TestAutoCompactMiddleware:
+    @pytest.mark.asyncio
+    async def test_speculates_between_watermark_and_threshold(
+        self, ctx: ConversationContext
+    ) -> None:
+        calls: list[int] = []
+        middleware = AutoCompactMiddleware(
+            speculate=lambda: calls.append(ctx.stats.context_tokens)
+        )
+        threshold = ctx.config.get_active_model().auto_compact_threshold
+        watermark = ctx.config.speculative_compaction_watermark
+
+        ctx.stats.context_tokens = int(threshold * watermark) - 1
+        assert (await middleware.before_turn(ctx)).action == MiddlewareAction.CONTINUE
+        ctx.stats.context_tokens = int(threshold * watermark) + 1
+        assert (await middleware.before_turn(ctx)).action == MiddlewareAction.CONTINUE
+        ctx.stats.context_tokens = threshold
+        assert (await middleware.before_turn(ctx)).action == MiddlewareAction.COMPACT
+
+        assert calls == [int(threshold * watermark) + 1]
+
+    @pytest.mark.asyncio
+    async def test_zero_watermark_disables_speculation(
+        self, ctx: ConversationContext
+    ) -> None:
+        middleware = AutoCompactMiddleware(
+            speculate=lambda: pytest.fail("speculated with watermark 0")
+        )
+        ctx.config = ctx.config.model_copy(
+            update={"speculative_compaction_watermark": 0.0}
+        )
+        ctx.stats.context_tokens = (
+            ctx.config.get_active_model().auto_compact_threshold - 1
+        )
+
+        assert (await middleware.before_turn(ctx)).action == MiddlewareAction.CONTINUE
+
+    @pytest.mark.asyncio
+    async def test_prunes_below_speculative_watermark(
+        self, ctx: ConversationContext
+    ) -> None:
+        pruned: list[int] = []
+        speculated: list[int] = []
+        middleware = AutoCompactMiddleware(
+            speculate=lambda: speculated.append(ctx.stats.context_tokens),
+            prune=lambda: pruned.append(ctx.stats.context_tokens) or 0,
+        )
+        threshold = ctx.config.get_active_model().auto_compact_threshold
+        ctx.config = ctx.config.model_copy(
+            update={
+                "tool_result_prune_watermark": 0.5,
+                "speculative_compaction_watermark": 0.7,
+            }
+        )
+
+        for tokens in (threshold // 4, threshold // 2, int(threshold * 0.8)):
+            ctx.stats.context_tokens = tokens
+            await middleware.before_turn(ctx)
+
+        assert pruned == [threshold // 2]
+        assert speculated == [int(threshold * 0.8)]
+
+    @pytest.mark.asyncio
+    async def test_projected_tokens_take_precedence_over_last_usage(
+        self, ctx: ConversationContext
+    ) -> None:
+        middleware = AutoCompactMiddleware()
+        threshold = ctx.config.get_active_model().auto_compact_threshold
+        ctx.stats.context_tokens = threshold // 4
+
+        ctx.projected_tokens = threshold
+        assert (await middleware.before_turn(ctx)).action == MiddlewareAction.COMPACT
+        ctx.stats.context_tokens = threshold
+        ctx.projected_tokens = threshold // 4
+        assert (await middleware.before_turn(ctx)).action == MiddlewareAction.CONTINUE
@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
 import shutil
+import sys
 
 import pytest
 
 from tests.mock.utils import collect_result
-from vibe.core.tools.base import BaseToolState, ToolError
-from vibe.core.tools.builtins.grep import Grep, GrepArgs, GrepBackend, GrepToolConfig
+from vibe.core.tools.base import BaseToolState, InvokeContext, ToolError
+from vibe.core.tools.builtins import grep as grep_module
+from vibe.core.tools.builtins.grep import (
+    Grep,
+    GrepArgs,
+    GrepBackend,
+    GrepToolConfig,
+    _MatchCollector,
+)
+from vibe.core.types import ToolStreamEvent
 from vibe.core.utils import io as io_utils
 
 
@@ -238,6 +250,86 @@ async def test_single_file_match_includes_filename_in_output(grep, tmp_path):
         assert parsed.line is not None
 
 
+def _rg_event(kind: str, **data: object) -> bytes:
+    return json.dumps({"type": kind, "data": data}).encode() + b"\n"
+
+
+def test_collector_reads_rg_json_matches(tmp_path):
+    collector = _MatchCollector(10, 1_000, json_output=True)
+    windows_path = "C:\\repo\\a.py"
+    stream = b"".join([
+        _rg_event("begin", path={"text": windows_path}),
+        _rg_event(
+            "match",
+            path={"text": windows_path},
+            lines={"text": "hit: one\n"},
+            line_number=3,
+        ),
+        _rg_event(
+            "match",
+            path={"text": "b.py"},
+            lines={"bytes": base64.b64encode(b"caf\xe9\n").decode()},
+            line_number=7,
+        ),
+        _rg_event("end", path={"text": "b.py"}),
+    ])
+
+    # Split mid-line: events may straddle read chunks.
+    collector.feed(stream[:50])
+    collector.feed(stream[50:])
+    collector.finish()
+    result = collector.result()
+
+    assert result.match_count == 2
+    assert result.matches.splitlines()[0] == f"{windows_path}:3:hit: one"
+    assert [
+        (m.path.endswith(name), m.line)
+        for m, name in zip(result.parsed_matches, ("a.py", "b.py"), strict=True)
+    ] == [(True, 3), (True, 7)]
+
+
+def test_collector_stops_at_global_match_budget():
+    collector = _MatchCollector(3, 1_000, json_output=False)
+
+    collector.feed(b"".join(b"f%d.py:1:x\n" % i for i in range(10)))
+
+    assert collector.full
+    assert collector.result().match_count == 3
+    assert collector.result().was_truncated
+
+
+@pytest.mark.asyncio
+async def test_kills_search_once_budget_is_reached(grep):
+    endless = [sys.executable, "-c", "while True: print('f.py:1:match', flush=True)"]
+    collector = _MatchCollector(5, 1_000, json_output=False)
+
+    async def drain() -> None:
+        async for _ in grep._execute_search(endless, collector):
+            pass
+
+    await asyncio.wait_for(drain(), timeout=10)
+
+    assert collector.result().match_count == 5
+    assert collector.result().was_truncated
+
+
+@pytest.mark.asyncio
+async def test_emits_progress_events(grep, tmp_path, monkeypatch):
+    monkeypatch.setattr(grep_module, "_PROGRESS_INTERVAL", 0.0)
+    (tmp_path / "test.py").write_text("match\n")
+
+    events = [
+        event
+        async for event in grep.run(
+            GrepArgs(pattern="match"), InvokeContext(tool_call_id="call")
+        )
+    ]
+
+    assert isinstance(events[0], ToolStreamEvent)
+    assert events[0].message == "Found 1 matches so far"
+    assert events[-1].match_count == 1
+
+
 @pytest.mark.skipif(not shutil.which("grep"), reason="GNU grep not available")
 class TestGnuGrepBackend:
     @pytest.mark.asyncio
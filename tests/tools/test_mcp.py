@@ -148,13 +148,13 @@ class TestParseCallResult:
 
 
 class TestMCPHttpClient:
-    def test_create_vibe_mcp_http_client_uses_vibe_ssl_context(self):
+    def test_create_vibe_mcp_http_client_uses_shared_pool(self):
         headers = {"Authorization": "Bearer token"}
-        ssl_context = object()
+        transport = object()
         fake_client = object()
         with (
             patch(
-                "vibe.core.tools.mcp.tools.build_ssl_context", return_value=ssl_context
+                "vibe.core.tools.mcp.tools.http_pool.transport", return_value=transport
             ),
             patch(
                 "vibe.core.tools.mcp.tools.VibeAsyncHTTPClient",
@@ -167,7 +167,7 @@ class TestMCPHttpClient:
         kwargs = async_client.call_args.kwargs
         assert kwargs["follow_redirects"] is True
         assert kwargs["headers"] == headers
-        assert kwargs["verify"] is ssl_context
+        assert kwargs["transport"] is transport
         assert kwargs["timeout"].connect == 30.0
         assert kwargs["timeout"].read == 300.0
 
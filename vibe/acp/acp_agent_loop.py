@@ -1638,7 +1638,9 @@ class VibeAcpAgentLoop(AcpAgent):
             raise SessionNotFoundError(session_id)
 
         try:
-            loaded_messages, metadata = SessionLoader.load_session(session_dir)
+            loaded_messages, metadata = await asyncio.to_thread(
+                SessionLoader.load_session, session_dir
+            )
         except Exception as e:
             raise SessionLoadError(session_id, str(e)) from e
 
@@ -206,7 +206,7 @@ def _resume_previous_session(
     non_system_messages = [msg for msg in loaded_messages if msg.role != Role.system]
     agent_loop.messages.extend(non_system_messages)
 
-    _, metadata = SessionLoader.load_session(session_path)
+    metadata = SessionLoader.load_raw_metadata(session_path)
     session_id = metadata.get("session_id", agent_loop.session_id)
     agent_loop.session_id = session_id
     agent_loop.parent_session_id = metadata.get("parent_session_id")
@@ -253,6 +253,7 @@ from vibe.core.types import (
 from vibe.core.utils import (
     CancellationReason,
     get_user_cancellation_message,
+    http_pool,
     is_dangerous_directory,
 )
 from vibe.core.vibe_code_project import (
@@ -1064,6 +1065,16 @@ class VibeApp(App):  # noqa: PLR0904
         )
         return True
 
+    def on_chat_input_container_typing_started(
+        self, _event: ChatInputContainer.TypingStarted
+    ) -> None:
+        if not self._is_busy():
+            self.agent_loop.prewarm_connection(keep_warm=self._is_composing)
+
+    def _is_composing(self) -> bool:
+        container = self._chat_input_container
+        return container is not None and container.has_text and not self._is_busy()
+
     def _is_busy(self) -> bool:
         if self._agent_running:
             return True
@@ -3158,7 +3169,9 @@ class VibeApp(App):  # noqa: PLR0904
 
         self._emit_session_closed_for_active_session()
 
-        loaded_messages, metadata = SessionLoader.load_session(session_path)
+        loaded_messages, metadata = await asyncio.to_thread(
+            SessionLoader.load_session, session_path
+        )
         if self._chat_input_container:
             self._chat_input_container.set_custom_border(None)
 
@@ -4266,6 +4279,8 @@ class VibeApp(App):  # noqa: PLR0904
             logger.error(
                 "Failed to close telemetry client during shutdown", exc_info=exc
             )
+        with suppress(Exception):
+            await http_pool.aclose()
 
     def action_scroll_chat_up(self) -> None:
         try:
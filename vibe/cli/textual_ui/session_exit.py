@@ -4,6 +4,7 @@ from rich import print as rprint
 
 from vibe.core.config import SessionLoggingConfig
 from vibe.core.session import last_session_pointer
+from vibe.core.session.durability import session_durability
 from vibe.core.types import AgentStats
 
 
@@ -19,6 +20,8 @@ def format_session_usage(stats: AgentStats) -> str:
 def print_session_resume_message(
     session_id: str | None, stats: AgentStats, session_logging: SessionLoggingConfig
 ) -> None:
+    # Group-committed appends must be on disk before the user is told to resume.
+    session_durability.flush()
     if not session_id:
         return
 
@@ -7,6 +7,7 @@ from typing import Any
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.message import Message
+from textual.widgets import TextArea
 
 from vibe.cli.autocompletion.path_completion import PathCompletionController
 from vibe.cli.autocompletion.slash_command import SlashCommandController
@@ -36,6 +37,9 @@ class ChatInputContainer(Vertical):
             self.value = value
             super().__init__()
 
+    class TypingStarted(Message):
+        """Posted when the input goes from empty to non-empty."""
+
     def __init__(
         self,
         command_registry: CommandRegistry,
@@ -69,6 +73,7 @@ class ChatInputContainer(Vertical):
             ),
         ])
         self._body: ChatInputBody | None = None
+        self._has_text = False
 
     def _get_slash_entries(self) -> list[tuple[str, str]]:
         entries = [
@@ -193,10 +198,20 @@ class ChatInputContainer(Vertical):
             widget.applying_completion = True
         self._body.replace_input(new_text, cursor_offset=start + len(insertion))
 
+    def on_text_area_changed(self, event: TextArea.Changed) -> None:
+        has_text = bool(event.text_area.text.strip())
+        if has_text and not self._has_text:
+            self.post_message(self.TypingStarted())
+        self._has_text = has_text
+
     def on_chat_input_body_submitted(self, event: ChatInputBody.Submitted) -> None:
         event.stop()
         self.post_message(self.Submitted(event.value))
 
+    @property
+    def has_text(self) -> bool:
+        return self._has_text
+
     @property
     def switching_mode(self) -> bool:
         return self._body.switching_mode if self._body else False
@@ -26,5 +26,6 @@ def create_narrator_backend(
         provider=provider,
         timeout=config.api_timeout,
         retry_max_elapsed_time=config.api_retry_max_elapsed_time,
+        splice_message_json=config.splice_message_json,
     )
     return backend, NARRATOR_MODEL
@@ -30,6 +30,7 @@ from vibe.core.checkpoints import Checkpointer, CheckpointRecorder, FileStore
 from vibe.core.compaction import (
     CompactionFailedError as CompactionFailedError,
     CompactionManager,
+    ToolResultPruner,
 )
 from vibe.core.compaction.context import (
     extract_summary,
@@ -141,6 +142,7 @@ from vibe.core.types import (
     ApprovalResponse,
     AssistantEvent,
     AvailableTool,
+    Backend,
     BaseEvent,
     CompactEndEvent,
     CompactStartEvent,
@@ -160,6 +162,7 @@ from vibe.core.types import (
     ResponseTooLongError,
     Role,
     SessionTitleUpdatedEvent,
+    StreamAccumulator,
     StrToolChoice,
     ToolCall,
     ToolCallEvent,
@@ -177,8 +180,15 @@ from vibe.core.utils import (
     get_server_url_from_api_base,
     get_user_agent,
     get_user_cancellation_message,
+    http_pool,
     is_user_cancellation_event,
 )
+from vibe.core.utils.tokens import (
+    DEFAULT_TOKEN_FAMILY,
+    TOKEN_FAMILY_BY_API_STYLE,
+    TokenEstimator,
+    token_estimator_for,
+)
 
 
 def _is_git_executable_available() -> bool:
@@ -194,6 +204,14 @@ def _is_git_executable_available() -> bool:
 
 _TELEPORT_AVAILABLE = _is_git_executable_available()
 
+# Revalidate a kept-warm connection at this fraction of the keep-alive expiry.
+_KEEP_WARM_FRACTION = 0.8
+
+
+def _prewarm_time_saved() -> float:
+    # The pool is process-wide, so concurrent sessions may share a saving.
+    return http_pool.total_stats().prewarm_time_saved
+
 
 def _load_teleport_service() -> type[TeleportService]:
     try:
@@ -382,6 +400,7 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
         self._init_error: Exception | None = None
         self._init_start_time = time.monotonic()
         self._experiments_task: asyncio.Task[None] | None = None
+        self._prewarm_task: asyncio.Task[None] | None = None
         self._reload_generation: int = 0
         self._pending_new_session_telemetry: bool = False
         self._ready_telemetry_pending: bool = defer_heavy_init
@@ -444,6 +463,7 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
         )
 
         self.messages = MessageList(initial=[], observer=message_observer)
+        self.messages.on_reset(self._clear_backend_message_cache)
 
         self.stats = AgentStats()
         self.approval_callback: ApprovalCallback | None = None
@@ -514,7 +534,11 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
             telemetry_client=self.telemetry_client,
             session_ids=lambda: (self.session_id, self.parent_session_id),
         )
+        self.tool_result_pruner = ToolResultPruner(
+            self.messages, self._session_log_path
+        )
         self._teleport_service: TeleportService | None = None
+        self.prewarm_connection()
 
         Thread(
             target=migrate_sessions_entrypoint,
@@ -714,10 +738,12 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
         self.telemetry_client.send_session_closed()
 
     async def aclose(self) -> None:
-        if (task := self._experiments_task) is not None and not task.done():
-            task.cancel()
-            with contextlib.suppress(BaseException):
-                await task
+        await self.compaction_manager.aclose()
+        for task in (self._experiments_task, self._prewarm_task):
+            if task is not None and not task.done():
+                task.cancel()
+                with contextlib.suppress(BaseException):
+                    await task
         if self._mcp_pool is not None:
             with contextlib.suppress(Exception):
                 await self._mcp_pool.aclose()
@@ -818,6 +844,45 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
         """Rebuild and replace the system prompt with current tool/skill state."""
         self.messages.update_system_prompt(self._build_system_prompt())
 
+    def prewarm_connection(self, keep_warm: Callable[[], bool] | None = None) -> None:
+        """Open or validate the provider connection in the background.
+
+        Runs at startup and when the user starts typing, so DNS, TCP and TLS
+        setup overlap user think time instead of delaying the first token.
+        While ``keep_warm`` returns true the connection is revalidated before
+        the pool's keep-alive expiry, so a long think time does not lose it.
+        """
+        if not self.config.http_pool.prewarm:
+            return
+        if (task := self._prewarm_task) is not None and not task.done():
+            return
+        # Injected backends need not support pre-warming.
+        if (prewarm := getattr(self.backend, "prewarm", None)) is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._prewarm_task = loop.create_task(self._prewarm_backend(prewarm, keep_warm))
+
+    async def _prewarm_backend(
+        self,
+        prewarm: Callable[[], Awaitable[float | None]],
+        keep_warm: Callable[[], bool] | None,
+    ) -> None:
+        # The saving is credited by the pool once a completion reuses the
+        # connection; see _prewarm_time_saved.
+        interval = self.config.http_pool.keepalive_expiry * _KEEP_WARM_FRACTION
+        while await prewarm() is not None and keep_warm is not None and interval > 0:
+            await asyncio.sleep(interval)
+            if not keep_warm():
+                return
+
+    def _clear_backend_message_cache(self) -> None:
+        # Injected backends need not implement the conversion cache.
+        if clear := getattr(self.backend, "clear_message_cache", None):
+            clear()
+
     def backend_factory(self, config: VibeConfigSchema | None = None) -> BackendLike:
         return self._injected_backend or self._select_backend(config)
 
@@ -828,6 +893,7 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
             provider=provider,
             timeout=config.api_timeout,
             retry_max_elapsed_time=config.api_retry_max_elapsed_time,
+            splice_message_json=config.splice_message_json,
             enable_otel=(
                 config.enable_telemetry
                 and config.enable_otel
@@ -1121,7 +1187,12 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
         if self._max_session_tokens is not None:
             self.middleware_pipeline.add(TokenLimitMiddleware(self._max_session_tokens))
 
-        self.middleware_pipeline.add(AutoCompactMiddleware())
+        self.middleware_pipeline.add(
+            AutoCompactMiddleware(
+                speculate=lambda: self.compaction_manager.speculate(),
+                prune=lambda: self.tool_result_pruner.prune(),
+            )
+        )
         if self.config.context_warnings:
             self.middleware_pipeline.add(ContextWarningMiddleware(0.5))
 
@@ -1227,7 +1298,20 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
 
     def _get_context(self) -> ConversationContext:
         return ConversationContext(
-            messages=self.messages, stats=self.stats, config=self.config
+            messages=self.messages,
+            stats=self.stats,
+            config=self.config,
+            projected_tokens=self.messages.projected_tokens(self._token_estimator()),
+        )
+
+    def _token_estimator(self, model: ModelConfig | None = None) -> TokenEstimator:
+        provider = self.config.get_provider_for_model(
+            model or self.config.get_active_model()
+        )
+        if provider.backend == Backend.MISTRAL:
+            return token_estimator_for("mistral")
+        return token_estimator_for(
+            TOKEN_FAMILY_BY_API_STYLE.get(provider.api_style, DEFAULT_TOKEN_FAMILY)
         )
 
     def _build_backend_metadata(
@@ -2034,6 +2118,7 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
         tools: list[AvailableTool] | None,
         tool_choice: StrToolChoice | AvailableTool | None,
         call_type: TelemetryCallType | None,
+        background: bool = False,
     ) -> LLMChunk:
         """Make one accounted, non-streaming model call.
 
@@ -2041,7 +2126,9 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
         backend errors. Does NOT append to self.messages or raise on refusal —
         those are the caller's concern. This is the single path every
         non-streaming call (including compaction) goes through, so usage
-        accounting can never be skipped.
+        accounting can never be skipped. A ``background`` call runs alongside
+        the conversation's own turns: its usage is added to the session totals
+        but does not replace the context size or last-turn stats.
         """
         provider = self.config.get_provider_for_model(model)
         backend_metadata = self._build_backend_metadata(call_type)
@@ -2066,6 +2153,7 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
 
         try:
             start_time = time.perf_counter()
+            prewarm_saved_before = _prewarm_time_saved()
             result = await self.backend.complete(
                 model=model,
                 messages=self._messages_for_backend(messages, model),
@@ -2082,9 +2170,17 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
                 raise AgentLoopLLMResponseError(
                     "Usage data missing in non-streaming completion response"
                 )
-            self._update_stats(usage=result.usage, time_seconds=end_time - start_time)
+            if background:
+                self.stats.session_prompt_tokens += result.usage.prompt_tokens
+                self.stats.session_completion_tokens += result.usage.completion_tokens
+            else:
+                self._update_stats(
+                    usage=result.usage,
+                    time_seconds=end_time - start_time,
+                    prewarm_time_saved=_prewarm_time_saved() - prewarm_saved_before,
+                )
 
-            if result.correlation_id:
+            if result.correlation_id and not background:
                 self.telemetry_client.last_correlation_id = result.correlation_id
 
             processed_message = self.format_handler.process_api_response_message(
@@ -2124,6 +2220,10 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
             tool_choice=self.format_handler.get_tool_choice(),
             call_type=call_type,
         )
+        if result.usage is not None:
+            self.messages.calibrate_tokens(
+                result.usage.prompt_tokens, self._token_estimator(active_model)
+            )
         self.messages.append(result.message)
         if result.stop and result.stop.is_refusal:
             provider = self.config.get_provider_for_model(active_model)
@@ -2155,8 +2255,9 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
 
         try:
             start_time = time.perf_counter()
+            prewarm_saved_before = _prewarm_time_saved()
             usage = LLMUsage()
-            chunk_agg: LLMChunk | None = None
+            accumulator = StreamAccumulator()
             async for chunk in self.backend.complete_streaming(
                 model=active_model,
                 messages=self._messages_for_backend(self.messages, active_model),
@@ -2175,21 +2276,25 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
                 processed_chunk = LLMChunk(
                     message=processed_message, usage=chunk.usage, stop=chunk.stop
                 )
-                chunk_agg = (
-                    processed_chunk
-                    if chunk_agg is None
-                    else chunk_agg + processed_chunk
-                )
+                accumulator.add(processed_chunk)
                 usage += chunk.usage or LLMUsage()
                 yield processed_chunk
             end_time = time.perf_counter()
 
-            if chunk_agg is None or chunk_agg.usage is None:
+            if accumulator.usage is None:
                 raise AgentLoopLLMResponseError(
                     "Usage data missing in final chunk of streamed completion"
                 )
-            self._update_stats(usage=usage, time_seconds=end_time - start_time)
+            self._update_stats(
+                usage=usage,
+                time_seconds=end_time - start_time,
+                prewarm_time_saved=_prewarm_time_saved() - prewarm_saved_before,
+            )
+            self.messages.calibrate_tokens(
+                usage.prompt_tokens, self._token_estimator(active_model)
+            )
 
+            chunk_agg = accumulator.build()
             self.messages.append(chunk_agg.message)
             if chunk_agg.stop and chunk_agg.stop.is_refusal:
                 raise _refusal_error(provider.name, active_model.name, chunk_agg)
@@ -2210,8 +2315,11 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
                 f"API error from {provider.name} (model: {active_model.name}): {e}"
             ) from e
 
-    def _update_stats(self, usage: LLMUsage, time_seconds: float) -> None:
+    def _update_stats(
+        self, usage: LLMUsage, time_seconds: float, prewarm_time_saved: float = 0.0
+    ) -> None:
         self.stats.last_turn_duration = time_seconds
+        self.stats.prewarm_time_saved += prewarm_time_saved
         self.stats.last_turn_prompt_tokens = usage.prompt_tokens
         self.stats.last_turn_completion_tokens = usage.completion_tokens
         self.stats.session_prompt_tokens += usage.prompt_tokens
@@ -2220,6 +2328,12 @@ class AgentLoop(AgentLoopHooksMixin):  # noqa: PLR0904
         if time_seconds > 0 and usage.completion_tokens > 0:
             self.stats.tokens_per_second = usage.completion_tokens / time_seconds
 
+    def _session_log_path(self) -> Path | None:
+        session_logger = self.session_logger
+        if not session_logger.enabled or session_logger.session_dir is None:
+            return None
+        return session_logger.messages_filepath
+
     def _clean_message_history(self) -> None:
         ACCEPTABLE_HISTORY_SIZE = 2
         if len(self.messages) < ACCEPTABLE_HISTORY_SIZE:
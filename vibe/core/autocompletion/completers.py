@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+import heapq
 from pathlib import Path
 from typing import ClassVar, NamedTuple
 
-from vibe.core.autocompletion.file_indexer import FileIndexer, IndexEntry
+from vibe.core.autocompletion.file_indexer import FileIndexer, IndexView
 from vibe.core.autocompletion.file_indexer.store import (
     ASCII_CODEPOINT_LIMIT,
     build_ascii_mask,
 )
 from vibe.core.autocompletion.fuzzy import fuzzy_match
+from vibe.core.autocompletion.fuzzy_scorer import FuzzyPathScorer
 
 DEFAULT_MAX_ENTRIES_TO_PROCESS = 32000
 DEFAULT_TARGET_MATCHES = 100
@@ -111,6 +113,7 @@ class PathCompleter(Completer):
         watcher_enabled_getter: Callable[[], bool] | None = None,
     ) -> None:
         self._indexer = FileIndexer(should_enable_watcher=watcher_enabled_getter)
+        self._fuzzy_scorer = FuzzyPathScorer(max_entries_to_process)
         self._max_entries_to_process = max_entries_to_process
         self._target_matches = target_matches
 
@@ -185,13 +188,13 @@ class PathCompleter(Completer):
 
         return bool(after_prefix) and "/" not in after_prefix
 
-    def _matches_prefix(self, entry: IndexEntry, context: _SearchContext) -> bool:
-        path_str = entry.rel
-
+    def _matches_prefix(
+        self, path_str: str, is_dir: bool, context: _SearchContext
+    ) -> bool:
         if context.path_prefix:
             prefix_without_slash = context.path_prefix.rstrip("/")
 
-            if path_str == prefix_without_slash and entry.is_dir:
+            if path_str == prefix_without_slash and is_dir:
                 # do not suggest the dir itself (e.g. "@src/" => don't suggest "@src/")
                 return False
 
@@ -205,24 +208,15 @@ class PathCompleter(Completer):
         # entry matches the prefix: let the fuzzy matcher decide if it's a good match
         return True
 
-    def _is_visible(self, entry: IndexEntry, context: _SearchContext) -> bool:
-        return not (entry.name.startswith(".") and not context.suffix.startswith("."))
-
-    def _can_possibly_fuzzy_match(
-        self, entry: IndexEntry, context: _SearchContext
-    ) -> bool:
-        if context.search_pattern_ascii_mask is None:
-            return True
-        return (
-            entry.ascii_mask & context.search_pattern_ascii_mask
-        ) == context.search_pattern_ascii_mask
+    def _is_visible(self, name: str, context: _SearchContext) -> bool:
+        return not (name.startswith(".") and not context.suffix.startswith("."))
 
-    def _format_label(self, entry: IndexEntry) -> str:
-        suffix = "/" if entry.is_dir else ""
-        return f"@{entry.rel}{suffix}"
+    def _format_label(self, path_str: str, is_dir: bool) -> str:
+        suffix = "/" if is_dir else ""
+        return f"@{path_str}{suffix}"
 
     def _build_match_rank(
-        self, entry: IndexEntry, context: _SearchContext, fuzzy_score: float
+        self, path_str: str, is_dir: bool, context: _SearchContext, fuzzy_score: float
     ) -> MatchRank:
         query = context.suffix.lower()
         if not query:
@@ -236,18 +230,19 @@ class PathCompleter(Completer):
                 name_prefix=0,
                 extension_match=0,
                 fuzzy_score=fuzzy_score,
-                shallow_path=-entry.rel.count("/"),
+                shallow_path=-path_str.count("/"),
             )
 
-        name = entry.name.lower()
-        rel = entry.rel.lower()
-        stem = Path(entry.name).stem.lower()
-        extension = Path(entry.name).suffix.lower()
+        entry_name = path_str.rpartition("/")[2]
+        name = entry_name.lower()
+        rel = path_str.lower()
+        stem = Path(entry_name).stem.lower()
+        extension = Path(entry_name).suffix.lower()
         query_extension = Path(query).suffix.lower()
         query_stem = Path(query).stem.lower()
         query_looks_like_filename = "." in query
         query_looks_like_path = "/" in context.search_pattern
-        exact_directory = int(entry.is_dir and rel == context.search_pattern.lower())
+        exact_directory = int(is_dir and rel == context.search_pattern.lower())
         immediate_child_of_exact_path = int(
             query_looks_like_path
             and self._is_immediate_child_of_prefix(rel, context.search_pattern.lower())
@@ -267,48 +262,60 @@ class PathCompleter(Completer):
             name_prefix=int(name.startswith(query)),
             extension_match=int(bool(query_extension) and extension == query_extension),
             fuzzy_score=fuzzy_score,
-            shallow_path=-entry.rel.count("/"),
+            shallow_path=-path_str.count("/"),
         )
 
     def _score_matches(
-        self, entries: list[IndexEntry], context: _SearchContext
+        self, index: IndexView, context: _SearchContext
     ) -> list[tuple[str, PathCompleter.MatchRank]]:
-        scored_matches: list[tuple[str, PathCompleter.MatchRank]] = []
+        if context.search_pattern:
+            return self._score_fuzzy_matches(index, context)
 
-        for i, entry in enumerate(entries):
-            if i >= self._max_entries_to_process:
-                break
-
-            if not self._matches_prefix(entry, context):
+        scored_matches: list[tuple[str, PathCompleter.MatchRank]] = []
+        # Children listed under a path prefix contain all of its characters, so
+        # the index drops the others on their ASCII masks.
+        for path_str, is_dir in index.paths(
+            context.search_pattern_ascii_mask or 0, self._max_entries_to_process
+        ):
+            if not self._matches_prefix(path_str, is_dir, context):
                 continue
 
-            if not self._is_visible(entry, context):
+            if not self._is_visible(path_str.rpartition("/")[2], context):
                 continue
 
-            label = self._format_label(entry)
+            rank = self._build_match_rank(path_str, is_dir, context, 0.0)
+            scored_matches.append((self._format_label(path_str, is_dir), rank))
+            if len(scored_matches) >= self._target_matches:
+                break
+
+        # Sort alphabetically first, then by descending rank; Python's stable sort
+        # keeps the label order for entries with equal ranks.
+        scored_matches.sort(key=lambda x: x[0])
+        scored_matches.sort(key=lambda x: x[1], reverse=True)
+        return scored_matches
 
-            if not context.search_pattern:
-                rank = self._build_match_rank(entry, context, 0.0)
-                scored_matches.append((label, rank))
-                if len(scored_matches) >= self._target_matches:
-                    break
+    def _score_fuzzy_matches(
+        self, index: IndexView, context: _SearchContext
+    ) -> list[tuple[str, PathCompleter.MatchRank]]:
+        scored_matches: list[tuple[str, PathCompleter.MatchRank]] = []
+        for path_str, is_dir, score in self._fuzzy_scorer.match(
+            index, context.search_pattern, context.search_pattern_ascii_mask
+        ):
+            if not self._matches_prefix(path_str, is_dir, context):
                 continue
 
-            if not self._can_possibly_fuzzy_match(entry, context):
+            if not self._is_visible(path_str.rpartition("/")[2], context):
                 continue
 
-            match_result = fuzzy_match(
-                context.search_pattern, entry.rel, entry.rel_lower
-            )
-            if match_result.matched:
-                rank = self._build_match_rank(entry, context, match_result.score)
-                scored_matches.append((label, rank))
+            rank = self._build_match_rank(path_str, is_dir, context, score)
+            scored_matches.append((self._format_label(path_str, is_dir), rank))
 
-        # Sort alphabetically first, then by descending rank; Python's stable sort
-        # keeps the label order for entries with equal ranks.
-        scored_matches.sort(key=lambda x: x[0])
-        scored_matches.sort(key=lambda x: x[1], reverse=True)
-        return scored_matches[: self._target_matches]
+        # Descending rank, then label; the heap keeps only the best matches.
+        return heapq.nsmallest(
+            self._target_matches,
+            scored_matches,
+            key=lambda x: (tuple(-value for value in x[1]), x[0]),
+        )
 
     def _collect_matches(self, text: str, cursor_pos: int) -> list[str]:
         before_cursor = text[:cursor_pos]
@@ -320,7 +327,7 @@ class PathCompleter(Completer):
 
         try:
             # TODO (Vince): doing the assumption that "." is the root directory... Reliable?
-            file_index = self._indexer.get_index(Path("."))
+            file_index = self._indexer.get_view(Path("."))
         except (OSError, RuntimeError):
             return []
 
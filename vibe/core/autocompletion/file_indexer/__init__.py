@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 from vibe.core.autocompletion.file_indexer.indexer import FileIndexer
+from vibe.core.autocompletion.file_indexer.snapshot import IndexSnapshot
 from vibe.core.autocompletion.file_indexer.store import (
     FileIndexStats,
     FileIndexStore,
     IndexEntry,
+    IndexView,
 )
 
-__all__ = ["FileIndexStats", "FileIndexStore", "FileIndexer", "IndexEntry"]
+__all__ = [
+    "FileIndexStats",
+    "FileIndexStore",
+    "FileIndexer",
+    "IndexEntry",
+    "IndexSnapshot",
+    "IndexView",
+]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import fnmatch
+import hashlib
 from pathlib import Path
 
 from vibe.core.utils.io import read_safe
@@ -104,6 +105,15 @@ class IgnoreRules:
                 ignored = pattern.is_exclude
         return ignored
 
+    def digest(self) -> bytes:
+        """Fingerprint of the active patterns, to spot a stale saved index."""
+        hasher = hashlib.blake2b(digest_size=16)
+        for pattern in self._patterns or []:
+            hasher.update(
+                f"{pattern.raw}\0{pattern.is_exclude}\0{pattern.anchor_root}\n".encode()
+            )
+        return hasher.digest()
+
     def reset(self) -> None:
         self._patterns = None
         self._root = None
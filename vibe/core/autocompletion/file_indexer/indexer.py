@@ -12,8 +12,10 @@ from vibe.core.autocompletion.file_indexer.store import (
     FileIndexStats,
     FileIndexStore,
     IndexEntry,
+    IndexView,
 )
 from vibe.core.autocompletion.file_indexer.watcher import Change, WatchController
+from vibe.core.paths import FILE_INDEX_DIR
 
 
 @dataclass(slots=True)
@@ -27,12 +29,16 @@ class FileIndexer:
         self,
         mass_change_threshold: int = 200,
         should_enable_watcher: Callable[[], bool] | None = None,
+        cache_dir: Path | None = None,
     ) -> None:
         self._lock = RLock()  # guards _store snapshot access and watcher callbacks.
         self._stats = FileIndexStats()
         self._ignore_rules = IgnoreRules()
         self._store = FileIndexStore(
-            self._ignore_rules, self._stats, mass_change_threshold=mass_change_threshold
+            self._ignore_rules,
+            self._stats,
+            mass_change_threshold=mass_change_threshold,
+            cache_dir=cache_dir or FILE_INDEX_DIR.path,
         )
         self._watcher = WatchController(self._handle_watch_changes)
         self._rebuild_executor = ThreadPoolExecutor(
@@ -53,6 +59,17 @@ class FileIndexer:
         return self._stats
 
     def get_index(self, root: Path) -> list[IndexEntry]:
+        self._ensure_index(root)
+        with self._lock:  # ensure root reference is fresh before snapshotting
+            return self._store.snapshot()
+
+    def get_view(self, root: Path) -> IndexView:
+        """Like ``get_index``, without building an entry per indexed path."""
+        self._ensure_index(root)
+        with self._lock:
+            return self._store.view()
+
+    def _ensure_index(self, root: Path) -> None:
         resolved_root = root.resolve()
 
         with self._lock:  # read current root without blocking rebuild bookkeeping
@@ -84,9 +101,6 @@ class FileIndexer:
         else:
             self._watcher.stop()
 
-        with self._lock:  # ensure root reference is fresh before snapshotting
-            return self._store.snapshot()
-
     def refresh(self) -> None:
         self._watcher.stop()
         with self._rebuild_lock:
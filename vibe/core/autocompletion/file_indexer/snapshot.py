@@ -0,0 +1,270 @@
+"""Columnar file index that can be saved and memory-mapped back.
+
+Entries are sorted by relative path. The paths live in one UTF-8 blob
+addressed by an offset column; the ASCII masks (128 bits, one per code
+point) are split over two ``Q`` columns; directories carry their mtime so a
+later walk can reuse the listing of every directory that has not changed.
+
+On disk the columns follow a fixed header in the same layout as in memory,
+so ``IndexSnapshot.load`` maps the file and casts views over it instead of
+parsing anything.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Container, Iterator
+import mmap
+import os
+from pathlib import Path
+import struct
+import tempfile
+from typing import Literal
+
+_MAGIC = b"VFIX"
+_VERSION = 1
+# magic, version, entry count, root mtime, walk start, blob size, rules digest
+_HEADER = struct.Struct("<4sIQqqQ16s")
+_ALIGNMENT = 8
+_MASK_BITS = 64
+_MASK_LOW = (1 << _MASK_BITS) - 1
+_DIR_FLAG = 1
+
+type IndexRecord = tuple[str, bool, int, int]
+"""``(rel, is_dir, mtime_ns, ascii_mask)``; only directories track an mtime."""
+
+
+def _padding(size: int) -> int:
+    return -size % _ALIGNMENT
+
+
+class IndexSnapshot:
+    def __init__(
+        self,
+        *,
+        offsets: array[int] | memoryview,
+        mask_low: array[int] | memoryview,
+        mask_high: array[int] | memoryview,
+        mtimes: array[int] | memoryview,
+        flags: bytes | memoryview,
+        blob: bytes | mmap.mmap,
+        blob_start: int = 0,
+        root_mtime_ns: int,
+        walk_started_ns: int,
+        rules_digest: bytes,
+    ) -> None:
+        self._offsets = offsets
+        self._mask_low = mask_low
+        self._mask_high = mask_high
+        self._mtimes = mtimes
+        self._flags = flags
+        # Slicing bytes (or the mmap itself) and decoding is about twice as
+        # fast as going through a memoryview, so the blob is kept that way.
+        self._blob = blob
+        self._blob_start = blob_start
+        self.root_mtime_ns = root_mtime_ns
+        # Directory mtimes this close to the walk may hide a later change in
+        # the same clock tick, so those directories are listed again.
+        self.walk_started_ns = walk_started_ns
+        self.rules_digest = rules_digest
+
+    @classmethod
+    def from_records(
+        cls,
+        records: list[IndexRecord],
+        *,
+        root_mtime_ns: int,
+        walk_started_ns: int,
+        rules_digest: bytes,
+    ) -> IndexSnapshot:
+        """Build from records sorted by ``rel``."""
+        offsets = array("Q", [0])
+        blob = bytearray()
+        for rel, _, _, _ in records:
+            blob += rel.encode()
+            offsets.append(len(blob))
+        return cls(
+            offsets=offsets,
+            mask_low=array("Q", [mask & _MASK_LOW for *_, mask in records]),
+            mask_high=array("Q", [mask >> _MASK_BITS for *_, mask in records]),
+            mtimes=array("q", [mtime for _, _, mtime, _ in records]),
+            flags=bytes(_DIR_FLAG if is_dir else 0 for _, is_dir, _, _ in records),
+            blob=bytes(blob),
+            root_mtime_ns=root_mtime_ns,
+            walk_started_ns=walk_started_ns,
+            rules_digest=rules_digest,
+        )
+
+    def __len__(self) -> int:
+        return len(self._flags)
+
+    def rel(self, i: int) -> str:
+        start = self._blob_start
+        return self._blob[
+            start + self._offsets[i] : start + self._offsets[i + 1]
+        ].decode()
+
+    def is_dir(self, i: int) -> bool:
+        return bool(self._flags[i] & _DIR_FLAG)
+
+    def ascii_mask(self, i: int) -> int:
+        return self._mask_low[i] | (self._mask_high[i] << _MASK_BITS)
+
+    def mtime_ns(self, i: int) -> int:
+        return self._mtimes[i]
+
+    def index_of(self, rel: str) -> int | None:
+        i = bisect_left(range(len(self)), rel, key=self.rel)
+        return i if i < len(self) and self.rel(i) == rel else None
+
+    def subtree(self, rel: str) -> range:
+        """Indices of the entries below the directory ``rel``."""
+        start = bisect_left(range(len(self)), f"{rel}/", key=self.rel)
+        # "0" follows "/" in code point order.
+        count = bisect_left(range(start, len(self)), f"{rel}0", key=self.rel)
+        return range(start, start + count)
+
+    def records(self) -> Iterator[IndexRecord]:
+        blob, base, offsets = self._blob, self._blob_start, self._offsets
+        for start, end, flags, mtime_ns, mask_low, mask_high in zip(
+            offsets,
+            offsets[1:],
+            self._flags,
+            self._mtimes,
+            self._mask_low,
+            self._mask_high,
+            strict=False,
+        ):
+            yield (
+                blob[base + start : base + end].decode(),
+                bool(flags & _DIR_FLAG),
+                mtime_ns,
+                mask_low | (mask_high << _MASK_BITS),
+            )
+
+    def paths(
+        self,
+        skip: Container[int] = frozenset(),
+        required_mask: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[tuple[str, bool]]:
+        """``(rel, is_dir)`` of the entries whose mask covers ``required_mask``.
+
+        Entries in ``skip`` are left out and at most ``limit`` of the others
+        are looked at. The mask test runs on the packed columns, so rejected
+        paths are never decoded.
+        """
+        required_low = required_mask & _MASK_LOW
+        required_high = required_mask >> _MASK_BITS
+        remaining = len(self) if limit is None else limit
+        blob, base, offsets = self._blob, self._blob_start, self._offsets
+        for i, (start, end, flags, mask_low, mask_high) in enumerate(
+            zip(
+                offsets,
+                offsets[1:],
+                self._flags,
+                self._mask_low,
+                self._mask_high,
+                strict=False,
+            )
+        ):
+            if i in skip:
+                continue
+            if remaining <= 0:
+                return
+            remaining -= 1
+            if (
+                mask_low & required_low == required_low
+                and mask_high & required_high == required_high
+            ):
+                yield blob[base + start : base + end].decode(), bool(flags & _DIR_FLAG)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="wb", suffix=".tmp", dir=str(path.parent), delete=False
+            ) as f:
+                temp_path = Path(f.name)
+                f.write(
+                    _HEADER.pack(
+                        _MAGIC,
+                        _VERSION,
+                        len(self),
+                        self.root_mtime_ns,
+                        self.walk_started_ns,
+                        self._offsets[-1],
+                        self.rules_digest,
+                    )
+                )
+                for column in (
+                    self._offsets,
+                    self._mask_low,
+                    self._mask_high,
+                    self._mtimes,
+                    self._flags,
+                ):
+                    data = bytes(column)
+                    f.write(data + bytes(_padding(len(data))))
+                f.write(
+                    self._blob[self._blob_start : self._blob_start + self._offsets[-1]]
+                )
+            os.replace(temp_path, path)
+        finally:
+            if temp_path and temp_path.exists():
+                temp_path.unlink()
+
+    @classmethod
+    def load(cls, path: Path) -> IndexSnapshot | None:
+        """Map a saved snapshot, or ``None`` if it is missing or unreadable."""
+        try:
+            with path.open("rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            return cls._from_mapping(mapped)
+        except (ValueError, TypeError, struct.error):
+            return None
+
+    @classmethod
+    def _from_mapping(cls, mapped: mmap.mmap) -> IndexSnapshot:
+        buffer = memoryview(mapped)
+        magic, version, count, root_mtime_ns, walk_started_ns, blob_size, digest = (
+            _HEADER.unpack_from(buffer)
+        )
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("unknown file index format")
+
+        offset = _HEADER.size
+
+        def column(size: int, fmt: Literal["Q", "q"] | None) -> memoryview:
+            nonlocal offset
+            view = buffer[offset : offset + size]
+            if len(view) != size:
+                raise ValueError("truncated file index")
+            offset += size + _padding(size)
+            return view.cast(fmt) if fmt else view
+
+        word = struct.calcsize("Q")
+        offsets = column((count + 1) * word, "Q")
+        mask_low = column(count * word, "Q")
+        mask_high = column(count * word, "Q")
+        mtimes = column(count * word, "q")
+        flags = column(count, None)
+        if offsets[-1] != blob_size or len(mapped) < offset + blob_size:
+            raise ValueError("truncated file index")
+        return cls(
+            offsets=offsets,
+            mask_low=mask_low,
+            mask_high=mask_high,
+            mtimes=mtimes,
+            flags=flags,
+            blob=mapped,
+            blob_start=offset,
+            root_mtime_ns=root_mtime_ns,
+            walk_started_ns=walk_started_ns,
+            rules_digest=digest,
+        )
@@ -1,20 +1,31 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
+import hashlib
+from itertools import chain, count
 import os
 from pathlib import Path
+import time
 
 from vibe.core.autocompletion.file_indexer.ignore_rules import IgnoreRules
+from vibe.core.autocompletion.file_indexer.snapshot import IndexRecord, IndexSnapshot
 from vibe.core.autocompletion.file_indexer.watcher import Change
 
 ASCII_CODEPOINT_LIMIT = 128
+# A directory whose mtime falls this close to the walk that listed it may
+# have changed again within the same timestamp, so it is listed again.
+_RACY_WINDOW_NS = 2_000_000_000
+# Watcher changes accumulate over the snapshot until there are this many.
+_OVERLAY_COMPACT_THRESHOLD = 4096
+_generations = count(1)
 
 
 @dataclass(slots=True)
 class FileIndexStats:
     rebuilds: int = 0
     incremental_updates: int = 0
+    rescanned_dirs: int = 0
 
 
 @dataclass(slots=True)
@@ -37,49 +48,157 @@ def build_ascii_mask(value: str) -> int:
     return mask
 
 
+def _mtime_ns(path: str) -> int | None:
+    try:
+        return os.stat(path, follow_symlinks=False).st_mtime_ns
+    except OSError:
+        return None
+
+
+class IndexView:
+    """Read-only view of the index: a snapshot plus the changes made since.
+
+    ``paths`` reads the snapshot columns directly, so a caller scoring
+    thousands of paths builds an ``IndexEntry`` only for those it keeps.
+    ``generation`` changes whenever the index does.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        base: IndexSnapshot | None,
+        removed: frozenset[int],
+        added: list[IndexEntry],
+        generation: int = 0,
+    ) -> None:
+        self.root = root
+        self.generation = generation
+        self._base = base
+        self._removed = removed
+        self._added = added
+
+    def __len__(self) -> int:
+        base_len = len(self._base) if self._base is not None else 0
+        return base_len - len(self._removed) + len(self._added)
+
+    def paths(
+        self, required_mask: int = 0, limit: int | None = None
+    ) -> Iterator[tuple[str, bool]]:
+        """``(rel, is_dir)`` of the entries whose mask covers ``required_mask``.
+
+        At most ``limit`` entries are looked at. Entries added since the
+        snapshot come first, so recently created files stay within it.
+        """
+        added = [
+            (entry.rel, entry.is_dir)
+            for entry in self._added[:limit]
+            if entry.ascii_mask & required_mask == required_mask
+        ]
+        if self._base is None:
+            return iter(added)
+        base_limit = None if limit is None else max(0, limit - len(self._added))
+        return chain(added, self._base.paths(self._removed, required_mask, base_limit))
+
+    def entry(self, rel: str, is_dir: bool) -> IndexEntry:
+        return self._entry(rel, is_dir, build_ascii_mask(rel.lower()))
+
+    def entries(self) -> list[IndexEntry]:
+        entries = list(self._added)
+        if self._base is not None:
+            removed = self._removed
+            entries.extend(
+                self._entry(rel, is_dir, ascii_mask)
+                for i, (rel, is_dir, _, ascii_mask) in enumerate(self._base.records())
+                if i not in removed
+            )
+        return sorted(entries, key=lambda entry: entry.rel)
+
+    def _entry(self, rel: str, is_dir: bool, ascii_mask: int) -> IndexEntry:
+        return IndexEntry(
+            rel=rel,
+            rel_lower=rel.lower(),
+            name=rel.rpartition("/")[2],
+            path=self.root / rel,
+            is_dir=is_dir,
+            ascii_mask=ascii_mask,
+        )
+
+
 class FileIndexStore:
     def __init__(
         self,
         ignore_rules: IgnoreRules,
         stats: FileIndexStats,
         mass_change_threshold: int = 200,
+        cache_dir: Path | None = None,
     ) -> None:
         self._ignore_rules = ignore_rules
         self._stats = stats
         self._mass_change_threshold = mass_change_threshold
-        self._entries_by_rel: dict[str, IndexEntry] = {}
+        self._cache_dir = cache_dir
+        self._base: IndexSnapshot | None = None
+        self._removed: set[int] = set()
+        self._added: dict[str, IndexEntry] = {}
         self._ordered_entries: list[IndexEntry] | None = None
         self._root: Path | None = None
+        self._generation = 0
 
     @property
     def root(self) -> Path | None:
         return self._root
 
     def clear(self) -> None:
-        self._entries_by_rel.clear()
+        self._base = None
+        self._removed.clear()
+        self._added.clear()
         self._ordered_entries = None
         self._root = None
+        self._generation = next(_generations)
 
     def rebuild(
         self, root: Path, should_cancel: Callable[[], bool] | None = None
     ) -> None:
         resolved_root = root.resolve()
         self._ignore_rules.ensure_for_root(resolved_root)
-        entries = self._walk_directory(resolved_root, cancel_check=should_cancel)
-        self._entries_by_rel = {entry.rel: entry for entry in entries}
-        self._ordered_entries = entries
+        digest = self._ignore_rules.digest()
+        cache_path = self._cache_path(resolved_root)
+
+        previous = IndexSnapshot.load(cache_path) if cache_path else None
+        if previous is not None and previous.rules_digest != digest:
+            previous = None
+
+        if previous is not None and self._is_current(resolved_root, previous):
+            snapshot = previous
+        else:
+            snapshot = self._scan_root(resolved_root, digest, previous, should_cancel)
+            if cache_path and not (should_cancel and should_cancel()):
+                try:
+                    snapshot.save(cache_path)
+                except OSError:
+                    pass
+
+        self._base = snapshot
+        self._removed = set()
+        self._added = {}
+        self._ordered_entries = None
         self._root = resolved_root
+        self._generation = next(_generations)
         self._stats.rebuilds += 1
 
-    def snapshot(self) -> list[IndexEntry]:
-        if not self._entries_by_rel:
-            return []
+    def view(self) -> IndexView:
+        if self._root is None:
+            return IndexView(Path(), None, frozenset(), [], self._generation)
+        return IndexView(
+            self._root,
+            self._base,
+            frozenset(self._removed),
+            sorted(self._added.values(), key=lambda entry: entry.rel),
+            self._generation,
+        )
 
+    def snapshot(self) -> list[IndexEntry]:
         if self._ordered_entries is None:
-            self._ordered_entries = sorted(
-                self._entries_by_rel.values(), key=lambda entry: entry.rel
-            )
-
+            self._ordered_entries = self.view().entries()
         return list(self._ordered_entries)
 
     def apply_changes(self, changes: list[tuple[Change, Path]]) -> None:
@@ -90,6 +209,7 @@ class FileIndexStore:
             self.rebuild(self._root)
             return
 
+        root = str(self._root)
         modified = False
         for change, path in changes:
             try:
@@ -108,81 +228,197 @@ class FileIndexStore:
             if not path.exists():
                 continue
 
-            if path.is_dir():
-                dir_entry = self._create_entry(rel_str, path.name, path, True)
-                if dir_entry:
-                    self._entries_by_rel[rel_str] = dir_entry
-                    modified = True
-                for entry in self._walk_directory(path, rel_str):
-                    self._entries_by_rel[entry.rel] = entry
-                    modified = True
-            else:
-                file_entry = self._create_entry(rel_str, path.name, path, False)
-                if file_entry:
-                    self._entries_by_rel[file_entry.rel] = file_entry
-                    modified = True
+            is_dir = path.is_dir()
+            if self._ignore_rules.should_ignore(rel_str, path.name, is_dir):
+                continue
+            self._add_entry(rel_str, is_dir, build_ascii_mask(rel_str.lower()))
+            modified = True
+            if is_dir:
+                for rel, child_is_dir, _, mask in self._walk(
+                    root, [(rel_str, 0)], None
+                ):
+                    self._add_entry(rel, child_is_dir, mask)
 
         if modified:
             self._ordered_entries = None
+            self._generation = next(_generations)
             self._stats.incremental_updates += 1
+            if len(self._removed) + len(self._added) > _OVERLAY_COMPACT_THRESHOLD:
+                self._compact()
 
-    def _create_entry(
-        self, rel_str: str, name: str, path: Path, is_dir: bool
-    ) -> IndexEntry | None:
-        if self._ignore_rules.should_ignore(rel_str, name, is_dir):
+    def _cache_path(self, root: Path) -> Path | None:
+        if self._cache_dir is None:
             return None
-        rel_lower = rel_str.lower()
-        return IndexEntry(
-            rel=rel_str,
-            rel_lower=rel_lower,
-            name=name,
-            path=path,
-            is_dir=is_dir,
-            ascii_mask=build_ascii_mask(rel_lower),
+        key = hashlib.blake2b(str(root).encode(), digest_size=16).hexdigest()
+        return self._cache_dir / f"{key}.idx"
+
+    def _is_current(self, root: Path, snapshot: IndexSnapshot) -> bool:
+        limit = snapshot.walk_started_ns - _RACY_WINDOW_NS
+        if (
+            snapshot.root_mtime_ns >= limit
+            or _mtime_ns(str(root)) != snapshot.root_mtime_ns
+        ):
+            return False
+        for i in range(len(snapshot)):
+            if not snapshot.is_dir(i):
+                continue
+            recorded = snapshot.mtime_ns(i)
+            if (
+                recorded >= limit
+                or _mtime_ns(os.path.join(root, snapshot.rel(i))) != recorded
+            ):
+                return False
+        return True
+
+    def _scan_root(
+        self,
+        root: Path,
+        digest: bytes,
+        previous: IndexSnapshot | None,
+        should_cancel: Callable[[], bool] | None,
+    ) -> IndexSnapshot:
+        walk_started_ns = time.time_ns()
+        root_mtime_ns = _mtime_ns(str(root)) or 0
+        records = self._walk(str(root), [("", root_mtime_ns)], previous, should_cancel)
+        records.sort()
+        return IndexSnapshot.from_records(
+            records,
+            root_mtime_ns=root_mtime_ns,
+            walk_started_ns=walk_started_ns,
+            rules_digest=digest,
         )
 
-    def _walk_directory(
+    def _walk(
         self,
-        directory: Path,
-        rel_prefix: str = "",
+        root: str,
+        pending: list[tuple[str, int]],
+        previous: IndexSnapshot | None,
         cancel_check: Callable[[], bool] | None = None,
-    ) -> list[IndexEntry]:
-        results: list[IndexEntry] = []
+    ) -> list[IndexRecord]:
+        """Records below the ``(rel, mtime_ns)`` directories in ``pending``.
+
+        Directories whose mtime still matches ``previous`` keep their listing
+        from it; only the others are read from disk.
+        """
+        listings: dict[str, list[IndexRecord]] = {}
+        recorded_mtimes: dict[str, int] = {}
+        limit = 0
+        if previous is not None:
+            recorded_mtimes[""] = previous.root_mtime_ns
+            limit = previous.walk_started_ns - _RACY_WINDOW_NS
+            for record in previous.records():
+                rel, is_dir, mtime_ns, _ = record
+                listings.setdefault(rel.rpartition("/")[0], []).append(record)
+                if is_dir:
+                    recorded_mtimes[rel] = mtime_ns
+
+        results: list[IndexRecord] = []
+        while pending:
+            if cancel_check and cancel_check():
+                break
+            dir_rel, mtime_ns = pending.pop()
+            if recorded_mtimes.get(dir_rel) == mtime_ns and mtime_ns < limit:
+                children = self._refresh_listing(root, listings.get(dir_rel, []))
+            else:
+                children = self._scan_directory(root, dir_rel)
+                self._stats.rescanned_dirs += 1
+            results.extend(children)
+            pending.extend(
+                (rel, child_mtime) for rel, is_dir, child_mtime, _ in children if is_dir
+            )
+        return results
+
+    def _refresh_listing(
+        self, root: str, listing: list[IndexRecord]
+    ) -> list[IndexRecord]:
+        children: list[IndexRecord] = []
+        for rel, is_dir, _, mask in listing:
+            mtime_ns = 0
+            if is_dir:
+                current = _mtime_ns(os.path.join(root, rel))
+                if current is None:
+                    continue
+                mtime_ns = current
+            children.append((rel, is_dir, mtime_ns, mask))
+        return children
+
+    def _scan_directory(self, root: str, dir_rel: str) -> list[IndexRecord]:
+        children: list[IndexRecord] = []
         try:
-            with os.scandir(directory) as iterator:
+            with os.scandir(os.path.join(root, dir_rel)) as iterator:
                 for entry in iterator:
-                    if cancel_check and cancel_check():
-                        break
-
                     is_dir = entry.is_dir(follow_symlinks=False)
                     name = entry.name
-                    rel_str = f"{rel_prefix}/{name}" if rel_prefix else name
-                    path = Path(entry.path)
-
-                    index_entry = self._create_entry(rel_str, name, path, is_dir)
-                    if not index_entry:
+                    rel_str = f"{dir_rel}/{name}" if dir_rel else name
+                    if self._ignore_rules.should_ignore(rel_str, name, is_dir):
                         continue
-
-                    results.append(index_entry)
-
+                    mtime_ns = 0
                     if is_dir:
-                        results.extend(
-                            self._walk_directory(path, rel_str, cancel_check)
-                        )
-        except (PermissionError, OSError):
+                        try:
+                            mtime_ns = entry.stat(follow_symlinks=False).st_mtime_ns
+                        except OSError:
+                            continue
+                    children.append((
+                        rel_str,
+                        is_dir,
+                        mtime_ns,
+                        build_ascii_mask(rel_str.lower()),
+                    ))
+        except OSError:
             pass
-
-        return results
+        return children
+
+    def _add_entry(self, rel_str: str, is_dir: bool, ascii_mask: int) -> None:
+        if self._base is not None and (i := self._base.index_of(rel_str)) is not None:
+            if self._base.is_dir(i) == is_dir:
+                self._removed.discard(i)
+                return
+            self._removed.add(i)
+        assert self._root is not None
+        self._added[rel_str] = IndexEntry(
+            rel=rel_str,
+            rel_lower=rel_str.lower(),
+            name=rel_str.rpartition("/")[2],
+            path=self._root / rel_str,
+            is_dir=is_dir,
+            ascii_mask=ascii_mask,
+        )
 
     def _remove_entry(self, rel_str: str) -> bool:
-        entry = self._entries_by_rel.pop(rel_str, None)
-        if not entry:
-            return False
-
-        if entry.is_dir:
-            prefix = f"{rel_str}/"
-            to_remove = [key for key in self._entries_by_rel if key.startswith(prefix)]
-            for key in to_remove:
-                self._entries_by_rel.pop(key, None)
-
-        return True
+        removed = self._added.pop(rel_str, None) is not None
+        prefix = f"{rel_str}/"
+        for key in [key for key in self._added if key.startswith(prefix)]:
+            self._added.pop(key, None)
+
+        if self._base is not None:
+            i = self._base.index_of(rel_str)
+            if i is not None and i not in self._removed:
+                self._removed.add(i)
+                if self._base.is_dir(i):
+                    self._removed.update(self._base.subtree(rel_str))
+                removed = True
+
+        return removed
+
+    def _compact(self) -> None:
+        records: list[IndexRecord] = []
+        if self._base is not None:
+            records.extend(
+                record
+                for i, record in enumerate(self._base.records())
+                if i not in self._removed
+            )
+        records.extend(
+            (entry.rel, entry.is_dir, 0, entry.ascii_mask)
+            for entry in self._added.values()
+        )
+        records.sort()
+        base = self._base
+        self._base = IndexSnapshot.from_records(
+            records,
+            root_mtime_ns=base.root_mtime_ns if base else 0,
+            walk_started_ns=base.walk_started_ns if base else 0,
+            rules_digest=base.rules_digest if base else b"",
+        )
+        self._removed = set()
+        self._added = {}
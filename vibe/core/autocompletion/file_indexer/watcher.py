@@ -9,9 +9,15 @@ from watchfiles import Change, watch
 
 class WatchController:
     def __init__(
-        self, on_changes: Callable[[Path, Iterable[tuple[Change, str]]], None]
+        self,
+        on_changes: Callable[[Path, Iterable[tuple[Change, str]]], None],
+        *,
+        debounce_ms: int = 1600,
+        name: str = "file-indexer-watch",
     ) -> None:
         self._on_changes = on_changes
+        self._debounce_ms = debounce_ms
+        self._name = name
         self._thread: Thread | None = None
         self._stop_event: Event | None = None
         self._ready_event: Event | None = None
@@ -29,7 +35,7 @@ class WatchController:
         thread = Thread(
             target=self._watch_loop,
             args=(resolved_root, stop_event, ready_event),
-            name="file-indexer-watch",
+            name=self._name,
             daemon=True,
         )
 
@@ -60,7 +66,11 @@ class WatchController:
     def _watch_loop(self, root: Path, stop_event: Event, ready_event: Event) -> None:
         try:
             watcher = watch(
-                str(root), stop_event=stop_event, step=200, yield_on_timeout=True
+                str(root),
+                stop_event=stop_event,
+                debounce=self._debounce_ms,
+                step=min(200, self._debounce_ms),
+                yield_on_timeout=True,
             )
             ready_event.set()
             for changes in watcher:
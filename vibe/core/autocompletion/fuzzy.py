@@ -20,127 +20,119 @@ def fuzzy_match(pattern: str, text: str, text_lower: str | None = None) -> Match
 
     if text_lower is None:
         text_lower = text.lower()
-    return _find_best_match(pattern, pattern.lower(), text_lower, text)
+    best = _find_best_match(pattern, pattern.lower(), text_lower, text)
+    if best is None:
+        return MatchResult(matched=False, score=0.0, matched_indices=())
+    score, indices = best
+    return MatchResult(matched=True, score=score, matched_indices=indices)
+
+
+def fuzzy_score(pattern: str, text: str, text_lower: str | None = None) -> float | None:
+    """Score of ``fuzzy_match``, or ``None`` when it does not match."""
+    if not pattern:
+        return 0.0
+
+    if text_lower is None:
+        text_lower = text.lower()
+    best = _find_best_match(pattern, pattern.lower(), text_lower, text)
+    return best[0] if best is not None else None
 
 
 def _find_best_match(
     pattern_original: str, pattern_lower: str, text_lower: str, text_original: str
-) -> MatchResult:
+) -> tuple[float, tuple[int, ...]] | None:
     if len(pattern_lower) > len(text_lower):
-        return MatchResult(matched=False, score=0.0, matched_indices=())
+        return None
 
     if text_lower.startswith(pattern_lower):
         indices = tuple(range(len(pattern_lower)))
         score = _calculate_score(
             pattern_original, pattern_lower, text_lower, indices, text_original
         )
-        return MatchResult(
-            matched=True, score=score * PREFIX_MULTIPLIER, matched_indices=indices
-        )
+        return score * PREFIX_MULTIPLIER, indices
+
+    # The leftmost subsequence is also what the subsequence strategy finds,
+    # and str.find rejects most texts before the per-character scan below.
+    subsequence: list[int] = []
+    position = -1
+    for char in pattern_lower:
+        position = text_lower.find(char, position + 1)
+        if position == -1:
+            return None
+        subsequence.append(position)
+
+    boundary, consecutive = _scan_boundary_and_consecutive(
+        pattern_lower, text_lower, text_original, subsequence[0]
+    )
 
     best_score = -1.0
     best_indices: tuple[int, ...] = ()
-
-    for matcher in (
-        _try_word_boundary_match,
-        _try_consecutive_match,
-        _try_subsequence_match,
+    for indices, multiplier in (
+        (boundary, WORD_BOUNDARY_MULTIPLIER),
+        (consecutive, CONSECUTIVE_MULTIPLIER),
+        (subsequence, 1.0),
     ):
-        match = matcher(pattern_original, pattern_lower, text_lower, text_original)
-        if match.matched and match.score > best_score:
-            best_score = match.score
-            best_indices = match.matched_indices
-
-    if best_score >= 0:
-        return MatchResult(matched=True, score=best_score, matched_indices=best_indices)
-
-    return MatchResult(matched=False, score=0.0, matched_indices=())
-
-
-def _try_word_boundary_match(
-    pattern_original: str, pattern: str, text_lower: str, text_original: str
-) -> MatchResult:
-    indices: list[int] = []
-    pattern_idx = 0
-
-    for i, char in enumerate(text_lower):
-        if pattern_idx >= len(pattern):
-            break
-
-        is_boundary = (
-            i == 0
-            or text_lower[i - 1] in "/-_."
-            or (text_original[i].isupper() and not text_original[i - 1].isupper())
-        )
-
-        if char == pattern[pattern_idx]:
-            if is_boundary or (indices and i == indices[-1] + 1) or not indices:
-                indices.append(i)
-                pattern_idx += 1
-
-    if pattern_idx == len(pattern):
-        score = _calculate_score(
-            pattern_original, pattern, text_lower, tuple(indices), text_original
+        if indices is None:
+            continue
+        matched = tuple(indices)
+        score = multiplier * _calculate_score(
+            pattern_original, pattern_lower, text_lower, matched, text_original
         )
-        return MatchResult(
-            matched=True,
-            score=score * WORD_BOUNDARY_MULTIPLIER,
-            matched_indices=tuple(indices),
-        )
-
-    return MatchResult(matched=False, score=0.0, matched_indices=())
-
-
-def _try_consecutive_match(
-    pattern_original: str, pattern: str, text_lower: str, text_original: str
-) -> MatchResult:
-    indices: list[int] = []
-    pattern_idx = 0
-
-    for i, char in enumerate(text_lower):
-        if pattern_idx >= len(pattern):
+        if score > best_score:
+            best_score = score
+            best_indices = matched
+
+    return best_score, best_indices
+
+
+def _scan_boundary_and_consecutive(
+    pattern: str, text_lower: str, text_original: str, start: int
+) -> tuple[list[int] | None, list[int] | None]:
+    """Indices of the word-boundary and consecutive strategies, in one pass.
+
+    Both need ``pattern[0]`` first, so the scan starts at its first
+    occurrence. The consecutive strategy restarts after a mismatch without
+    re-testing that character against the start of the pattern.
+    """
+    size = len(pattern)
+    boundary: list[int] = []
+    consecutive: list[int] = []
+    for i in range(start, len(text_lower)):
+        boundary_done = len(boundary) == size
+        consecutive_done = len(consecutive) == size
+        if boundary_done and consecutive_done:
             break
 
-        if char == pattern[pattern_idx]:
-            indices.append(i)
-            pattern_idx += 1
-        elif indices:
-            indices.clear()
-            pattern_idx = 0
-
-    if pattern_idx == len(pattern):
-        score = _calculate_score(
-            pattern_original, pattern, text_lower, tuple(indices), text_original
-        )
-        return MatchResult(
-            matched=True,
-            score=score * CONSECUTIVE_MULTIPLIER,
-            matched_indices=tuple(indices),
-        )
-
-    return MatchResult(matched=False, score=0.0, matched_indices=())
-
+        char = text_lower[i]
+        if (
+            not boundary_done
+            and char == pattern[len(boundary)]
+            and (
+                not boundary
+                or i == boundary[-1] + 1
+                or _is_word_boundary(text_lower, text_original, i)
+            )
+        ):
+            boundary.append(i)
 
-def _try_subsequence_match(
-    pattern_original: str, pattern: str, text_lower: str, text_original: str
-) -> MatchResult:
-    indices: list[int] = []
-    pattern_idx = 0
+        if not consecutive_done:
+            if char == pattern[len(consecutive)]:
+                consecutive.append(i)
+            elif consecutive:
+                consecutive.clear()
 
-    for i, char in enumerate(text_lower):
-        if pattern_idx >= len(pattern):
-            break
-        if char == pattern[pattern_idx]:
-            indices.append(i)
-            pattern_idx += 1
+    return (
+        boundary if len(boundary) == size else None,
+        consecutive if len(consecutive) == size else None,
+    )
 
-    if pattern_idx == len(pattern):
-        score = _calculate_score(
-            pattern_original, pattern, text_lower, tuple(indices), text_original
-        )
-        return MatchResult(matched=True, score=score, matched_indices=tuple(indices))
 
-    return MatchResult(matched=False, score=0.0, matched_indices=())
+def _is_word_boundary(text_lower: str, text_original: str, i: int) -> bool:
+    return (
+        i == 0
+        or text_lower[i - 1] in "/-_."
+        or (text_original[i].isupper() and not text_original[i - 1].isupper())
+    )
 
 
 def _calculate_score(
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from vibe.core.autocompletion.file_indexer import IndexView
+from vibe.core.autocompletion.fuzzy import fuzzy_score
+
+
+class FuzzyPathScorer:
+    """Fuzzy matches a query against the paths of a file index.
+
+    Paths missing a character of the query are dropped on the index's packed
+    mask columns, before they are decoded. The paths that match are kept:
+    while the index is unchanged, a query that extends the previous one can
+    only match some of them, so typing one more character rescans just those.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._generation: int | None = None
+        self._pattern_lower = ""
+        self._survivors: list[tuple[str, str, bool]] = []
+
+    def match(
+        self, index: IndexView, pattern: str, required_mask: int | None
+    ) -> list[tuple[str, bool, float]]:
+        """``(rel, is_dir, score)`` of the matching paths, in index order."""
+        pattern_lower = pattern.lower()
+        candidates: Iterable[tuple[str, str, bool]]
+        if self._refines_previous(index, pattern_lower):
+            candidates = self._survivors
+        else:
+            candidates = (
+                (rel, rel.lower(), is_dir)
+                for rel, is_dir in index.paths(required_mask or 0, self._max_entries)
+            )
+
+        survivors: list[tuple[str, str, bool]] = []
+        matches: list[tuple[str, bool, float]] = []
+        for candidate in candidates:
+            rel, rel_lower, is_dir = candidate
+            score = fuzzy_score(pattern, rel, rel_lower)
+            if score is not None:
+                survivors.append(candidate)
+                matches.append((rel, is_dir, score))
+
+        self._generation = index.generation
+        self._pattern_lower = pattern_lower
+        self._survivors = survivors
+        return matches
+
+    def reset(self) -> None:
+        self._generation = None
+        self._pattern_lower = ""
+        self._survivors = []
+
+    def _refines_previous(self, index: IndexView, pattern_lower: str) -> bool:
+        return (
+            self._generation == index.generation
+            and bool(self._pattern_lower)
+            and pattern_lower.startswith(self._pattern_lower)
+        )
@@ -15,17 +15,31 @@ from vibe.core.compaction.manager import (
     CompactionManager,
     CompletionFn,
 )
+from vibe.core.compaction.pruning import (
+    PRUNE_KEEP_RECENT,
+    PRUNE_MIN_CHARS,
+    PRUNED_MARKER,
+    PrunedToolResult,
+    ToolResultPruner,
+    prune_tool_results,
+)
 
 __all__ = [
     "COMPACT_USER_MESSAGE_MAX_TOKENS",
+    "PRUNED_MARKER",
+    "PRUNE_KEEP_RECENT",
+    "PRUNE_MIN_CHARS",
     "CompactionFailedError",
     "CompactionFailureReason",
     "CompactionManager",
     "CompletionFn",
+    "PrunedToolResult",
+    "ToolResultPruner",
     "collect_prior_user_messages",
     "drop_oldest_round",
     "extract_summary",
     "parse_previous_user_messages",
+    "prune_tool_results",
     "render_compaction_context",
     "render_teleport_summary_request",
 ]
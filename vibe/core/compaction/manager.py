@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable, Sequence
+import contextlib
+from dataclasses import dataclass
+import hashlib
 from typing import TYPE_CHECKING, Literal, Protocol
 
 from vibe.core.compaction.context import (
@@ -9,6 +13,7 @@ from vibe.core.compaction.context import (
     extract_summary,
     render_compaction_context,
 )
+from vibe.core.logger import logger
 from vibe.core.prompts import UtilityPrompt
 from vibe.core.types import ContextTooLongError, LLMMessage, Role
 
@@ -47,9 +52,32 @@ class CompletionFn(Protocol):
         tools: list[AvailableTool] | None,
         tool_choice: StrToolChoice | AvailableTool | None,
         call_type: TelemetryCallType | None,
+        background: bool = False,
     ) -> LLMChunk: ...
 
 
+def _fingerprint(message: LLMMessage) -> bytes:
+    return hashlib.blake2b(message.model_dump_json().encode(), digest_size=16).digest()
+
+
+@dataclass
+class _Speculation:
+    """A summary of a frozen conversation prefix, generated in the background."""
+
+    fingerprints: list[bytes]
+    prior_user_messages: list[LLMMessage]
+    task: asyncio.Task[str | None]
+
+    def matches(self, messages: Sequence[LLMMessage]) -> bool:
+        # The system prompt is excluded: it is replaced, not summarized.
+        return len(messages) > len(self.fingerprints) and all(
+            _fingerprint(message) == fingerprint
+            for message, fingerprint in zip(
+                messages[1:], self.fingerprints, strict=False
+            )
+        )
+
+
 class CompactionManager:
     """Summarizes a conversation into a compact-context envelope.
 
@@ -58,6 +86,12 @@ class CompactionManager:
     messages — the live ``MessageList`` is only mutated by the final
     ``reset([system, envelope])`` on success, so a failure never leaves a
     partially trimmed conversation behind.
+
+    ``speculate`` summarizes the conversation so far in a background task,
+    before the threshold is reached. ``compact`` then swaps in
+    ``[system, envelope, tail]`` — the tail being the messages appended since —
+    as long as the summarized prefix is still unchanged; a rewind or edit
+    discards the speculative summary.
     """
 
     def __init__(
@@ -84,16 +118,60 @@ class CompactionManager:
         self._reset_session = reset_session
         self._telemetry = telemetry_client
         self._session_ids = session_ids
+        self._speculation: _Speculation | None = None
+        messages.on_reset(self.discard_speculation)
+
+    def speculate(self) -> None:
+        """Start summarizing the conversation so far in the background.
+
+        A no-op while a speculative summary of an unchanged prefix is pending
+        or ready.
+        """
+        snapshot = list(self._messages)
+        if self._speculation is not None:
+            if self._speculation.matches(snapshot):
+                return
+            self.discard_speculation()
+        if not snapshot[1:]:  # only the system prompt
+            return
+
+        summary_prefix = UtilityPrompt.COMPACT_SUMMARY_PREFIX.read()
+        self._speculation = _Speculation(
+            fingerprints=[_fingerprint(message) for message in snapshot[1:]],
+            prior_user_messages=collect_prior_user_messages(snapshot, summary_prefix),
+            task=asyncio.create_task(self._summarize_speculatively(snapshot)),
+        )
+
+    def discard_speculation(self) -> None:
+        if self._speculation is None:
+            return
+        self._speculation.task.cancel()
+        self._speculation = None
+
+    async def aclose(self) -> None:
+        if self._speculation is None:
+            return
+        task = self._speculation.task
+        self.discard_speculation()
+        with contextlib.suppress(BaseException):
+            await task
 
     async def compact(self, extra_instructions: str = "") -> str:
         summary_prefix = UtilityPrompt.COMPACT_SUMMARY_PREFIX.read()
         snapshot = list(self._messages)
-        prior_user_messages = collect_prior_user_messages(snapshot, summary_prefix)
 
-        summary = await self._summarize(snapshot, extra_instructions)
-        if summary is None:
-            # _summarize already reported the failure; substitute a placeholder.
-            summary = "(no summary available)"
+        if not extra_instructions and (
+            speculative := await self._take_speculation(snapshot)
+        ):
+            summary, prior_user_messages, tail = speculative
+        else:
+            self.discard_speculation()
+            prior_user_messages = collect_prior_user_messages(snapshot, summary_prefix)
+            summary = await self._summarize(snapshot, extra_instructions)
+            if summary is None:
+                # _summarize already reported the failure; substitute a placeholder.
+                summary = "(no summary available)"
+            tail = []
 
         system_message = snapshot[0]
         envelope = LLMMessage(
@@ -101,7 +179,7 @@ class CompactionManager:
             content=render_compaction_context(prior_user_messages, summary),
             injected=True,
         )
-        self._messages.reset([system_message, envelope])
+        self._messages.reset([system_message, envelope, *tail])
         await self._reset_session()
         # Context size is unknown without an API call; the next LLM turn
         # recomputes it accurately from real usage.
@@ -109,6 +187,41 @@ class CompactionManager:
         await self._save()
         return summary
 
+    async def _take_speculation(
+        self, snapshot: list[LLMMessage]
+    ) -> tuple[str, list[LLMMessage], list[LLMMessage]] | None:
+        # The speculative summary, the user messages it preserves and the tail
+        # kept verbatim; None when there is no usable speculative summary.
+        speculation = self._speculation
+        if speculation is None or not speculation.matches(snapshot):
+            return None
+        # A summary still in flight is awaited: it has a head start on a new one.
+        await asyncio.wait([speculation.task])
+        if self._speculation is not speculation:
+            return None
+        self._speculation = None
+        if speculation.task.cancelled() or speculation.task.exception() is not None:
+            return None
+        if (summary := speculation.task.result()) is None:
+            return None
+        tail = snapshot[len(speculation.fingerprints) + 1 :]
+        return summary, speculation.prior_user_messages, tail
+
+    async def _summarize_speculatively(self, snapshot: list[LLMMessage]) -> str | None:
+        # Failures are not reported: compaction at the threshold starts over
+        # and reports its own.
+        request = self._config().compaction_prompt
+        try:
+            summary, working, _ = await self._primary(
+                snapshot, request, background=True
+            )
+            if summary is None and not self._config().raise_on_compaction_failure:
+                summary = await self._fallback(working, request, background=True)
+        except Exception as e:
+            logger.debug("Speculative compaction failed: %s", e)
+            return None
+        return summary
+
     async def _summarize(
         self, snapshot: list[LLMMessage], extra_instructions: str
     ) -> str | None:
@@ -135,7 +248,7 @@ class CompactionManager:
         return None
 
     async def _primary(
-        self, snapshot: list[LLMMessage], request: str
+        self, snapshot: list[LLMMessage], request: str, *, background: bool = False
     ) -> tuple[str | None, list[LLMMessage], CompactionFailureReason | None]:
         # Cache-friendly: the request rides on the live conversation's token
         # prefix. Works on a local copy, so the live message list is untouched.
@@ -146,6 +259,7 @@ class CompactionManager:
             model=self._config().get_compaction_model(),
             tools=self._available_tools(),
             tool_choice=self._tool_choice(),
+            background=background,
         )
         if result.message.tool_calls:
             return None, working, "tool_call"
@@ -154,7 +268,9 @@ class CompactionManager:
             return None, working, "empty_summary"
         return summary, working, None
 
-    async def _fallback(self, history: list[LLMMessage], request: str) -> str | None:
+    async def _fallback(
+        self, history: list[LLMMessage], request: str, *, background: bool = False
+    ) -> str | None:
         # Dedicated summarizer call: fresh system prompt, no thinking, no tools.
         # Breaks the prompt cache on purpose — a reliable summary is worth it.
         model = (
@@ -175,6 +291,7 @@ class CompactionManager:
             model=model,
             tools=None,
             tool_choice=None,
+            background=background,
         )
         return extract_summary(result.message.content or "")
 
@@ -186,6 +303,7 @@ class CompactionManager:
         model: ModelConfig,
         tools: list[AvailableTool] | None,
         tool_choice: StrToolChoice | AvailableTool | None,
+        background: bool = False,
     ) -> tuple[LLMChunk, list[LLMMessage]]:
         # Summarize `working`; on overflow drop the oldest round and retry.
         # Returns the model result and the (possibly trimmed) history it used.
@@ -198,6 +316,7 @@ class CompactionManager:
                     tools=tools,
                     tool_choice=tool_choice,
                     call_type="secondary_call",
+                    background=background,
                 )
                 return result, working
             except ContextTooLongError:
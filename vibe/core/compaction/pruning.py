@@ -0,0 +1,154 @@
+"""Deterministic pruning of stale tool results.
+
+The cheap tier of compaction: no model call, only the bulk of old tool
+results is dropped. Each pruned result is replaced by a stub naming the
+call, the size of the output and, when the session is logged, the line of
+``messages.jsonl`` that still holds it, so the agent can read it back.
+
+The session log keeps the original results: the logger only appends, and
+pruning never touches the most recent messages it compares against.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+import hashlib
+import json
+from pathlib import Path
+
+from vibe.core.types import LLMMessage, MessageList, Role, ToolCall
+from vibe.core.utils.tokens import approx_token_count
+
+# The most recent tool results are always kept verbatim.
+PRUNE_KEEP_RECENT = 6
+# Results shorter than this are cheaper to keep than to re-fetch.
+PRUNE_MIN_CHARS = 2_000
+PRUNED_MARKER = "[Tool output pruned"
+_ARGS_SUMMARY_CHARS = 160
+_DEDUPED_TOOLS = frozenset({"read_file"})
+
+
+@dataclass(frozen=True)
+class PrunedToolResult:
+    index: int
+    message: LLMMessage
+    tokens_saved: int
+
+
+def _args_summary(call: ToolCall | None) -> str:
+    arguments = call.function.arguments if call and call.function else None
+    if not arguments:
+        return ""
+    if len(arguments) <= _ARGS_SUMMARY_CHARS:
+        return arguments
+    return arguments[: _ARGS_SUMMARY_CHARS - 1] + "…"
+
+
+def _read_key(name: str, call: ToolCall | None, content: str) -> tuple[str, ...]:
+    # Two reads are duplicates when they asked for the same range and got the
+    # same text back; a file edited in between yields a different digest.
+    arguments = call.function.arguments if call and call.function else None
+    try:
+        normalized = json.dumps(json.loads(arguments or "{}"), sort_keys=True)
+    except json.JSONDecodeError:
+        normalized = arguments or ""
+    digest = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+    return name, normalized, digest
+
+
+def _stub(
+    name: str, call: ToolCall | None, content: str, log_line: str | None, *, dup: bool
+) -> str:
+    size = len(content.encode())
+    head = f"{PRUNED_MARKER}: {name}({_args_summary(call)}) returned {size:,} bytes"
+    if dup:
+        return f"{head}, the same as a later call of the same range.]"
+    if log_line is None:
+        return f"{head}. Run the call again if you need it.]"
+    return f"{head}. The full output is {log_line}.]"
+
+
+def _log_lines(messages: Sequence[LLMMessage]) -> dict[int, int]:
+    # 1-based line of each non-system message in the session log.
+    lines: dict[int, int] = {}
+    for i, message in enumerate(messages):
+        if message.role != Role.system:
+            lines[i] = len(lines) + 1
+    return lines
+
+
+def prune_tool_results(
+    messages: Sequence[LLMMessage],
+    log_path: Path | None = None,
+    *,
+    keep_recent: int = PRUNE_KEEP_RECENT,
+    min_chars: int = PRUNE_MIN_CHARS,
+) -> list[PrunedToolResult]:
+    """Stubs for the tool results of ``messages`` worth pruning.
+
+    Results older than the ``keep_recent`` most recent ones and at least
+    ``min_chars`` long are pruned, as are ``read_file`` results repeated
+    verbatim by a later call. ``log_path`` is the session's
+    ``messages.jsonl``, whose lines are the non-system messages in order.
+    """
+    calls = {
+        call.id: call
+        for message in messages
+        if message.role == Role.assistant
+        for call in message.tool_calls or []
+        if call.id
+    }
+    tool_indexes = [i for i, m in enumerate(messages) if m.role == Role.tool]
+    recent = set(tool_indexes[-keep_recent:]) if keep_recent > 0 else set()
+    log_lines = _log_lines(messages)
+
+    pruned: list[PrunedToolResult] = []
+    seen_reads: set[tuple[str, ...]] = set()
+    for i in reversed(tool_indexes):
+        message = messages[i]
+        content = message.content or ""
+        if content.startswith(PRUNED_MARKER):
+            continue
+        name = message.name or "tool"
+        call = calls.get(message.tool_call_id or "")
+
+        dup = False
+        if name in _DEDUPED_TOOLS:
+            key = _read_key(name, call, content)
+            dup = key in seen_reads
+            seen_reads.add(key)
+        if not dup and (i in recent or len(content) < min_chars):
+            continue
+
+        log_line = f"line {log_lines[i]} of {log_path}" if log_path else None
+        stub = _stub(name, call, content, log_line, dup=dup)
+        saved = approx_token_count(content) - approx_token_count(stub)
+        if saved <= 0:
+            continue
+        pruned.append(
+            PrunedToolResult(
+                index=i,
+                message=message.model_copy(update={"content": stub}),
+                tokens_saved=saved,
+            )
+        )
+    pruned.reverse()
+    return pruned
+
+
+class ToolResultPruner:
+    """Applies ``prune_tool_results`` to the live conversation."""
+
+    def __init__(
+        self, messages: MessageList, log_path: Callable[[], Path | None]
+    ) -> None:
+        self._messages = messages
+        self._log_path = log_path
+
+    def prune(self) -> int:
+        """Prune stale tool results in place; returns the tokens saved."""
+        pruned = prune_tool_results(self._messages, self._log_path())
+        for result in pruned:
+            self._messages.replace(result.index, result.message)
+        return sum(result.tokens_saved for result in pruned)
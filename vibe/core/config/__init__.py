@@ -32,6 +32,7 @@ from vibe.core.config.models import (
     THINKING_LEVELS,
     ConnectorConfig,
     ExperimentsConfig,
+    HTTPPoolConfig,
     MCPHttp,
     MCPOAuth,
     MCPServer,
@@ -44,6 +45,7 @@ from vibe.core.config.models import (
     OtelSpanExporterConfig,
     ProjectContextConfig,
     ProviderConfig,
+    SessionDurability,
     SessionLoggingConfig,
     ThinkingLevel,
     TranscribeClient,
@@ -135,6 +137,7 @@ __all__ = [
     "DuplicateMergeMetadataError",
     "EmptyLayerError",
     "ExperimentsConfig",
+    "HTTPPoolConfig",
     "LayerConfigSnapshot",
     "LayerImplementationError",
     "LayerNotLoadedError",
@@ -156,6 +159,7 @@ __all__ = [
     "RawConfig",
     "RemoveOperationPatch",
     "ReplaceOperationPatch",
+    "SessionDurability",
     "SessionLoggingConfig",
     "TTSClient",
     "TTSModelConfig",
@@ -15,7 +15,8 @@ from vibe.core.config.layers.user import UserConfigLayer
 from vibe.core.config.orchestrator import ConfigOrchestrator
 from vibe.core.config.vibe_schema import VibeConfigSchema
 from vibe.core.paths import dedup_paths
-from vibe.core.utils import configure_ssl_context
+from vibe.core.session.durability import configure_session_durability
+from vibe.core.utils import HTTPPoolSettings, configure_http_pool, configure_ssl_context
 
 
 async def build_default_orchestrator(
@@ -60,6 +61,21 @@ async def build_default_orchestrator(
     configure_ssl_context(
         enable_system_trust_store=orchestrator.config.enable_system_trust_store
     )
+    pool = orchestrator.config.http_pool
+    configure_http_pool(
+        HTTPPoolSettings(
+            max_connections=pool.max_connections,
+            max_keepalive_connections=pool.max_keepalive_connections,
+            keepalive_expiry=pool.keepalive_expiry,
+            http2=pool.http2,
+        )
+    )
+    session_logging = orchestrator.config.session_logging
+    configure_session_durability(
+        session_logging.durability,
+        interval=session_logging.durability_batch_interval,
+        max_commits=session_logging.durability_batch_commits,
+    )
     migrate_agent_profile_files(_agent_profile_search_paths(orchestrator.config))
     return orchestrator
 
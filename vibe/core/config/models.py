@@ -51,10 +51,29 @@ class ExperimentsConfig(BaseSettings):
     client_key: str = "sdk-OE8yJgTXZY6tj"
 
 
+class HTTPPoolConfig(BaseSettings):
+    model_config = SettingsConfigDict(extra="ignore")
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    prewarm: bool = True
+
+
+SessionDurability = Literal["always", "batched", "os"]
+
+
 class SessionLoggingConfig(BaseSettings):
     save_dir: str = ""
     session_prefix: str = "session"
     enabled: bool = True
+    # When session appends are fsynced: every save, group-committed every
+    # `durability_batch_interval` seconds or `durability_batch_commits`
+    # appends, or left to the OS.
+    durability: SessionDurability = "always"
+    durability_batch_interval: float = 1.0
+    durability_batch_commits: int = 16
 
     @field_validator("save_dir", mode="before")
     @classmethod
@@ -33,6 +33,7 @@ from vibe.core.config.harness_files import get_harness_files_manager
 from vibe.core.config.models import (
     ConnectorConfig,
     ExperimentsConfig,
+    HTTPPoolConfig,
     MCPServer,
     MissingAPIKeyError,
     ModelConfig,
@@ -440,6 +441,12 @@ class VibeConfigSchema(ConfigSchema):
     narrator_enabled: Annotated[bool, WithReplaceMerge()] = False
     bypass_tool_permissions: Annotated[bool, WithReplaceMerge()] = False
     raise_on_compaction_failure: Annotated[bool, WithReplaceMerge()] = False
+    # Fraction of auto_compact_threshold past which compaction starts in the
+    # background, so the threshold swaps in a ready summary; 0 disables it.
+    speculative_compaction_watermark: Annotated[float, WithReplaceMerge()] = 0.7
+    # Fraction of auto_compact_threshold past which stale tool results are
+    # replaced by stubs before each turn, without a model call; 0 disables it.
+    tool_result_prune_watermark: Annotated[float, WithReplaceMerge()] = 0.5
     enable_telemetry: Annotated[bool, WithReplaceMerge()] = True
     system_prompt_id: Annotated[str, WithReplaceMerge()] = SystemPrompt.CLI
     compaction_prompt_id: Annotated[str, WithReplaceMerge()] = UtilityPrompt.COMPACT
@@ -455,6 +462,8 @@ class VibeConfigSchema(ConfigSchema):
     api_retry_max_elapsed_time: Annotated[float, WithReplaceMerge()] = (
         DEFAULT_API_RETRY_MAX_ELAPSED_TIME
     )
+    # Encode request bodies by splicing per-message JSON cached across turns.
+    splice_message_json: Annotated[bool, WithReplaceMerge()] = False
     vibe_base_url: Annotated[str, WithReplaceMerge()] = DEFAULT_VIBE_BASE_URL
     vibe_code_sessions_base_url: Annotated[str, WithReplaceMerge()] = (
         "https://chat.mistral.ai"
@@ -470,6 +479,9 @@ class VibeConfigSchema(ConfigSchema):
     experiments: Annotated[ExperimentsConfig, WithReplaceMerge()] = Field(
         default_factory=ExperimentsConfig
     )
+    http_pool: Annotated[HTTPPoolConfig, WithReplaceMerge()] = Field(
+        default_factory=HTTPPoolConfig
+    )
 
     def get_active_model(self) -> ModelConfig:
         if model := self.models.get(self.active_model):
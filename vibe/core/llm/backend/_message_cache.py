@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+import weakref
+
+from vibe.core.types import LLMMessage
+from vibe.core.utils import jsoncodec
+
+
+def _snapshot(msg: LLMMessage) -> tuple[tuple[Any, ...], tuple[int, ...]]:
+    # Field assignment on a pydantic model swaps the stored object, so comparing
+    # field values by identity catches edits without dumping the message. List
+    # elements are compared the same way, so replacing one in place is caught,
+    # and tool call arguments are tracked since hooks patch them in place.
+    # Mutating the fields of a nested element (an image, a display item) is
+    # not detected: reassign the element instead.
+    refs: list[Any] = [*msg.__dict__.values()]
+    refs.extend(msg.images or ())
+    refs.extend(msg.reasoning_state or ())
+    if (display := msg.user_display_content) is not None:
+        refs.extend(display.__dict__.values())
+        refs.extend(display.content)
+    for tc in msg.tool_calls or ():
+        refs.extend((tc.id, tc.function.name, tc.function.arguments))
+    sizes = (
+        len(msg.images or ()),
+        len(msg.tool_calls or ()),
+        len(msg.reasoning_state or ()),
+        len(display.content) if display is not None else 0,
+    )
+    return tuple(refs), sizes
+
+
+@dataclass(slots=True)
+class _Entry:
+    ref: weakref.ref[LLMMessage]
+    refs: tuple[Any, ...]
+    sizes: tuple[int, ...]
+    values: dict[Hashable, Any] = field(default_factory=dict)
+    fragments: dict[Hashable, bytes] = field(default_factory=dict)
+
+    def matches(self, refs: tuple[Any, ...], sizes: tuple[int, ...]) -> bool:
+        return (
+            sizes == self.sizes
+            and len(refs) == len(self.refs)
+            and all(a is b for a, b in zip(refs, self.refs, strict=True))
+        )
+
+
+class MessageCache:
+    """Per-message conversion results, reused across turns.
+
+    Entries are keyed by message identity and dropped when the message is
+    garbage collected or any of its fields is reassigned. ``key`` namespaces
+    conversions of the same message that depend on request options (reasoning
+    field name, whether reasoning is sent, ...). Converted values are shared
+    between requests and must not be mutated by callers.
+    """
+
+    def __init__(self, *, splice_json: bool = False) -> None:
+        self._entries: dict[int, _Entry] = {}
+        self.splice_json = splice_json
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _entry(self, msg: LLMMessage) -> _Entry:
+        msg_id = id(msg)
+        refs, sizes = _snapshot(msg)
+        entry = self._entries.get(msg_id)
+        if entry is not None and entry.ref() is msg and entry.matches(refs, sizes):
+            return entry
+
+        entries = self._entries
+
+        def evict(ref: weakref.ref[LLMMessage]) -> None:
+            current = entries.get(msg_id)
+            if current is not None and current.ref is ref:
+                del entries[msg_id]
+
+        entry = _Entry(weakref.ref(msg, evict), refs, sizes)
+        entries[msg_id] = entry
+        return entry
+
+    def convert[T](
+        self, msg: LLMMessage, key: Hashable, convert: Callable[[LLMMessage], T]
+    ) -> T:
+        entry = self._entry(msg)
+        if key not in entry.values:
+            entry.values[key] = convert(msg)
+        return entry.values[key]
+
+    def fragment(
+        self, msg: LLMMessage, key: Hashable, value: Any, *, spread: bool = False
+    ) -> bytes:
+        """Cached JSON for ``value``, the conversion of ``msg`` under ``key``.
+
+        With ``spread`` the value is a list of items contributed to the
+        enclosing array, and the fragment holds them without brackets.
+        """
+        entry = self._entry(msg)
+        if key not in entry.fragments:
+            encoded = jsoncodec.dumpb(value)
+            entry.fragments[key] = encoded[1:-1] if spread else encoded
+        return entry.fragments[key]
+
+
+def convert_messages(
+    cache: MessageCache | None,
+    messages: Sequence[LLMMessage],
+    key: Hashable,
+    convert: Callable[[LLMMessage], Any],
+) -> list[Any]:
+    if cache is None:
+        return [convert(msg) for msg in messages]
+    return [cache.convert(msg, key, convert) for msg in messages]
+
+
+def dumpb_payload(
+    payload: dict[str, Any],
+    cache: MessageCache | None,
+    *,
+    array_key: str,
+    key: Hashable,
+    messages: Sequence[LLMMessage],
+    converted: Sequence[Any],
+    spread: bool = False,
+) -> bytes:
+    """Encode a request body, splicing cached per-message JSON when enabled.
+
+    ``converted[i]`` is the conversion of ``messages[i]``; ``payload[array_key]``
+    must hold exactly those conversions (flattened when ``spread`` is set).
+    """
+    if cache is None or not cache.splice_json:
+        return jsoncodec.dumpb(payload)
+    fragments = [
+        cache.fragment(msg, key, value, spread=spread)
+        for msg, value in zip(messages, converted, strict=True)
+    ]
+    parts = [
+        jsoncodec.dumpb(name)
+        + b":"
+        + (
+            b"[" + b",".join(f for f in fragments if f) + b"]"
+            if name == array_key
+            else jsoncodec.dumpb(value)
+        )
+        for name, value in payload.items()
+    ]
+    return b"{" + b",".join(parts) + b"}"
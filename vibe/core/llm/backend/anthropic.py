@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 import json
 import re
 from typing import Any, ClassVar
 
 from vibe.core.config import ProviderConfig
 from vibe.core.llm.backend._image import to_base64 as _to_base64
+from vibe.core.llm.backend._message_cache import MessageCache
 from vibe.core.llm.backend.base import APIAdapter, PreparedRequest
 from vibe.core.types import (
     AvailableTool,
@@ -19,6 +20,7 @@ from vibe.core.types import (
     StrToolChoice,
     ToolCall,
 )
+from vibe.core.utils import jsoncodec
 
 
 def _parse_stop_info(reason: str | None, raw: Any) -> StopInfo | None:
@@ -32,39 +34,51 @@ class AnthropicMapper:
     """Shared mapper for converting messages to/from Anthropic API format."""
 
     def prepare_messages(
-        self, messages: Sequence[LLMMessage]
+        self, messages: Sequence[LLMMessage], message_cache: MessageCache | None = None
     ) -> tuple[str | None, list[dict[str, Any]]]:
         system_prompt: str | None = None
         converted: list[dict[str, Any]] = []
 
+        def convert(
+            msg: LLMMessage, fn: Callable[[LLMMessage], dict[str, Any]]
+        ) -> dict[str, Any]:
+            if message_cache is None:
+                return fn(msg)
+            return message_cache.convert(msg, "anthropic", fn)
+
         for msg in messages:
             match msg.role:
                 case Role.system:
                     system_prompt = msg.content or ""
                 case Role.user:
-                    user_content: list[dict[str, Any]] = []
-                    if msg.content:
-                        user_content.append({"type": "text", "text": msg.content})
-                    if msg.images:
-                        user_content.extend(
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": att.mime_type,
-                                    "data": _to_base64(att),
-                                },
-                            }
-                            for att in msg.images
-                        )
-                    converted.append({"role": "user", "content": user_content or ""})
+                    converted.append(convert(msg, self._convert_user_message))
                 case Role.assistant:
-                    converted.append(self._convert_assistant_message(msg))
+                    converted.append(convert(msg, self._convert_assistant_message))
                 case Role.tool:
-                    self._append_tool_result(converted, msg)
+                    self._append_tool_result(
+                        converted, convert(msg, self._convert_tool_result)
+                    )
 
         return system_prompt, converted
 
+    def _convert_user_message(self, msg: LLMMessage) -> dict[str, Any]:
+        user_content: list[dict[str, Any]] = []
+        if msg.content:
+            user_content.append({"type": "text", "text": msg.content})
+        if msg.images:
+            user_content.extend(
+                {
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": att.mime_type,
+                        "data": _to_base64(att),
+                    },
+                }
+                for att in msg.images
+            )
+        return {"role": "user", "content": user_content or ""}
+
     def _sanitize_tool_call_id(self, tool_id: str | None) -> str:
         return re.sub(r"[^a-zA-Z0-9_-]", "_", tool_id or "")
 
@@ -97,27 +111,28 @@ class AnthropicMapper:
             "input": tool_input,
         }
 
-    def _append_tool_result(
-        self, converted: list[dict[str, Any]], msg: LLMMessage
-    ) -> None:
-        tool_result = {
+    def _convert_tool_result(self, msg: LLMMessage) -> dict[str, Any]:
+        return {
             "type": "tool_result",
             "tool_use_id": self._sanitize_tool_call_id(msg.tool_call_id),
             "content": msg.content or "",
         }
 
+    def _append_tool_result(
+        self, converted: list[dict[str, Any]], tool_result: dict[str, Any]
+    ) -> None:
+        # Converted messages may be shared with the message cache, so merge into
+        # fresh containers instead of appending to the previous user message.
         if not converted or converted[-1]["role"] != "user":
             converted.append({"role": "user", "content": [tool_result]})
             return
 
         existing_content = converted[-1]["content"]
         if isinstance(existing_content, str):
-            converted[-1]["content"] = [
-                {"type": "text", "text": existing_content},
-                tool_result,
-            ]
+            content = [{"type": "text", "text": existing_content}, tool_result]
         else:
-            converted[-1]["content"].append(tool_result)
+            content = [*existing_content, tool_result]
+        converted[-1] = {**converted[-1], "content": content}
 
     def prepare_tools(
         self, tools: list[AvailableTool] | None
@@ -266,7 +281,14 @@ class AnthropicAdapter(APIAdapter):
             return
         last_block = content[-1]
         if last_block.get("type") in {"text", "image", "tool_result"}:
-            last_block["cache_control"] = {"type": "ephemeral"}
+            # Copy rather than mutate: the blocks may be cached across requests.
+            messages[-1] = {
+                **last_message,
+                "content": [
+                    *content[:-1],
+                    {**last_block, "cache_control": {"type": "ephemeral"}},
+                ],
+            }
 
     def _apply_thinking_config(
         self,
@@ -329,7 +351,7 @@ class AnthropicAdapter(APIAdapter):
 
         return payload
 
-    def prepare_request(
+    def prepare_request(  # noqa: PLR0913
         self,
         *,
         model_name: str,
@@ -342,8 +364,11 @@ class AnthropicAdapter(APIAdapter):
         provider: ProviderConfig,
         api_key: str | None = None,
         thinking: str = "off",
+        message_cache: MessageCache | None = None,
     ) -> PreparedRequest:
-        system_prompt, converted_messages = self._mapper.prepare_messages(messages)
+        system_prompt, converted_messages = self._mapper.prepare_messages(
+            messages, message_cache
+        )
         converted_tools = self._mapper.prepare_tools(tools)
         converted_tool_choice = self._mapper.prepare_tool_choice(tool_choice)
 
@@ -367,7 +392,7 @@ class AnthropicAdapter(APIAdapter):
         if api_key:
             headers["x-api-key"] = api_key
 
-        body = json.dumps(payload).encode("utf-8")
+        body = jsoncodec.dumpb(payload)
         return PreparedRequest(self.endpoint, headers, body)
 
     def parse_response(
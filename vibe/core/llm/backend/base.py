@@ -7,6 +7,7 @@ from vibe.core.types import AvailableTool, LLMChunk, LLMMessage, StrToolChoice
 
 if TYPE_CHECKING:
     from vibe.core.config import ProviderConfig
+    from vibe.core.llm.backend._message_cache import MessageCache
 
 
 class PreparedRequest(NamedTuple):
@@ -19,7 +20,7 @@ class PreparedRequest(NamedTuple):
 class APIAdapter(Protocol):
     endpoint: ClassVar[str]
 
-    def prepare_request(
+    def prepare_request(  # noqa: PLR0913
         self,
         *,
         model_name: str,
@@ -32,6 +33,7 @@ class APIAdapter(Protocol):
         provider: ProviderConfig,
         api_key: str | None = None,
         thinking: str = "off",
+        message_cache: MessageCache | None = None,
     ) -> PreparedRequest: ...
 
     def parse_response(
@@ -38,6 +38,7 @@ def create_backend(
     timeout: float = 720.0,
     retry_max_elapsed_time: float = 300.0,
     enable_otel: bool = False,
+    splice_message_json: bool = False,
 ) -> BackendLike:
     factory = BACKEND_FACTORY[provider.backend]
     if provider.backend == Backend.MISTRAL:
@@ -47,4 +48,6 @@ def create_backend(
             retry_max_elapsed_time=retry_max_elapsed_time,
             enable_otel=enable_otel,
         )
-    return factory(provider=provider, timeout=timeout)
+    return factory(
+        provider=provider, timeout=timeout, splice_message_json=splice_message_json
+    )
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator, Sequence
-import json
 import types
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
 
@@ -9,6 +8,11 @@ import httpx
 
 from vibe.core.config import resolve_api_key
 from vibe.core.llm.backend._image import to_data_uri as _to_data_uri
+from vibe.core.llm.backend._message_cache import (
+    MessageCache,
+    convert_messages,
+    dumpb_payload,
+)
 from vibe.core.llm.backend.anthropic import AnthropicAdapter
 from vibe.core.llm.backend.base import APIAdapter, PreparedRequest
 from vibe.core.llm.backend.openai_responses import OpenAIResponsesAdapter
@@ -22,9 +26,9 @@ from vibe.core.types import (
     Role,
     StrToolChoice,
 )
-from vibe.core.utils import async_generator_retry, async_retry
-from vibe.core.utils.http import VibeAsyncHTTPClient, build_ssl_context
-from vibe.core.utils.sse import iter_sse_lines
+from vibe.core.utils import async_generator_retry, async_retry, jsoncodec
+from vibe.core.utils.http import VibeAsyncHTTPClient, http_pool
+from vibe.core.utils.sse import iter_sse_events
 
 if TYPE_CHECKING:
     from vibe.core.config import ModelConfig, ProviderConfig
@@ -97,7 +101,26 @@ class OpenAIAdapter(APIAdapter):
         msg_dict["content"] = parts
         return msg_dict
 
-    def prepare_request(
+    def _convert_message(self, msg: LLMMessage, field_name: str) -> dict[str, Any]:
+        return self._user_with_images_to_parts(
+            self._reasoning_to_api(
+                msg.model_dump(
+                    exclude_none=True,
+                    exclude={
+                        "message_id",
+                        "reasoning_message_id",
+                        "reasoning_state",
+                        "injected",
+                        "images",
+                        "user_display_content",
+                    },
+                ),
+                field_name,
+            ),
+            msg,
+        )
+
+    def prepare_request(  # noqa: PLR0913
         self,
         *,
         model_name: str,
@@ -110,28 +133,16 @@ class OpenAIAdapter(APIAdapter):
         provider: ProviderConfig,
         api_key: str | None = None,
         thinking: str = "off",
+        message_cache: MessageCache | None = None,
     ) -> PreparedRequest:
         field_name = provider.reasoning_field_name
-        converted_messages = [
-            self._user_with_images_to_parts(
-                self._reasoning_to_api(
-                    msg.model_dump(
-                        exclude_none=True,
-                        exclude={
-                            "message_id",
-                            "reasoning_message_id",
-                            "reasoning_state",
-                            "injected",
-                            "images",
-                            "user_display_content",
-                        },
-                    ),
-                    field_name,
-                ),
-                msg,
-            )
-            for msg in messages
-        ]
+        cache_key = ("openai", field_name)
+        converted_messages = convert_messages(
+            message_cache,
+            messages,
+            cache_key,
+            lambda msg: self._convert_message(msg, field_name),
+        )
 
         payload = self.build_payload(
             model_name, converted_messages, temperature, tools, max_tokens, tool_choice
@@ -145,7 +156,14 @@ class OpenAIAdapter(APIAdapter):
             payload["stream_options"] = stream_options
 
         headers = self.build_headers(api_key)
-        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        body = dumpb_payload(
+            payload,
+            message_cache,
+            array_key="messages",
+            key=cache_key,
+            messages=messages,
+            converted=converted_messages,
+        )
 
         return PreparedRequest(self.endpoint, headers, body)
 
@@ -212,6 +230,32 @@ def _get_adapter(api_style: str) -> APIAdapter:
     return _ADAPTERS[api_style]
 
 
+def _decode_event_data(data: str) -> tuple[list[Any], bool]:
+    """Decode the JSON payloads of an SSE event; the flag marks ``[DONE]``.
+
+    An event normally carries one document, possibly split over several
+    ``data:`` lines. Some providers send one document per ``data:`` line with
+    no blank line in between, so when the joined lines do not parse they are
+    decoded one by one.
+    """
+    if data.strip() == "[DONE]":
+        return [], True
+    try:
+        return [jsoncodec.loads(data)], False
+    except jsoncodec.JSONDecodeError:
+        if "\n" not in data:
+            raise
+
+    payloads: list[Any] = []
+    for line in data.split("\n"):
+        if not (line := line.strip()):
+            continue
+        if line == "[DONE]":
+            return payloads, True
+        payloads.append(jsoncodec.loads(line))
+    return payloads, False
+
+
 class GenericBackend:
     def __init__(
         self,
@@ -219,23 +263,25 @@ class GenericBackend:
         client: VibeAsyncHTTPClient | None = None,
         provider: ProviderConfig,
         timeout: float = 720.0,
+        splice_message_json: bool = False,
     ) -> None:
         """Initialize the backend.
 
         Args:
             client: Optional Vibe HTTP client to use. If not provided, one will be created.
+            splice_message_json: Build request bodies from per-message JSON
+                cached across turns instead of encoding the whole payload.
         """
         self._client = client
         self._owns_client = client is None
         self._provider = provider
         self._timeout = timeout
+        self._message_cache = MessageCache(splice_json=splice_message_json)
 
     async def __aenter__(self) -> GenericBackend:
         if self._client is None:
             self._client = VibeAsyncHTTPClient(
-                timeout=httpx.Timeout(self._timeout),
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-                verify=build_ssl_context(),
+                timeout=httpx.Timeout(self._timeout), transport=http_pool.transport()
             )
         return self
 
@@ -252,9 +298,7 @@ class GenericBackend:
     def _get_client(self) -> VibeAsyncHTTPClient:
         if self._client is None:
             self._client = VibeAsyncHTTPClient(
-                timeout=httpx.Timeout(self._timeout),
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-                verify=build_ssl_context(),
+                timeout=httpx.Timeout(self._timeout), transport=http_pool.transport()
             )
             self._owns_client = True
         return self._client
@@ -287,6 +331,7 @@ class GenericBackend:
             provider=self._provider,
             api_key=api_key,
             thinking=model.thinking,
+            message_cache=self._message_cache,
         )
 
         headers = req.headers
@@ -352,6 +397,7 @@ class GenericBackend:
             provider=self._provider,
             api_key=api_key,
             thinking=model.thinking,
+            message_cache=self._message_cache,
         )
 
         headers = req.headers
@@ -402,7 +448,7 @@ class GenericBackend:
         response.raise_for_status()
 
         response_headers = dict(response.headers.items())
-        response_body = response.json()
+        response_body = jsoncodec.loads(response.content)
         return self.HTTPResponse(response_body, response_headers)
 
     @async_generator_retry(tries=3)
@@ -416,29 +462,24 @@ class GenericBackend:
             if not response.is_success:
                 await response.aread()
             response.raise_for_status()
-            async for line in iter_sse_lines(response):
-                if line.strip() == "":
-                    continue
-
-                if line.startswith(":"):
-                    continue
-
-                DELIM_CHAR = ":"
-                if f"{DELIM_CHAR} " not in line:
-                    raise ValueError(
-                        f"Stream chunk improperly formatted. "
-                        f"Expected `key{DELIM_CHAR} value`, received `{line}`"
-                    )
-                delim_index = line.find(DELIM_CHAR)
-                key = line[0:delim_index]
-                value = line[delim_index + 2 :]
-
-                if key != "data":
-                    # This might be the case with openrouter, so we just ignore it
-                    continue
-                if value.strip() == "[DONE]":
+            # Non-data fields (which some providers such as openrouter add) only
+            # annotate the event; the payload always comes from `data:` lines.
+            async for event in iter_sse_events(response, strict=True):
+                payloads, done = _decode_event_data(event.data)
+                for payload in payloads:
+                    yield payload
+                if done:
                     return
-                yield json.loads(value.strip())
+
+    def clear_message_cache(self) -> None:
+        self._message_cache.clear()
+
+    async def prewarm(self) -> float | None:
+        """Warm the shared pool for the provider; see ``HTTPPoolRegistry.prewarm``."""
+        if not self._owns_client:
+            # Injected clients do not draw from the shared pool.
+            return None
+        return await http_pool.prewarm(self._provider.api_base)
 
     async def close(self) -> None:
         if self._owns_client and self._client:
@@ -35,6 +35,7 @@ from mistralai.extra.observability.telemetry import configure_telemetry
 
 from vibe.core.config import resolve_api_key
 from vibe.core.llm.backend._image import to_data_uri as _to_data_uri
+from vibe.core.llm.backend._message_cache import MessageCache, convert_messages
 from vibe.core.llm.exceptions import BackendErrorBuilder
 from vibe.core.types import (
     AvailableTool,
@@ -48,7 +49,7 @@ from vibe.core.types import (
     ToolCall,
 )
 from vibe.core.utils import get_server_url_from_api_base
-from vibe.core.utils.http import VibeAsyncHTTPClient, build_ssl_context
+from vibe.core.utils.http import VibeAsyncHTTPClient, http_pool
 
 if TYPE_CHECKING:
     from vibe.core.config import ModelConfig, ProviderConfig
@@ -209,6 +210,7 @@ class MistralBackend:
         self._provider = provider
         self._enable_otel = enable_otel
         self._mapper = MistralMapper()
+        self._message_cache = MessageCache()
         self._api_key = resolve_api_key(self._provider.api_key_env_var)
 
         reasoning_field = getattr(provider, "reasoning_field_name", "reasoning_content")
@@ -272,7 +274,7 @@ class MistralBackend:
 
     def _create_mistral_client(self) -> Mistral:
         self._http_client = VibeAsyncHTTPClient(
-            verify=build_ssl_context(), follow_redirects=True
+            transport=http_pool.transport(), follow_redirects=True
         )
         client = Mistral(
             api_key=self._api_key,
@@ -290,6 +292,26 @@ class MistralBackend:
             self._client = self._create_mistral_client()
         return self._client
 
+    def _prepare_messages(
+        self, messages: Sequence[LLMMessage], model: ModelConfig
+    ) -> list[ChatCompletionRequestMessage]:
+        include_reasoning_content = model.thinking != "off"
+        return convert_messages(
+            self._message_cache,
+            messages,
+            ("mistral", include_reasoning_content),
+            lambda msg: self._mapper.prepare_message(
+                msg, include_reasoning_content=include_reasoning_content
+            ),
+        )
+
+    def clear_message_cache(self) -> None:
+        self._message_cache.clear()
+
+    async def prewarm(self) -> float | None:
+        """Warm the shared pool for the provider; see ``HTTPPoolRegistry.prewarm``."""
+        return await http_pool.prewarm(self._server_url)
+
     async def complete(
         self,
         *,
@@ -308,12 +330,7 @@ class MistralBackend:
                 temperature = 1.0
             response = await self._get_client().chat.complete_async(
                 model=model.name,
-                messages=[
-                    self._mapper.prepare_message(
-                        msg, include_reasoning_content=model.thinking != "off"
-                    )
-                    for msg in messages
-                ],
+                messages=self._prepare_messages(messages, model),
                 temperature=temperature,
                 tools=[self._mapper.prepare_tool(tool) for tool in tools]
                 if tools
@@ -392,12 +409,7 @@ class MistralBackend:
 
             stream = await self._get_client().chat.stream_async(
                 model=model.name,
-                messages=[
-                    self._mapper.prepare_message(
-                        msg, include_reasoning_content=model.thinking != "off"
-                    )
-                    for msg in messages
-                ],
+                messages=self._prepare_messages(messages, model),
                 temperature=temperature,
                 tools=[self._mapper.prepare_tool(tool) for tool in tools]
                 if tools
@@ -2,13 +2,17 @@ from __future__ import annotations
 
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
-import json
 import logging
 from typing import TYPE_CHECKING, Any, ClassVar, TypedDict, cast
 
 from pydantic import TypeAdapter
 
 from vibe.core.llm.backend._image import to_data_uri as _to_data_uri
+from vibe.core.llm.backend._message_cache import (
+    MessageCache,
+    convert_messages,
+    dumpb_payload,
+)
 from vibe.core.llm.backend.base import APIAdapter, PreparedRequest
 from vibe.core.types import (
     AvailableTool,
@@ -426,59 +430,54 @@ class OpenAIResponsesAdapter(APIAdapter):
             return "xhigh"
         return thinking
 
-    def _convert_messages(self, messages: Sequence[LLMMessage]) -> list[dict[str, Any]]:
-        input_items: list[dict[str, Any]] = []
-
-        for msg in messages:
-            match msg.role:
-                case Role.system:
-                    input_items.append({"role": "system", "content": msg.content or ""})
-
-                case Role.user:
-                    if msg.images:
-                        parts: list[dict[str, Any]] = []
-                        if msg.content:
-                            parts.append({"type": "input_text", "text": msg.content})
-                        parts.extend(
-                            {"type": "input_image", "image_url": _to_data_uri(att)}
-                            for att in msg.images
-                        )
-                        input_items.append({"role": "user", "content": parts})
-                    else:
-                        input_items.append({
-                            "role": "user",
-                            "content": msg.content or "",
-                        })
-
-                case Role.assistant:
-                    for encrypted_content in msg.reasoning_state or []:
-                        input_items.append({
-                            "type": "reasoning",
-                            "encrypted_content": encrypted_content,
-                        })
-                    input_items.append({
-                        "role": "assistant",
-                        "content": [{"type": "output_text", "text": msg.content or ""}],
-                    })
-                    for tc in msg.tool_calls or []:
-                        input_items.append({
-                            "type": "function_call",
-                            "call_id": tc.id or "",
-                            "name": tc.function.name or "",
-                            "arguments": tc.function.arguments or "",
-                        })
-
-                case Role.tool:
-                    input_items.append({
+    def _convert_message(self, msg: LLMMessage) -> list[dict[str, Any]]:
+        match msg.role:
+            case Role.system:
+                return [{"role": "system", "content": msg.content or ""}]
+
+            case Role.user:
+                if msg.images:
+                    parts: list[dict[str, Any]] = []
+                    if msg.content:
+                        parts.append({"type": "input_text", "text": msg.content})
+                    parts.extend(
+                        {"type": "input_image", "image_url": _to_data_uri(att)}
+                        for att in msg.images
+                    )
+                    return [{"role": "user", "content": parts}]
+                return [{"role": "user", "content": msg.content or ""}]
+
+            case Role.assistant:
+                items: list[dict[str, Any]] = [
+                    {"type": "reasoning", "encrypted_content": encrypted_content}
+                    for encrypted_content in msg.reasoning_state or []
+                ]
+                items.append({
+                    "role": "assistant",
+                    "content": [{"type": "output_text", "text": msg.content or ""}],
+                })
+                items.extend(
+                    {
+                        "type": "function_call",
+                        "call_id": tc.id or "",
+                        "name": tc.function.name or "",
+                        "arguments": tc.function.arguments or "",
+                    }
+                    for tc in msg.tool_calls or []
+                )
+                return items
+
+            case Role.tool:
+                return [
+                    {
                         "type": "function_call_output",
                         "call_id": msg.tool_call_id or "",
                         "output": msg.content or "",
-                    })
-
-                case _:
-                    raise ValueError(f"Unsupported role: {msg.role}")
+                    }
+                ]
 
-        return input_items
+            case _:
+                raise ValueError(f"Unsupported role: {msg.role}")
 
     def _convert_tool_for_responses(self, tool: AvailableTool) -> dict[str, Any]:
         return {
@@ -538,7 +537,7 @@ class OpenAIResponsesAdapter(APIAdapter):
             headers["Authorization"] = f"Bearer {api_key}"
         return headers
 
-    def prepare_request(
+    def prepare_request(  # noqa: PLR0913
         self,
         *,
         model_name: str,
@@ -551,8 +550,12 @@ class OpenAIResponsesAdapter(APIAdapter):
         provider: ProviderConfig,
         api_key: str | None = None,
         thinking: str = "off",
+        message_cache: MessageCache | None = None,
     ) -> PreparedRequest:
-        input_items = self._convert_messages(messages)
+        converted_messages = convert_messages(
+            message_cache, messages, "responses", self._convert_message
+        )
+        input_items = [item for items in converted_messages for item in items]
 
         payload = self.build_payload(
             model_name=model_name,
@@ -566,7 +569,15 @@ class OpenAIResponsesAdapter(APIAdapter):
         )
 
         headers = self.build_headers(api_key)
-        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        body = dumpb_payload(
+            payload,
+            message_cache,
+            array_key="input",
+            key="responses",
+            messages=messages,
+            converted=converted_messages,
+            spread=True,
+        )
 
         return PreparedRequest(self.endpoint, headers, body)
 
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-import json
 from typing import Any, ClassVar
 
 from vibe.core.config import ProviderConfig
 from vibe.core.llm.backend._image import to_data_uri as _to_data_uri
+from vibe.core.llm.backend._message_cache import (
+    MessageCache,
+    convert_messages,
+    dumpb_payload,
+)
 from vibe.core.llm.backend.base import APIAdapter, PreparedRequest
 from vibe.core.types import (
     AvailableTool,
@@ -116,7 +120,7 @@ class ReasoningAdapter(APIAdapter):
 
         return payload
 
-    def prepare_request(
+    def prepare_request(  # noqa: PLR0913
         self,
         *,
         model_name: str,
@@ -129,8 +133,11 @@ class ReasoningAdapter(APIAdapter):
         provider: ProviderConfig,
         api_key: str | None = None,
         thinking: str = "off",
+        message_cache: MessageCache | None = None,
     ) -> PreparedRequest:
-        converted_messages = [self._convert_message(msg) for msg in messages]
+        converted_messages = convert_messages(
+            message_cache, messages, "reasoning", self._convert_message
+        )
 
         payload = self._build_payload(
             model_name=model_name,
@@ -153,7 +160,14 @@ class ReasoningAdapter(APIAdapter):
         if api_key:
             headers["Authorization"] = f"Bearer {api_key}"
 
-        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        body = dumpb_payload(
+            payload,
+            message_cache,
+            array_key="messages",
+            key="reasoning",
+            messages=messages,
+            converted=converted_messages,
+        )
         return PreparedRequest(self.endpoint, headers, body)
 
     @staticmethod
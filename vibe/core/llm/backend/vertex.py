@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-import json
 import threading
 from typing import Any, ClassVar
 
@@ -10,9 +9,11 @@ import google.auth.credentials
 from google.auth.transport.requests import Request
 
 from vibe.core.config import ProviderConfig
+from vibe.core.llm.backend._message_cache import MessageCache
 from vibe.core.llm.backend.anthropic import AnthropicAdapter
 from vibe.core.llm.backend.base import PreparedRequest
 from vibe.core.types import AvailableTool, LLMMessage, StrToolChoice
+from vibe.core.utils import jsoncodec
 
 
 def build_vertex_base_url(region: str) -> str:
@@ -64,7 +65,7 @@ class VertexAnthropicAdapter(AnthropicAdapter):
         super().__init__()
         self.credentials = VertexCredentials()
 
-    def prepare_request(
+    def prepare_request(  # noqa: PLR0913
         self,
         *,
         model_name: str,
@@ -77,6 +78,7 @@ class VertexAnthropicAdapter(AnthropicAdapter):
         provider: ProviderConfig,
         api_key: str | None = None,
         thinking: str = "off",
+        message_cache: MessageCache | None = None,
     ) -> PreparedRequest:
         project_id = provider.project_id
         region = provider.region
@@ -86,7 +88,9 @@ class VertexAnthropicAdapter(AnthropicAdapter):
         if not region:
             raise ValueError("region is required in provider config for Vertex AI")
 
-        system_prompt, converted_messages = self._mapper.prepare_messages(messages)
+        system_prompt, converted_messages = self._mapper.prepare_messages(
+            messages, message_cache
+        )
         converted_tools = self._mapper.prepare_tools(tools)
         converted_tool_choice = self._mapper.prepare_tool_choice(tool_choice)
 
@@ -126,5 +130,5 @@ class VertexAnthropicAdapter(AnthropicAdapter):
         )
         base_url = build_vertex_base_url(region)
 
-        body = json.dumps(payload).encode("utf-8")
+        body = jsoncodec.dumpb(payload)
         return PreparedRequest(endpoint, headers, body, base_url=base_url)
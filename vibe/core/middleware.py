@@ -30,6 +30,8 @@ class ConversationContext:
     messages: MessageList
     stats: AgentStats
     config: VibeConfigSchema
+    # Estimated prompt size of the next request; 0 when unknown.
+    projected_tokens: int = 0
 
 
 @dataclass
@@ -98,11 +100,34 @@ class TokenLimitMiddleware:
 
 
 class AutoCompactMiddleware:
+    def __init__(
+        self,
+        speculate: Callable[[], None] | None = None,
+        prune: Callable[[], int] | None = None,
+    ) -> None:
+        # Called on every turn past the speculative watermark, to start
+        # compacting in the background before the threshold is reached.
+        self.speculate = speculate
+        # Called on every turn past the pruning watermark but below the
+        # speculative one: pruning edits the prefix a speculation summarizes.
+        self.prune = prune
+
     async def before_turn(self, context: ConversationContext) -> MiddlewareResult:
         threshold = context.config.get_active_model().auto_compact_threshold
+        if threshold <= 0:
+            return MiddlewareResult()
 
-        if threshold > 0 and context.stats.context_tokens >= threshold:
+        # The projection counts messages added since the last response, such
+        # as tool results, and drops pruned ones; usage lags a turn behind.
+        tokens = context.projected_tokens or context.stats.context_tokens
+        if tokens >= threshold:
             return MiddlewareResult(action=MiddlewareAction.COMPACT)
+        speculative = context.config.speculative_compaction_watermark
+        pruning = context.config.tool_result_prune_watermark
+        if self.speculate is not None and 0 < speculative * threshold <= tokens:
+            self.speculate()
+        elif self.prune is not None and 0 < pruning * threshold <= tokens:
+            self.prune()
         return MiddlewareResult()
 
     def reset(self, reset_reason: ResetReason = ResetReason.STOP) -> None:
@@ -10,12 +10,14 @@ from vibe.core.paths._vibe_home import (
     CACHE_FILE,
     CONNECTOR_BOOTSTRAP_CACHE_FILE,
     DEFAULT_TOOL_DIR,
+    FILE_INDEX_DIR,
     GLOBAL_ENV_FILE,
     HISTORY_FILE,
     LOG_DIR,
     LOG_FILE,
     PLANS_DIR,
     PROJECTS_FILE,
+    SEARCH_INDEX_DIR,
     SESSION_LOG_DIR,
     TRUSTED_FOLDERS_FILE,
     VIBE_HOME,
@@ -30,12 +32,14 @@ __all__ = [
     "CACHE_FILE",
     "CONNECTOR_BOOTSTRAP_CACHE_FILE",
     "DEFAULT_TOOL_DIR",
+    "FILE_INDEX_DIR",
     "GLOBAL_ENV_FILE",
     "HISTORY_FILE",
     "LOG_DIR",
     "LOG_FILE",
     "PLANS_DIR",
     "PROJECTS_FILE",
+    "SEARCH_INDEX_DIR",
     "SESSION_LOG_DIR",
     "TRUSTED_FOLDERS_FILE",
     "VIBE_HOME",
@@ -39,5 +39,7 @@ CONNECTOR_BOOTSTRAP_CACHE_FILE = GlobalPath(
 )
 HISTORY_FILE = GlobalPath(lambda: VIBE_HOME.path / "vibehistory")
 PLANS_DIR = GlobalPath(lambda: VIBE_HOME.path / "plans")
+SEARCH_INDEX_DIR = GlobalPath(lambda: VIBE_HOME.path / "cache" / "search-index")
+FILE_INDEX_DIR = GlobalPath(lambda: VIBE_HOME.path / "cache" / "file-index")
 
 DEFAULT_TOOL_DIR = GlobalPath(lambda: VIBE_ROOT / "core" / "tools" / "builtins")
@@ -18,7 +18,7 @@ from vibe.core.teleport.types import (
     TeleportPushResponseEvent,
 )
 from vibe.core.types import AssistantEvent, LLMMessage, OutputFormat, Role
-from vibe.core.utils import ConversationLimitException
+from vibe.core.utils import ConversationLimitException, http_pool
 
 __all__ = ["TeleportError", "run_programmatic"]
 
@@ -103,5 +103,6 @@ def run_programmatic(  # noqa: PLR0913, PLR0917
             agent_loop.emit_session_closed_telemetry()
             await agent_loop.aclose()
             await agent_loop.telemetry_client.aclose()
+            await http_pool.aclose()
 
     return asyncio.run(_async_run())
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from vibe.core.search.query import trigram_query
+from vibe.core.search.trigram_index import (
+    TrigramIndex,
+    close_search_indexes,
+    search_index_cache_path,
+    shared_search_index,
+)
+
+__all__ = [
+    "TrigramIndex",
+    "close_search_indexes",
+    "search_index_cache_path",
+    "shared_search_index",
+    "trigram_query",
+]
@@ -0,0 +1,203 @@
+"""Trigrams a regex match must contain.
+
+The analysis is conservative: it only keeps literal runs that every match of
+a branch contains, and gives up (returns ``None``) on syntax it does not
+model, so an index filtered with the result never drops a matching file.
+Literals are case-folded to ASCII lowercase, like the indexed content, and
+runs are cut at non-ASCII characters whose case variants the index does not
+fold.
+"""
+
+from __future__ import annotations
+
+TRIGRAM_LENGTH = 3
+
+# Single-letter escapes that match one character (or none) and are safe to
+# skip. Any other letter or digit escape (\x41, \p{L}, backreferences) is
+# not modelled.
+_CLASS_ESCAPES = frozenset("dDwWsSbBAzZntrfva")
+# Punctuation escapes that are anchors rather than literals in GNU grep
+# (and in ripgrep for \< and \>).
+_ANCHOR_ESCAPES = frozenset("<>`'")
+_QUANTIFIER_SUFFIXES = "?+"
+
+
+def encode_trigram(a: int, b: int, c: int) -> int:
+    return (a << 16) | (b << 8) | c
+
+
+def literal_trigrams(text: bytes) -> set[int]:
+    """Trigrams of ``text``, case-folded to ASCII lowercase."""
+    folded = text.lower()
+    return {
+        encode_trigram(a, b, c)
+        for a, b, c in set(zip(folded, folded[1:], folded[2:], strict=False))
+    }
+
+
+def _skip_class(pattern: str, i: int) -> int | None:
+    """Index after the character class opening at ``pattern[i]``."""
+    i += 1
+    if pattern[i : i + 1] == "^":
+        i += 1
+    if pattern[i : i + 1] == "]":
+        i += 1
+    depth = 1
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return None
+
+
+def _skip_group(pattern: str, i: int) -> int | None:
+    """Index after the group opening at ``pattern[i]``."""
+    depth = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "[":
+            end = _skip_class(pattern, i)
+            if end is None:
+                return None
+            i = end
+            continue
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return None
+
+
+def _skip_quantifier(pattern: str, i: int) -> int | None:
+    """Index after the quantifier at ``pattern[i]`` and its lazy suffix."""
+    if pattern[i] == "{":
+        end = pattern.find("}", i)
+        if end == -1:
+            return None
+        i = end
+    i += 1
+    if pattern[i : i + 1] and pattern[i] in _QUANTIFIER_SUFFIXES:
+        i += 1
+    return i
+
+
+def _branch_runs(branch: str) -> list[str] | None:  # noqa: PLR0911, PLR0912
+    runs: list[str] = []
+    current: list[str] = []
+
+    def cut() -> None:
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    i = 0
+    while i < len(branch):
+        ch = branch[i]
+        if ch == "\\":
+            escaped = branch[i + 1 : i + 2]
+            if not escaped:
+                return None
+            if escaped in _ANCHOR_ESCAPES:
+                cut()
+            elif escaped.isascii() and escaped.isalnum():
+                if escaped not in _CLASS_ESCAPES:
+                    return None
+                cut()
+            else:
+                current.append(escaped)
+            i += 2
+            continue
+        if ch in "*?{":
+            # The preceding atom may repeat zero times.
+            if current:
+                current.pop()
+            cut()
+            end = _skip_quantifier(branch, i)
+            if end is None:
+                return None
+            i = end
+            continue
+        if ch == "+":
+            cut()
+            end = _skip_quantifier(branch, i)
+            if end is None:
+                return None
+            i = end
+            continue
+        if ch in "([":
+            cut()
+            end = (_skip_group if ch == "(" else _skip_class)(branch, i)
+            if end is None:
+                return None
+            i = end
+            continue
+        if ch in ")]":
+            return None
+        if ch in ".^$" or not ch.isascii():
+            cut()
+        else:
+            current.append(ch)
+        i += 1
+    cut()
+    return runs
+
+
+def _top_level_branches(pattern: str) -> list[str] | None:
+    branches: list[str] = []
+    start = i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch in "([":
+            end = (_skip_group if ch == "(" else _skip_class)(pattern, i)
+            if end is None:
+                return None
+            i = end
+            continue
+        if ch == "|":
+            branches.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    branches.append(pattern[start:])
+    return branches
+
+
+def trigram_query(pattern: str) -> list[frozenset[int]] | None:
+    """Trigram sets of which every match contains at least one in full.
+
+    Each set belongs to one top-level alternative. Returns ``None`` when some
+    alternative has no trigram every match must contain, so the pattern
+    cannot narrow the search.
+    """
+    branches = _top_level_branches(pattern)
+    if branches is None:
+        return None
+    query: list[frozenset[int]] = []
+    for branch in branches:
+        runs = _branch_runs(branch)
+        if runs is None:
+            return None
+        trigrams: set[int] = set()
+        for run in runs:
+            if len(run) >= TRIGRAM_LENGTH:
+                trigrams |= literal_trigrams(run.encode())
+        if not trigrams:
+            return None
+        query.append(frozenset(trigrams))
+    return query
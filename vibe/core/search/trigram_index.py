@@ -0,0 +1,497 @@
+"""Trigram index of a project's files, for narrowing regex searches.
+
+Each indexed file gets an id, and every trigram of its case-folded content a
+posting list of the ids containing it. A search looks up the trigrams its
+pattern requires (see ``trigram_query``) and only hands the surviving files
+to the regex engine.
+
+The file set comes from ``FileIndexStore``'s walk and ``IgnoreRules`` built
+from the caller's exclude patterns plus the root ``.gitignore``. Files larger
+than ``max_file_bytes`` or unreadable ones are not indexed and are always
+candidates; binary files never are. A ``WatchController`` applies changes as
+they happen, and the index is saved on close and reconciled against the tree
+(stat first, re-reading only changed files) when it is loaded again.
+
+Removed files leave their id in the posting lists; they are filtered out at
+query time and dropped once they outnumber the live files.
+"""
+
+from __future__ import annotations
+
+from array import array
+import atexit
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import stat
+import struct
+import tempfile
+from threading import Event, Lock, RLock
+
+from vibe.core.autocompletion.file_indexer.ignore_rules import IgnoreRules
+from vibe.core.autocompletion.file_indexer.store import FileIndexStats, FileIndexStore
+from vibe.core.autocompletion.file_indexer.watcher import Change, WatchController
+from vibe.core.logger import logger
+from vibe.core.paths import SEARCH_INDEX_DIR
+from vibe.core.search.query import literal_trigrams, trigram_query
+from vibe.core.utils import jsoncodec
+
+MAX_INDEXED_FILE_BYTES = 1024 * 1024
+# Changes are applied once the tree has been quiet this long, so a file the
+# agent just wrote is searchable by its next tool call.
+WATCH_DEBOUNCE_MS = 50
+# Re-walk the tree rather than apply more changes than this one by one.
+MASS_CHANGE_THRESHOLD = 200
+# Drop removed ids from the posting lists once there are this many and they
+# outnumber the live files.
+COMPACT_MIN_DEAD = 1_000
+
+_BINARY_SNIFF_BYTES = 8192
+# File ids of files that are not in the posting lists.
+_ALWAYS_SEARCH = -1
+_NEVER_MATCHES = -2
+# Sparse posting lists are probed by bisection instead of scanned.
+_BISECT_RATIO = 16
+
+_CACHE_MAGIC = b"VTRI"
+_CACHE_VERSION = 1
+_HEADER = struct.Struct("<4sII")  # magic, version, metadata length
+_POSTING = struct.Struct("<II")  # trigram, number of ids
+
+
+@dataclass(slots=True)
+class _FileRecord:
+    file_id: int
+    mtime_ns: int
+    size: int
+
+
+def _contains(ids: array[int], file_id: int) -> bool:
+    i = bisect_left(ids, file_id)
+    return i < len(ids) and ids[i] == file_id
+
+
+def _ignore_rules(exclude_patterns: Sequence[str]) -> IgnoreRules:
+    # An empty list would select IgnoreRules' own defaults; the search never
+    # looks inside .git either.
+    return IgnoreRules(
+        [(pattern, True) for pattern in exclude_patterns] or [(".git/", True)]
+    )
+
+
+class TrigramIndex:
+    def __init__(
+        self,
+        root: Path,
+        exclude_patterns: Sequence[str],
+        *,
+        cache_path: Path | None = None,
+        watch: bool = True,
+        max_file_bytes: int = MAX_INDEXED_FILE_BYTES,
+    ) -> None:
+        self.root = root.resolve()
+        self.exclude_patterns = tuple(exclude_patterns)
+        self._cache_path = cache_path
+        self._max_file_bytes = max_file_bytes
+        self._ignore_rules = _ignore_rules(self.exclude_patterns)
+        self._store = FileIndexStore(self._ignore_rules, FileIndexStats())
+
+        self._lock = RLock()  # guards the structures below for queries.
+        # Held for whole updates (builds, watch batches), which read files
+        # outside _lock and must not interleave.
+        self._update_lock = RLock()
+        self._files: dict[str, _FileRecord] = {}
+        self._paths: list[str | None] = []  # by file id; None once removed.
+        self._postings: dict[int, array[int]] = {}
+        self._always_search: set[str] = set()
+        self._dead = 0
+
+        self._ready = Event()
+        self._cancel = Event()
+        self._watcher = (
+            WatchController(
+                self._handle_watch_changes,
+                debounce_ms=WATCH_DEBOUNCE_MS,
+                name="search-index-watch",
+            )
+            if watch
+            else None
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="search-index"
+        )
+
+    @property
+    def is_current(self) -> bool:
+        """Whether the index is built and kept up to date with the tree."""
+        return self._ready.is_set() and (
+            self._watcher is None or self._watcher.is_watching
+        )
+
+    @property
+    def file_count(self) -> int:
+        return len(self._files)
+
+    def start(self) -> None:
+        """Build in the background; changes are watched from the start."""
+        if self._watcher is not None:
+            self._watcher.start(self.root)
+        try:
+            self._executor.submit(self._build_in_background)
+        except RuntimeError:
+            pass  # closed
+
+    def build(self) -> None:
+        """Load the saved index, bring it up to date with the tree and save it."""
+        self._load()
+        self._reconcile()
+        if self._cancel.is_set():
+            return
+        self._ready.set()
+        self.save()
+
+    def close(self) -> None:
+        self._cancel.set()
+        if self._watcher is not None:
+            self._watcher.stop()
+        self._executor.shutdown(wait=True)
+        if self._ready.is_set():
+            self.save()
+
+    def candidates(
+        self,
+        pattern: str,
+        under: Path | None = None,
+        *,
+        skip_hidden: bool = False,
+        limit: int | None = None,
+    ) -> list[Path] | None:
+        """Files under ``under`` that may contain a match for ``pattern``.
+
+        Returns ``None`` when the index cannot narrow the search: it is not
+        current, ``under`` is outside the root, the pattern requires no
+        trigram, or more than ``limit`` files qualify.
+        """
+        if not self.is_current:
+            return None
+        query = trigram_query(pattern)
+        if query is None:
+            return None
+        prefix = ""
+        if under is not None:
+            try:
+                prefix = under.resolve().relative_to(self.root).as_posix()
+            except ValueError:
+                return None
+            prefix = "" if prefix == "." else f"{prefix}/"
+
+        with self._lock:
+            ids: set[int] = set()
+            for trigrams in query:
+                ids |= self._lookup(trigrams)
+            rels = [rel for i in ids if (rel := self._paths[i]) is not None]
+            rels.extend(self._always_search)
+
+        rels = [
+            rel
+            for rel in rels
+            if rel.startswith(prefix)
+            and not (skip_hidden and any(p.startswith(".") for p in rel.split("/")))
+        ]
+        if limit is not None and len(rels) > limit:
+            return None
+        return [self.root / rel for rel in sorted(rels)]
+
+    def save(self) -> None:
+        if self._cache_path is None:
+            return
+        with self._update_lock:
+            metadata = jsoncodec.dumpb({
+                "root": str(self.root),
+                "exclude_patterns": list(self.exclude_patterns),
+                "paths": self._paths,
+                "files": {
+                    rel: [record.file_id, record.mtime_ns, record.size]
+                    for rel, record in self._files.items()
+                },
+            })
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = None
+            try:
+                with tempfile.NamedTemporaryFile(
+                    mode="wb",
+                    suffix=".tmp",
+                    dir=str(self._cache_path.parent),
+                    delete=False,
+                ) as f:
+                    temp_path = Path(f.name)
+                    f.write(_HEADER.pack(_CACHE_MAGIC, _CACHE_VERSION, len(metadata)))
+                    f.write(metadata)
+                    for trigram, file_ids in self._postings.items():
+                        f.write(_POSTING.pack(trigram, len(file_ids)))
+                        f.write(file_ids.tobytes())
+                os.replace(temp_path, self._cache_path)
+            except OSError as exc:
+                logger.debug("Could not save search index: %s", exc)
+            finally:
+                if temp_path and temp_path.exists():
+                    temp_path.unlink()
+
+    def _build_in_background(self) -> None:
+        try:
+            self.build()
+        except Exception as exc:
+            logger.warning("Search index build failed for %s: %s", self.root, exc)
+
+    def _lookup(self, trigrams: Iterable[int]) -> set[int]:
+        postings: list[array[int]] = []
+        for trigram in trigrams:
+            if (file_ids := self._postings.get(trigram)) is None:
+                return set()
+            postings.append(file_ids)
+        postings.sort(key=len)
+        result = set(postings[0])
+        for file_ids in postings[1:]:
+            if not result:
+                break
+            if len(result) * _BISECT_RATIO < len(file_ids):
+                result = {i for i in result if _contains(file_ids, i)}
+            else:
+                result.intersection_update(file_ids)
+        return result
+
+    def _reconcile(self) -> None:
+        with self._update_lock:
+            self._store.rebuild(self.root, should_cancel=self._cancel.is_set)
+            entries = self._store.snapshot()
+            self._store.clear()
+            if self._cancel.is_set():
+                return
+            seen: set[str] = set()
+            for entry in entries:
+                if self._cancel.is_set():
+                    return
+                if not entry.is_dir:
+                    seen.add(entry.rel)
+                    self._refresh_file(entry.rel, entry.path)
+            for rel in self._files.keys() - seen:
+                self._remove_file(rel)
+            self._compact_if_needed()
+
+    def _refresh_file(self, rel: str, path: Path, *, force: bool = False) -> None:
+        try:
+            st = os.lstat(path)
+        except OSError:
+            self._remove_file(rel)
+            return
+        if not stat.S_ISREG(st.st_mode):
+            # Symlinks are not followed by the search either.
+            self._remove_file(rel)
+            return
+        record = self._files.get(rel)
+        if (
+            not force
+            and record is not None
+            and (record.mtime_ns, record.size) == (st.st_mtime_ns, st.st_size)
+        ):
+            return
+
+        trigrams: set[int] | None = None
+        file_id = _ALWAYS_SEARCH
+        if st.st_size <= self._max_file_bytes:
+            try:
+                data = path.read_bytes()
+            except OSError:
+                data = None
+            if data is not None and b"\0" in data[:_BINARY_SNIFF_BYTES]:
+                file_id = _NEVER_MATCHES
+            elif data is not None:
+                trigrams = literal_trigrams(data)
+
+        with self._lock:
+            self._forget(self._files.pop(rel, None), rel)
+            if trigrams is not None:
+                file_id = len(self._paths)
+                self._paths.append(rel)
+                for trigram in trigrams:
+                    file_ids = self._postings.get(trigram)
+                    if file_ids is None:
+                        file_ids = self._postings[trigram] = array("I")
+                    file_ids.append(file_id)
+            elif file_id == _ALWAYS_SEARCH:
+                self._always_search.add(rel)
+            self._files[rel] = _FileRecord(file_id, st.st_mtime_ns, st.st_size)
+
+    def _remove_file(self, rel: str) -> None:
+        with self._lock:
+            self._forget(self._files.pop(rel, None), rel)
+
+    def _forget(self, record: _FileRecord | None, rel: str) -> None:
+        if record is None:
+            return
+        if record.file_id >= 0:
+            self._paths[record.file_id] = None
+            self._dead += 1
+        self._always_search.discard(rel)
+
+    def _compact_if_needed(self) -> None:
+        if self._dead < COMPACT_MIN_DEAD or self._dead < len(self._files):
+            return
+        # Writers hold _update_lock, so the lists can be filtered outside
+        # _lock while queries keep using the current ones.
+        paths = self._paths
+        postings: dict[int, array[int]] = {}
+        for trigram, file_ids in self._postings.items():
+            kept = array("I", [i for i in file_ids if paths[i] is not None])
+            if kept:
+                postings[trigram] = kept
+        with self._lock:
+            self._postings = postings
+            self._dead = 0
+
+    def _is_ignored(self, rel: str) -> bool:
+        parts = rel.split("/")
+        return any(
+            self._ignore_rules.should_ignore(
+                "/".join(parts[: i + 1]), part, i < len(parts) - 1
+            )
+            for i, part in enumerate(parts)
+        )
+
+    def _handle_watch_changes(
+        self, root: Path, raw_changes: Iterable[tuple[Change, str]]
+    ) -> None:
+        changes = list(raw_changes)
+        # A running build holds the lock; the batch is applied after it.
+        with self._update_lock:
+            if self._cancel.is_set():
+                return
+            if len(changes) > MASS_CHANGE_THRESHOLD or not self._apply_changes(changes):
+                self._reconcile()
+            else:
+                self._compact_if_needed()
+
+    def _apply_changes(self, changes: list[tuple[Change, str]]) -> bool:
+        """Apply file changes; ``False`` when the tree must be walked again."""
+        for change, path_str in changes:
+            path = Path(path_str)
+            try:
+                rel = path.relative_to(self.root).as_posix()
+            except ValueError:
+                continue
+            if rel == ".gitignore":
+                self._ignore_rules.reset()
+                return False
+            if change == Change.deleted:
+                if rel in self._files:
+                    self._remove_file(rel)
+                else:
+                    prefix = f"{rel}/"
+                    for child in [r for r in self._files if r.startswith(prefix)]:
+                        self._remove_file(child)
+                continue
+            if path.is_dir():
+                return False
+            if not self._is_ignored(rel):
+                self._refresh_file(rel, path, force=True)
+        return True
+
+    def _load(self) -> None:
+        if self._cache_path is None:
+            return
+        try:
+            data = self._cache_path.read_bytes()
+            self._decode(memoryview(data))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError, struct.error) as exc:
+            logger.debug("Ignoring unreadable search index: %s", exc)
+            with self._lock:
+                self._files, self._paths, self._postings = {}, [], {}
+                self._always_search = set()
+
+    def _decode(self, data: memoryview) -> None:
+        magic, version, metadata_size = _HEADER.unpack_from(data)
+        if magic != _CACHE_MAGIC or version != _CACHE_VERSION:
+            raise ValueError("unknown search index format")
+        offset = _HEADER.size
+        try:
+            metadata = jsoncodec.loads(bytes(data[offset : offset + metadata_size]))
+        except json.JSONDecodeError as exc:
+            raise ValueError(str(exc)) from exc
+        offset += metadata_size
+        if metadata["root"] != str(self.root) or tuple(
+            metadata["exclude_patterns"]
+        ) != (self.exclude_patterns):
+            raise ValueError("search index of another tree")
+
+        postings: dict[int, array[int]] = {}
+        while offset < len(data):
+            trigram, count = _POSTING.unpack_from(data, offset)
+            offset += _POSTING.size
+            file_ids = array("I")
+            end = offset + count * file_ids.itemsize
+            if end > len(data):
+                raise ValueError("truncated search index")
+            file_ids.frombytes(data[offset:end])
+            postings[trigram] = file_ids
+            offset = end
+
+        files = {
+            rel: _FileRecord(int(file_id), int(mtime_ns), int(size))
+            for rel, (file_id, mtime_ns, size) in metadata["files"].items()
+        }
+        paths: list[str | None] = list(metadata["paths"])
+        with self._lock:
+            self._files = files
+            self._paths = paths
+            self._postings = postings
+            self._always_search = {
+                rel for rel, record in files.items() if record.file_id == _ALWAYS_SEARCH
+            }
+            self._dead = sum(1 for rel in paths if rel is None)
+
+
+_indexes: dict[Path, TrigramIndex] = {}
+_indexes_lock = Lock()
+
+
+def search_index_cache_path(root: Path, exclude_patterns: Sequence[str]) -> Path:
+    key = "\0".join([str(root), *exclude_patterns]).encode()
+    digest = hashlib.blake2b(key, digest_size=16).hexdigest()
+    return SEARCH_INDEX_DIR.path / f"{digest}.idx"
+
+
+def shared_search_index(root: Path, exclude_patterns: Sequence[str]) -> TrigramIndex:
+    """The process-wide index of ``root``, built in the background on first use."""
+    resolved = root.resolve()
+    patterns = tuple(exclude_patterns)
+    with _indexes_lock:
+        index = _indexes.get(resolved)
+        if index is not None and index.exclude_patterns == patterns:
+            return index
+        stale = index
+        index = TrigramIndex(
+            resolved, patterns, cache_path=search_index_cache_path(resolved, patterns)
+        )
+        _indexes[resolved] = index
+    if stale is not None:
+        stale.close()
+    index.start()
+    return index
+
+
+def close_search_indexes() -> None:
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+        _indexes.clear()
+    for index in indexes:
+        index.close()
+
+
+atexit.register(close_search_indexes)
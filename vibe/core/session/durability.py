@@ -0,0 +1,164 @@
+"""When session files are fsynced.
+
+- ``always``: every append is fsynced before the save returns.
+- ``batched``: appends are group-committed by a background thread, after
+  ``interval`` seconds or ``max_commits`` appends, whichever comes first,
+  and on exit or termination signals. A crash loses at most one batch.
+- ``os``: nothing is fsynced; the OS writes pages back on its own schedule.
+
+Atomic replacements (the metadata header, blobs and rewritten message logs)
+are rare, and an unsynced temp file renamed over the original can leave an
+empty file after a crash, so they are fsynced in every mode but ``os``.
+"""
+
+from __future__ import annotations
+
+import atexit
+from collections.abc import Callable
+import contextlib
+import os
+import signal
+import threading
+from types import FrameType
+from typing import IO, Any
+
+from vibe.core.config.models import SessionDurability
+
+_FLUSH_SIGNALS = tuple(
+    sig
+    for name in ("SIGTERM", "SIGHUP")
+    if isinstance(sig := getattr(signal, name, None), signal.Signals)
+)
+
+
+def _fsync_path(path: str) -> None:
+    # The file may have been replaced or removed since it was written.
+    with contextlib.suppress(OSError):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class DurabilityPolicy:
+    def __init__(self) -> None:
+        self._mode: SessionDurability = "always"
+        self._interval = 1.0
+        self._max_commits = 16
+        self._pending: set[str] = set()
+        self._commits = 0
+        self._cond = threading.Condition()
+        # Held for a whole flush, so a flush on exit waits for the writer's.
+        self._flush_lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        self._hooks_installed = False
+
+    @property
+    def mode(self) -> SessionDurability:
+        return self._mode
+
+    def configure(
+        self, mode: SessionDurability, *, interval: float = 1.0, max_commits: int = 16
+    ) -> None:
+        with self._cond:
+            self._mode = mode
+            self._interval = interval
+            self._max_commits = max(1, max_commits)
+            self._cond.notify_all()
+        if mode == "batched":
+            self._start_writer()
+        else:
+            self.flush()
+
+    def sync(self, f: IO[Any]) -> None:
+        """Make an append to ``f`` durable according to the mode.
+
+        ``f`` must be flushed already and opened by path.
+        """
+        match self._mode:
+            case "always":
+                os.fsync(f.fileno())
+            case "batched":
+                with self._cond:
+                    self._pending.add(str(f.name))
+                    self._commits += 1
+                    if self._commits >= self._max_commits:
+                        self._cond.notify_all()
+            case "os":
+                pass
+
+    def sync_replacement(self, f: IO[Any]) -> None:
+        """Make a temp file durable before it is renamed over the original."""
+        if self._mode != "os":
+            os.fsync(f.fileno())
+
+    def flush(self) -> None:
+        """Fsync every append still waiting for a group commit."""
+        with self._flush_lock:
+            with self._cond:
+                pending, self._pending = self._pending, set()
+                self._commits = 0
+            for path in sorted(pending):
+                _fsync_path(path)
+
+    def _start_writer(self) -> None:
+        self._install_exit_hooks()
+        with self._cond:
+            if self._writer is not None and self._writer.is_alive():
+                return
+            self._writer = threading.Thread(
+                target=self._run_writer, name="session-group-commit", daemon=True
+            )
+            self._writer.start()
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: (
+                        self._mode != "batched" or self._commits >= self._max_commits
+                    ),
+                    timeout=self._interval,
+                )
+                if self._mode != "batched":
+                    self._writer = None
+                    return
+            self.flush()
+
+    def _install_exit_hooks(self) -> None:
+        if self._hooks_installed:
+            return
+        self._hooks_installed = True
+        atexit.register(self.flush)
+        # Signal handlers can only be installed from the main thread.
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for sig in _FLUSH_SIGNALS:
+            previous = signal.getsignal(sig)
+            if previous is signal.SIG_IGN:
+                continue
+            signal.signal(sig, self._signal_handler(sig, previous))
+
+    def _signal_handler(
+        self, sig: signal.Signals, previous: Any
+    ) -> Callable[[int, FrameType | None], None]:
+        def handle(signum: int, frame: FrameType | None) -> None:
+            self.flush()
+            if callable(previous):
+                previous(signum, frame)
+                return
+            # Re-deliver with the default action (terminate).
+            signal.signal(sig, signal.SIG_DFL)
+            os.kill(os.getpid(), sig)
+
+        return handle
+
+
+session_durability = DurabilityPolicy()
+
+
+def configure_session_durability(
+    mode: SessionDurability, *, interval: float = 1.0, max_commits: int = 16
+) -> None:
+    session_durability.configure(mode, interval=interval, max_commits=max_commits)
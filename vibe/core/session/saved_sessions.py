@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 from pathlib import Path
 import shutil
@@ -8,9 +9,10 @@ from typing import Any
 
 from vibe.core.config import SessionLoggingConfig
 from vibe.core.session import last_session_pointer
-from vibe.core.session.session_loader import METADATA_FILENAME, SessionLoader
+from vibe.core.session.session_catalog import remove_entries, update_entry
+from vibe.core.session.session_loader import SessionLoader
 from vibe.core.session.session_logger import SessionLogger
-from vibe.core.utils.io import read_safe
+from vibe.core.session.session_store import read_metadata
 
 
 def _normalize_session_title(title: str) -> str:
@@ -38,7 +40,7 @@ def _find_saved_session_dir(
         session_id, session_config
     ):
         try:
-            metadata = _load_raw_metadata(session_dir)
+            metadata = read_metadata(session_dir, resolve_blobs=False)
         except (OSError, ValueError, json.JSONDecodeError):
             continue
 
@@ -48,24 +50,17 @@ def _find_saved_session_dir(
     return None
 
 
-def _load_raw_metadata(session_dir: Path) -> dict[str, Any]:
-    metadata_path = session_dir / METADATA_FILENAME
-    metadata = json.loads(read_safe(metadata_path).text)
-    if not isinstance(metadata, dict):
-        raise ValueError(f"Session metadata must be an object: {metadata_path}")
-
-    return metadata
-
-
 async def update_saved_session_title_at_path(
     session_dir: Path, title: str
 ) -> dict[str, Any]:
     normalized_title = _normalize_session_title(title)
-    metadata = _load_raw_metadata(session_dir)
+    metadata = read_metadata(session_dir, resolve_blobs=False)
 
-    updated_metadata = {**metadata, "title": normalized_title, "title_source": "manual"}
-    await SessionLogger.persist_metadata(updated_metadata, session_dir)
-    return updated_metadata
+    record = {"title": normalized_title, "title_source": "manual"}
+    await SessionLogger.append_metadata(record, session_dir)
+    with contextlib.suppress(OSError):
+        update_entry(session_dir, title=normalized_title)
+    return {**metadata, **record}
 
 
 async def update_saved_session_title(
@@ -84,4 +79,6 @@ async def delete_saved_session(
         return
 
     await asyncio.to_thread(shutil.rmtree, session_dir)
+    with contextlib.suppress(OSError):
+        remove_entries(session_dir.parent, [session_dir.name])
     last_session_pointer.clear_matching(session_config, session_id)
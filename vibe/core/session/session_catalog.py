@@ -0,0 +1,152 @@
+"""Index of the sessions in a save directory.
+
+``.catalog.jsonl`` sits next to the session directories and holds one
+record per line, keyed by session directory name. Records fold like the
+metadata journal: later records overwrite the keys they carry, and a
+``deleted`` record drops the session. Writers only append, so concurrent
+processes can share it; readers compact it once it has grown well past
+the number of live sessions.
+
+The catalog is a cache of the sessions' own metadata. Directories it does
+not know about are indexed by ``SessionLoader`` on the next read, and
+entries whose directory is gone are dropped, so a missing or stale catalog
+repairs itself.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import Any, TypedDict
+
+from vibe.core.session.durability import session_durability
+from vibe.core.utils import jsoncodec
+from vibe.core.utils.io import read_safe
+
+CATALOG_FILENAME = ".catalog.jsonl"
+# Compact once the catalog holds this many more records than live sessions.
+CATALOG_COMPACT_SLACK = 256
+
+
+class CatalogEntry(TypedDict):
+    session_id: str
+    cwd: str
+    title: str | None
+    end_time: str | None
+    total_messages: int
+
+
+def catalog_entry(metadata: dict[str, Any]) -> CatalogEntry | None:
+    """Build an entry from session metadata, or ``None`` if it has no id."""
+    environment = metadata.get("environment") or {}
+    return _entry_from_fields({
+        **metadata,
+        "cwd": environment.get("working_directory") or "",
+    })
+
+
+def _catalog_path(save_dir: Path) -> Path:
+    return save_dir / CATALOG_FILENAME
+
+
+def _append(save_dir: Path, records: list[dict[str, Any]]) -> None:
+    if not records:
+        return
+    with _catalog_path(save_dir).open("ab") as f:
+        f.write(b"".join(jsoncodec.dumpb(record) + b"\n" for record in records))
+        f.flush()
+        session_durability.sync(f)
+
+
+def record_entry(session_dir: Path, entry: CatalogEntry) -> None:
+    _append(session_dir.parent, [{"dir": session_dir.name, **entry}])
+
+
+def record_entries(save_dir: Path, entries: dict[str, CatalogEntry]) -> None:
+    _append(save_dir, [{"dir": name, **entry} for name, entry in entries.items()])
+
+
+def update_entry(session_dir: Path, **fields: Any) -> None:
+    _append(session_dir.parent, [{"dir": session_dir.name, **fields}])
+
+
+def remove_entries(save_dir: Path, names: list[str]) -> None:
+    _append(save_dir, [{"dir": name, "deleted": True} for name in names])
+
+
+def _entry_from_fields(fields: dict[str, Any]) -> CatalogEntry | None:
+    session_id = fields.get("session_id")
+    if not isinstance(session_id, str) or not session_id:
+        return None
+    if not isinstance(fields.get("cwd"), str):
+        return None
+    total_messages = fields.get("total_messages")
+    return {
+        "session_id": session_id,
+        "cwd": fields["cwd"],
+        "title": fields.get("title"),
+        "end_time": fields.get("end_time"),
+        "total_messages": total_messages if isinstance(total_messages, int) else 0,
+    }
+
+
+def read_catalog(save_dir: Path) -> tuple[dict[str, CatalogEntry], int] | None:
+    """Fold the catalog into entries by directory name.
+
+    Returns the entries and the number of records read, or ``None`` when
+    there is no catalog yet. Entries left incomplete by a lost record are
+    dropped, so the reader indexes their directory again.
+    """
+    path = _catalog_path(save_dir)
+    if not path.is_file():
+        return None
+
+    folded: dict[str, dict[str, Any]] = {}
+    records = 0
+    for line in read_safe(path).text.splitlines():
+        try:
+            record = jsoncodec.loads(line)
+        except json.JSONDecodeError:
+            # A torn append; other writers may have appended after it.
+            continue
+        if not isinstance(record, dict) or not isinstance(
+            name := record.pop("dir", None), str
+        ):
+            continue
+        records += 1
+        if record.get("deleted"):
+            folded.pop(name, None)
+        else:
+            folded.setdefault(name, {}).update(record)
+
+    entries: dict[str, CatalogEntry] = {}
+    for name, fields in folded.items():
+        if (entry := _entry_from_fields(fields)) is not None:
+            entries[name] = entry
+    return entries, records
+
+
+def needs_compaction(entries: dict[str, CatalogEntry], records: int) -> bool:
+    return records > len(entries) + CATALOG_COMPACT_SLACK
+
+
+def write_catalog(save_dir: Path, entries: dict[str, CatalogEntry]) -> None:
+    """Replace the catalog with one record per entry."""
+    path = _catalog_path(save_dir)
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="wb", suffix=".json.tmp", dir=str(save_dir), delete=False
+        ) as f:
+            temp_path = Path(f.name)
+            for name, entry in entries.items():
+                f.write(jsoncodec.dumpb({"dir": name, **entry}) + b"\n")
+            f.flush()
+            session_durability.sync_replacement(f)
+
+        os.replace(temp_path, str(path))
+    finally:
+        if temp_path and temp_path.exists() and temp_path.is_file():
+            temp_path.unlink()
@@ -1,20 +1,39 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import UTC, datetime
+import itertools
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypedDict
 
+from vibe.core.session.session_catalog import (
+    CatalogEntry,
+    catalog_entry,
+    needs_compaction,
+    read_catalog,
+    record_entries,
+    remove_entries,
+    write_catalog,
+)
 from vibe.core.session.session_id import shorten_session_id
+from vibe.core.session.session_store import (
+    MESSAGES_FILENAME,
+    METADATA_FILENAME,
+    read_message_index,
+    read_metadata,
+)
 from vibe.core.types import LLMMessage, SessionMetadata
-from vibe.core.utils.io import read_safe
+from vibe.core.utils import jsoncodec
+from vibe.core.utils.io import decode_safe, read_safe
 
 if TYPE_CHECKING:
     from vibe.core.config import SessionLoggingConfig
 
 
-METADATA_FILENAME = "meta.json"
-MESSAGES_FILENAME = "messages.jsonl"
+# Messages validated per chunk when streaming a session log.
+MESSAGE_CHUNK_SIZE = 200
+PREVIEW_CHUNK_SIZE = 16
 
 
 class SessionInfo(TypedDict):
@@ -33,7 +52,7 @@ class SessionLoader:
 
         messages: list[dict[str, Any]] = []
         for line in lines:
-            message = json.loads(line)
+            message = jsoncodec.loads(line)
             if not isinstance(message, dict):
                 return None
             messages.append(message)
@@ -61,9 +80,7 @@ class SessionLoader:
             return None
 
         try:
-            metadata = json.loads(read_safe(metadata_path).text)
-            if not isinstance(metadata, dict):
-                return None
+            metadata = read_metadata(session_dir, resolve_blobs=False)
             if working_directory is not None:
                 session_working_directory = (metadata.get("environment") or {}).get(
                     "working_directory"
@@ -74,7 +91,7 @@ class SessionLoader:
                     return None
 
             messages = SessionLoader._parse_message_lines(read_safe(messages_path).text)
-        except (OSError, json.JSONDecodeError):
+        except (OSError, ValueError):
             return None
 
         if not SessionLoader._log_is_loadable(messages, metadata):
@@ -128,16 +145,55 @@ class SessionLoader:
 
         return None
 
+    @staticmethod
+    def catalog(config: SessionLoggingConfig) -> dict[str, CatalogEntry]:
+        """Catalog entries of the saved sessions, keyed by directory name.
+
+        Sessions missing from the catalog are read and indexed, and entries
+        whose directory is gone are dropped.
+        """
+        save_dir = Path(config.save_dir)
+        if not save_dir.exists():
+            return {}
+
+        names = {path.name for path in save_dir.glob(f"{config.session_prefix}_*")}
+        try:
+            loaded = read_catalog(save_dir)
+        except OSError:
+            loaded = None
+        entries, records = loaded or ({}, 0)
+
+        removed = [name for name in entries if name not in names]
+        for name in removed:
+            del entries[name]
+        indexed: dict[str, CatalogEntry] = {}
+        for name in sorted(names - entries.keys()):
+            metadata = SessionLoader._read_validated_session(save_dir / name)
+            if metadata is not None and (entry := catalog_entry(metadata)):
+                indexed[name] = entry
+        entries.update(indexed)
+
+        try:
+            if loaded is None or needs_compaction(entries, records + len(indexed)):
+                write_catalog(save_dir, entries)
+            else:
+                record_entries(save_dir, indexed)
+                remove_entries(save_dir, removed)
+        except OSError:
+            pass
+        return entries
+
     @staticmethod
     def find_latest_session(
         config: SessionLoggingConfig, working_directory: Path | None = None
     ) -> Path | None:
         save_dir = Path(config.save_dir)
-        if not save_dir.exists():
-            return None
-
-        pattern = f"{config.session_prefix}_*"
-        session_dirs = list(save_dir.glob(pattern))
+        session_dirs = [
+            save_dir / name
+            for name, entry in SessionLoader.catalog(config).items()
+            if working_directory is None
+            or SessionLoader._same_working_directory(entry["cwd"], working_directory)
+        ]
 
         return SessionLoader.latest_session(
             session_dirs, working_directory=working_directory
@@ -189,30 +245,13 @@ class SessionLoader:
     def list_sessions(
         config: SessionLoggingConfig, cwd: str | None = None
     ) -> list[SessionInfo]:
-        save_dir = Path(config.save_dir)
-        if not save_dir.exists():
-            return []
-
-        pattern = f"{config.session_prefix}_*"
-        session_dirs = list(save_dir.glob(pattern))
-
         sessions: list[SessionInfo] = []
-        for session_dir in session_dirs:
-            metadata = SessionLoader._read_validated_session(session_dir)
-            if metadata is None:
-                continue
-
-            session_id = metadata.get("session_id")
-            if not session_id:
-                continue
-
-            environment = metadata.get("environment", {})
-            session_cwd = environment.get("working_directory", "")
-
+        for entry in SessionLoader.catalog(config).values():
+            session_cwd = entry["cwd"]
             if cwd is not None and session_cwd != cwd:
                 continue
 
-            end_time = metadata.get("end_time")
+            end_time = entry["end_time"]
             if end_time:
                 try:
                     end_time = SessionLoader._convert_to_utc_iso(end_time)
@@ -220,9 +259,9 @@ class SessionLoader:
                     end_time = None
 
             sessions.append({
-                "session_id": session_id,
+                "session_id": entry["session_id"],
                 "cwd": session_cwd,
-                "title": metadata.get("title"),
+                "title": entry["title"],
                 "end_time": end_time,
             })
 
@@ -235,8 +274,9 @@ class SessionLoader:
             raise ValueError(f"Session metadata not found at {session_dir}")
 
         try:
-            metadata_content = read_safe(metadata_path).text
-            return SessionMetadata.model_validate_json(metadata_content)
+            return SessionMetadata.model_validate(
+                read_metadata(session_dir, resolve_blobs=False)
+            )
         except ValueError:
             raise
         except Exception as e:
@@ -244,50 +284,105 @@ class SessionLoader:
                 f"Failed to load session metadata at {session_dir}: {e}"
             ) from e
 
+    @staticmethod
+    def load_raw_metadata(filepath: Path) -> dict[str, Any]:
+        """Metadata of a session as stored, or ``{}`` when it has none."""
+        if not (filepath / METADATA_FILENAME).exists():
+            return {}
+        try:
+            return read_metadata(filepath)
+        except json.JSONDecodeError as e:
+            raise ValueError(
+                f"Session metadata contains invalid JSON (may have been corrupted): "
+                f"{filepath}\nDetails: {e}"
+            ) from e
+
     @staticmethod
     def load_session(filepath: Path) -> tuple[list[LLMMessage], dict[str, Any]]:
-        metadata_filepath = filepath / METADATA_FILENAME
-        if metadata_filepath.exists():
-            try:
-                metadata = json.loads(read_safe(metadata_filepath).text)
-            except json.JSONDecodeError as e:
-                raise ValueError(
-                    f"Session metadata contains invalid JSON (may have been corrupted): "
-                    f"{filepath}\nDetails: {e}"
-                ) from e
-        else:
-            metadata = {}
-
-        messages_filepath = filepath / MESSAGES_FILENAME
+        metadata = SessionLoader.load_raw_metadata(filepath)
+
         try:
-            content = read_safe(messages_filepath).text.split("\n")
-            if content and content[-1] == "":
-                content.pop()
-        except Exception as e:
+            messages = [
+                msg for chunk in SessionLoader.iter_messages(filepath) for msg in chunk
+            ]
+        except OSError as e:
             raise ValueError(
                 f"Error reading session messages at {filepath}: {e}"
             ) from e
 
         # An empty log is valid only when metadata records an empty session.
-        if not content and metadata.get("total_messages") != 0:
+        if (
+            not (filepath / MESSAGES_FILENAME).stat().st_size
+            and metadata.get("total_messages") != 0
+        ):
             raise ValueError(
                 f"Session messages file is empty (may have been corrupted by interruption): "
                 f"{filepath}"
             )
 
+        return messages, metadata
+
+    @staticmethod
+    def iter_messages(
+        session_dir: Path,
+        *,
+        chunk_size: int = MESSAGE_CHUNK_SIZE,
+        from_end: bool = False,
+    ) -> Iterator[list[LLMMessage]]:
+        """Yield the non-system messages of a session in validated chunks.
+
+        Lines are read and validated one chunk at a time. With ``from_end``
+        the chunks come last first (each still in log order), seeking through
+        the ``messages.idx`` sidecar, so the tail is available before the
+        rest of the log is parsed.
+        """
+        batches = (
+            SessionLoader._line_batches_from_end(session_dir, chunk_size)
+            if from_end
+            else SessionLoader._line_batches(session_dir, chunk_size)
+        )
+        for batch in batches:
+            chunk = [
+                LLMMessage.model_validate(data)
+                for data in (
+                    SessionLoader._decode_message_line(line, session_dir)
+                    for line in batch
+                )
+                if data["role"] != "system"
+            ]
+            if chunk:
+                yield chunk
+
+    @staticmethod
+    def _decode_message_line(line: bytes, session_dir: Path) -> dict[str, Any]:
         try:
-            data = [json.loads(line) for line in content]
+            return jsoncodec.loads(decode_safe(line).text)
         except json.JSONDecodeError as e:
             raise ValueError(
                 f"Session messages contain invalid JSON (may have been corrupted): "
-                f"{filepath}\nDetails: {e}"
+                f"{session_dir}\nDetails: {e}"
             ) from e
 
-        messages = [
-            LLMMessage.model_validate(msg) for msg in data if msg["role"] != "system"
-        ]
+    @staticmethod
+    def _line_batches(session_dir: Path, chunk_size: int) -> Iterator[list[bytes]]:
+        with (session_dir / MESSAGES_FILENAME).open("rb") as f:
+            while batch := list(itertools.islice(f, chunk_size)):
+                yield batch
 
-        return messages, metadata
+    @staticmethod
+    def _line_batches_from_end(
+        session_dir: Path, chunk_size: int
+    ) -> Iterator[list[bytes]]:
+        line_ends = read_message_index(session_dir)
+        with (session_dir / MESSAGES_FILENAME).open("rb") as f:
+            stop = len(line_ends)
+            while stop > 0:
+                start = max(stop - chunk_size, 0)
+                offset = line_ends[start - 1] if start else 0
+                f.seek(offset)
+                data = f.read(line_ends[stop - 1] - offset)
+                yield data.splitlines(keepends=True)
+                stop = start
 
     @staticmethod
     def _clean_text(text: str) -> str:
@@ -308,14 +403,17 @@ class SessionLoader:
             return "(session not found)"
 
         try:
-            messages, _ = SessionLoader.load_session(session_path)
-
-            for msg in messages:
-                if msg.role != "user":
-                    continue
-                text = SessionLoader._extract_text_from_content(msg.content)
-                if text:
-                    return text
+            # Stream from the start: the first user message is almost always
+            # in the first chunk, so the rest of the log is never parsed.
+            for chunk in SessionLoader.iter_messages(
+                session_path, chunk_size=PREVIEW_CHUNK_SIZE
+            ):
+                for msg in chunk:
+                    if msg.role != "user":
+                        continue
+                    text = SessionLoader._extract_text_from_content(msg.content)
+                    if text:
+                        return text
 
             return "(no user messages)"
         except ValueError:
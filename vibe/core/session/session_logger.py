@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Sequence
+import contextlib
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 import getpass
 import hashlib
+import itertools
 import json
 import os
 from pathlib import Path
@@ -13,16 +16,28 @@ import tempfile
 from threading import Lock
 from typing import TYPE_CHECKING, Any, Literal
 
+from vibe.core.session.durability import session_durability
+from vibe.core.session.session_catalog import record_entry
 from vibe.core.session.session_id import shorten_session_id
 from vibe.core.session.session_loader import (
     MESSAGES_FILENAME,
     METADATA_FILENAME,
     SessionLoader,
 )
+from vibe.core.session.session_store import (
+    JOURNAL_COMPACT_THRESHOLD,
+    SESSION_FORMAT_VERSION,
+    append_journal,
+    append_message_index,
+    compact_metadata,
+    read_journal,
+    write_blob,
+    write_message_index,
+    write_metadata,
+)
 from vibe.core.session.title_format import MAX_TITLE_LENGTH
 from vibe.core.types import AgentStats, LLMMessage, Role, SessionMetadata
-from vibe.core.utils import is_windows, utc_now
-from vibe.core.utils.io import read_safe, read_safe_async
+from vibe.core.utils import is_windows, jsoncodec, utc_now
 
 if TYPE_CHECKING:
     from vibe.core.agents.models import AgentProfile
@@ -34,6 +49,17 @@ if TYPE_CHECKING:
 TMP_CLEANUP_INTERVAL = timedelta(seconds=5)
 
 
+@dataclass(slots=True)
+class _MetadataCursor:
+    """What the session directory holds, tracked so saves never re-read it."""
+
+    total_messages: int = 0
+    last_message_fingerprint: str | None = None
+    blobs: dict[str, str] = field(default_factory=dict)
+    agent_profile: dict[str, Any] | None = None
+    journal_records: int = 0
+
+
 class SessionLogger:
     def __init__(self, session_config: SessionLoggingConfig, session_id: str) -> None:
         self.session_config = session_config
@@ -41,8 +67,9 @@ class SessionLogger:
         self._last_tmp_cleanup_at: datetime | None = None
         self._tmp_cleanup_lock = Lock()
         # Serializes writes so concurrent saves cannot interleave appends to
-        # messages.jsonl or race on the metadata read-modify-write.
+        # messages.jsonl or the metadata journal.
         self._save_lock = asyncio.Lock()
+        self._cursor: _MetadataCursor | None = None
 
         if not self.enabled:
             self.save_dir: Path | None = None
@@ -215,33 +242,21 @@ class SessionLogger:
 
     @staticmethod
     def _persist_metadata_sync(metadata: Any, session_dir: Path) -> None:
-        temp_metadata_filepath = None
-        metadata_filepath = session_dir / METADATA_FILENAME
         try:
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                suffix=".json.tmp",
-                dir=str(session_dir),
-                delete=False,
-                encoding="utf-8",
-            ) as f:
-                temp_metadata_filepath = Path(f.name)
-                f.write(json.dumps(metadata, indent=2, ensure_ascii=False))
-                f.flush()
-                os.fsync(f.fileno())
+            write_metadata(metadata, session_dir)
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to persist session metadata to {session_dir / METADATA_FILENAME}: {e}"
+            ) from e
 
-            os.replace(temp_metadata_filepath, str(metadata_filepath))
+    @staticmethod
+    def _append_metadata_sync(record: dict[str, Any], session_dir: Path) -> None:
+        try:
+            append_journal(session_dir, record)
         except Exception as e:
             raise RuntimeError(
-                f"Failed to persist session metadata to {metadata_filepath}: {e}"
+                f"Failed to append session metadata in {session_dir}: {e}"
             ) from e
-        finally:
-            if (
-                temp_metadata_filepath
-                and temp_metadata_filepath.exists()
-                and temp_metadata_filepath.is_file()
-            ):
-                temp_metadata_filepath.unlink()
 
     @staticmethod
     async def persist_metadata(metadata: Any, session_dir: Path) -> None:
@@ -249,19 +264,33 @@ class SessionLogger:
             SessionLogger._persist_metadata_sync, metadata, session_dir
         )
 
+    @staticmethod
+    async def append_metadata(record: dict[str, Any], session_dir: Path) -> None:
+        await asyncio.to_thread(
+            SessionLogger._append_metadata_sync, record, session_dir
+        )
+
     @staticmethod
     def _persist_messages_sync(messages: list[dict], session_dir: Path) -> None:
         messages_filepath = session_dir / "messages.jsonl"
+        lines = [jsoncodec.dumpb(message) + b"\n" for message in messages]
         try:
-            with messages_filepath.open("a", encoding="utf-8") as f:
-                for message in messages:
-                    f.write(json.dumps(message, ensure_ascii=False) + "\n")
+            with messages_filepath.open("ab") as f:
+                start = f.tell()
+                f.write(b"".join(lines))
                 f.flush()
-                os.fsync(f.fileno())
+                session_durability.sync(f)
         except Exception as e:
             raise RuntimeError(
                 f"Failed to persist session messages to {messages_filepath}: {e}"
             ) from e
+        # The index is a cache: readers rebuild it when it falls behind.
+        with contextlib.suppress(OSError):
+            append_message_index(
+                session_dir,
+                start,
+                list(itertools.accumulate(map(len, lines), initial=start))[1:],
+            )
 
     @staticmethod
     async def persist_messages(messages: list[dict], session_dir: Path) -> None:
@@ -274,20 +303,20 @@ class SessionLogger:
         messages_filepath = session_dir / MESSAGES_FILENAME
         temp_filepath = None
         try:
+            lines = [jsoncodec.dumpb(message) + b"\n" for message in messages]
             with tempfile.NamedTemporaryFile(
-                mode="w",
-                suffix=".jsonl.tmp",
-                dir=str(session_dir),
-                delete=False,
-                encoding="utf-8",
+                mode="wb", suffix=".jsonl.tmp", dir=str(session_dir), delete=False
             ) as f:
                 temp_filepath = Path(f.name)
-                for message in messages:
-                    f.write(json.dumps(message, ensure_ascii=False) + "\n")
+                f.write(b"".join(lines))
                 f.flush()
-                os.fsync(f.fileno())
+                session_durability.sync_replacement(f)
 
             os.replace(temp_filepath, str(messages_filepath))
+            with contextlib.suppress(OSError):
+                write_message_index(
+                    session_dir, list(itertools.accumulate(map(len, lines)))
+                )
         except Exception as e:
             raise RuntimeError(
                 f"Failed to overwrite session messages at {messages_filepath}: {e}"
@@ -356,8 +385,6 @@ class SessionLogger:
         session_metadata: SessionMetadata,
         allow_empty: bool,
     ) -> None:
-        metadata_path = session_dir / METADATA_FILENAME
-
         # If the session directory does not exist, create it
         try:
             session_dir.mkdir(parents=True, exist_ok=True)
@@ -366,19 +393,17 @@ class SessionLogger:
                 f"Failed to create session directory at {session_dir}: {type(e).__name__}: {e}"
             ) from e
 
-        # Read old metadata to detect appends, rewinds, and edited tails.
-        try:
-            if metadata_path.exists():
-                old_metadata = json.loads(read_safe(metadata_path).text)
-                old_total_messages = old_metadata["total_messages"]
-                old_last_fingerprint = old_metadata.get("last_message_fingerprint")
-            else:
-                old_total_messages = 0
-                old_last_fingerprint = None
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to read session metadata at {metadata_path}: {e}"
-            ) from e
+        cursor = self._cursor
+        if cursor is None:
+            try:
+                cursor = self._load_cursor(session_dir)
+            except Exception as e:
+                raise RuntimeError(
+                    f"Failed to read session metadata at {session_dir / METADATA_FILENAME}: {e}"
+                ) from e
+        write_header = cursor is None
+        if cursor is None:
+            cursor = _MetadataCursor()
 
         non_system_messages = [m for m in messages if m.role != Role.system]
 
@@ -387,11 +412,12 @@ class SessionLogger:
 
         # A missing fingerprint (legacy session) can't verify the boundary, so
         # it forces a full rewrite rather than a no-op or append.
+        old_total_messages = cursor.total_messages
         boundary_unchanged = old_total_messages == 0 or (
-            old_last_fingerprint is not None
+            cursor.last_message_fingerprint is not None
             and old_total_messages <= len(non_system_messages)
             and self._message_fingerprint(non_system_messages[old_total_messages - 1])
-            == old_last_fingerprint
+            == cursor.last_message_fingerprint
         )
         if len(non_system_messages) == old_total_messages and boundary_unchanged:
             return
@@ -411,64 +437,137 @@ class SessionLogger:
                 SessionLogger._overwrite_messages_sync(messages_data, session_dir)
 
             # If message update succeeded, write metadata
-            tools_available = [
-                {"type": "function", "function": fn.model_dump()}
-                for fn in tool_manager.available_tool_specs()
-            ]
-
-            system_prompt = (
-                messages[0].model_dump()
-                if len(messages) > 0 and messages[0].role == Role.system
-                else None
+            blobs = self._write_blobs(
+                session_dir, cursor, messages, base_config, tool_manager
             )
+            agent_profile_dump = {
+                "name": agent_profile.name,
+                "overrides": agent_profile.overrides,
+            }
             last_message_fingerprint = (
                 self._message_fingerprint(non_system_messages[-1])
                 if non_system_messages
                 else None
             )
 
-            metadata_dump = {
-                **session_metadata.model_dump(),
+            record: dict[str, Any] = {
                 "end_time": utc_now().isoformat(),
                 "stats": stats.model_dump(),
                 "title": title,
+                "title_source": session_metadata.title_source,
                 "total_messages": len(non_system_messages),
                 "last_message_fingerprint": last_message_fingerprint,
-                "tools_available": tools_available,
-                "config": base_config.model_dump(mode="json"),
-                "agent_profile": {
-                    "name": agent_profile.name,
-                    "overrides": agent_profile.overrides,
-                },
-                "system_prompt": system_prompt,
             }
-
-            SessionLogger._persist_metadata_sync(metadata_dump, session_dir)
+            if changed := {k: v for k, v in blobs.items() if cursor.blobs.get(k) != v}:
+                record["blobs"] = changed
+            if agent_profile_dump != cursor.agent_profile:
+                record["agent_profile"] = agent_profile_dump
+
+            if write_header:
+                SessionLogger._persist_metadata_sync(
+                    {
+                        **session_metadata.model_dump(),
+                        "format_version": SESSION_FORMAT_VERSION,
+                        **record,
+                    },
+                    session_dir,
+                )
+            else:
+                self._append_record(session_dir, cursor, record)
+            self._record_catalog_entry(session_dir, session_metadata, record)
+
+            cursor.total_messages = len(non_system_messages)
+            cursor.last_message_fingerprint = last_message_fingerprint
+            cursor.blobs = blobs
+            cursor.agent_profile = agent_profile_dump
+            self._cursor = cursor
         except Exception as e:
             raise RuntimeError(f"Failed to save session to {session_dir}: {e}") from e
         finally:
             self.maybe_cleanup_tmp_files()
 
+    @staticmethod
+    def _record_catalog_entry(
+        session_dir: Path, session_metadata: SessionMetadata, record: dict[str, Any]
+    ) -> None:
+        # The catalog is a cache: a failed update is repaired on the next read.
+        with contextlib.suppress(OSError):
+            record_entry(
+                session_dir,
+                {
+                    "session_id": session_metadata.session_id,
+                    "cwd": session_metadata.environment.get("working_directory") or "",
+                    "title": record["title"],
+                    "end_time": record["end_time"],
+                    "total_messages": record["total_messages"],
+                },
+            )
+
+    @staticmethod
+    def _write_blobs(
+        session_dir: Path,
+        cursor: _MetadataCursor,
+        messages: list[LLMMessage],
+        base_config: VibeConfigSchema,
+        tool_manager: ToolManager,
+    ) -> dict[str, str]:
+        # Config, tools and system prompt only hit the disk when they change.
+        values = {
+            "config": base_config.model_dump(mode="json"),
+            "tools_available": [
+                {"type": "function", "function": fn.model_dump()}
+                for fn in tool_manager.available_tool_specs()
+            ],
+            "system_prompt": (
+                messages[0].model_dump()
+                if len(messages) > 0 and messages[0].role == Role.system
+                else None
+            ),
+        }
+        return {
+            key: write_blob(session_dir, value, known=cursor.blobs.get(key))
+            for key, value in values.items()
+        }
+
+    @staticmethod
+    def _append_record(
+        session_dir: Path, cursor: _MetadataCursor, record: dict[str, Any]
+    ) -> None:
+        append_journal(session_dir, record)
+        cursor.journal_records += 1
+        if cursor.journal_records >= JOURNAL_COMPACT_THRESHOLD:
+            compact_metadata(session_dir)
+            cursor.journal_records = 0
+
+    @staticmethod
+    def _load_cursor(session_dir: Path) -> _MetadataCursor | None:
+        """Cursor for a session saved by an earlier process, upgrading v1 logs."""
+        if not (session_dir / METADATA_FILENAME).exists():
+            return None
+
+        from vibe.core.session.session_migration import migrate_session_to_v2
+
+        metadata = migrate_session_to_v2(session_dir)
+        return _MetadataCursor(
+            total_messages=metadata["total_messages"],
+            last_message_fingerprint=metadata.get("last_message_fingerprint"),
+            blobs=metadata.get("blobs", {}),
+            agent_profile=metadata.get("agent_profile"),
+            journal_records=len(read_journal(session_dir)),
+        )
+
     async def persist_loops(self) -> None:
         session_info = self._get_session_info()
         if session_info is None:
             return
         session_dir, session_metadata = session_info
-        metadata_path = session_dir / METADATA_FILENAME
-        if not metadata_path.exists():
+        if not (session_dir / METADATA_FILENAME).exists():
             return
+        record = {
+            "loops": [loop.model_dump(mode="json") for loop in session_metadata.loops]
+        }
         async with self._save_lock:
-            try:
-                raw = (await read_safe_async(metadata_path)).text
-                metadata = json.loads(raw)
-            except (OSError, json.JSONDecodeError) as e:
-                raise RuntimeError(
-                    f"Failed to read session metadata at {metadata_path}: {e}"
-                ) from e
-            metadata["loops"] = [
-                loop.model_dump(mode="json") for loop in session_metadata.loops
-            ]
-            await SessionLogger.persist_metadata(metadata, session_dir)
+            await SessionLogger.append_metadata(record, session_dir)
 
     async def persist_experiments(self, response: EvalResponse | None) -> None:
         session_info = self._get_session_info()
@@ -476,21 +575,15 @@ class SessionLogger:
             return
         session_dir, session_metadata = session_info
         session_metadata.experiments = response
-        metadata_path = session_dir / METADATA_FILENAME
-        if not metadata_path.exists():
+        if not (session_dir / METADATA_FILENAME).exists():
             return
-        async with self._save_lock:
-            try:
-                raw = (await read_safe_async(metadata_path)).text
-                metadata = json.loads(raw)
-            except (OSError, json.JSONDecodeError) as e:
-                raise RuntimeError(
-                    f"Failed to read session metadata at {metadata_path}: {e}"
-                ) from e
-            metadata["experiments"] = (
+        record = {
+            "experiments": (
                 response.model_dump(mode="json") if response is not None else None
             )
-            await SessionLogger.persist_metadata(metadata, session_dir)
+        }
+        async with self._save_lock:
+            await SessionLogger.append_metadata(record, session_dir)
 
     def reset_session(
         self, session_id: str, *, parent_session_id: str | None = None
@@ -503,6 +596,7 @@ class SessionLogger:
         self.session_start_time = utc_now().isoformat()
         self.session_dir = self.save_folder
         self.session_metadata = self._initialize_session_metadata()
+        self._cursor = None
         if parent_session_id is not None:
             self.session_metadata.parent_session_id = parent_session_id
 
@@ -513,6 +607,7 @@ class SessionLogger:
         self.session_id = session_id
         self.session_dir = session_dir
         self.session_metadata = SessionLoader.load_metadata(session_dir)
+        self._cursor = None
 
         if self.session_metadata.start_time:
             self.session_start_time = self.session_metadata.start_time
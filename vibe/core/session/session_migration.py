@@ -3,9 +3,19 @@ from __future__ import annotations
 import asyncio
 import json
 from pathlib import Path
+from typing import Any
 
 from vibe.core.config import SessionLoggingConfig
 from vibe.core.session.session_logger import SessionLogger
+from vibe.core.session.session_store import (
+    BLOB_KEYS,
+    METADATA_FILENAME,
+    SESSION_FORMAT_VERSION,
+    folded_blobs,
+    read_metadata,
+    write_blob,
+    write_metadata,
+)
 from vibe.core.utils.io import read_safe
 
 
@@ -14,7 +24,10 @@ def migrate_sessions_entrypoint(session_config: SessionLoggingConfig) -> int:
 
 
 async def migrate_sessions(session_config: SessionLoggingConfig) -> int:
-    """Helper for migrating session data from singular JSON files to the format introduced in Vibe 2.0 with per-session folders with split metadata and message files."""
+    """Helper for migrating session data from singular JSON files to the format introduced in Vibe 2.0 with per-session folders with split metadata and message files.
+
+    Session folders still holding single-document (v1) metadata are moved to the blob + journal layout as well.
+    """
     save_dir = session_config.save_dir
     if not save_dir or not session_config.enabled:
         return 0
@@ -33,9 +46,52 @@ async def migrate_sessions(session_config: SessionLoggingConfig) -> int:
 
             await SessionLogger.persist_metadata(metadata, session_dir)
             await SessionLogger.persist_messages(messages, session_dir)
+            await asyncio.to_thread(migrate_session_to_v2, session_dir)
             session_file.unlink()
             successful_migrations += 1
         except Exception:
             continue
 
+    metadata_paths = Path(save_dir).glob(
+        f"{session_config.session_prefix}_*/{METADATA_FILENAME}"
+    )
+    for metadata_path in metadata_paths:
+        try:
+            if await asyncio.to_thread(_upgrade_session_dir, metadata_path.parent):
+                successful_migrations += 1
+        except Exception:
+            continue
+
     return successful_migrations
+
+
+def _upgrade_session_dir(session_dir: Path) -> bool:
+    metadata = read_metadata(session_dir, resolve_blobs=False)
+    if metadata.get("format_version") == SESSION_FORMAT_VERSION:
+        return False
+    migrate_session_to_v2(session_dir)
+    return True
+
+
+def migrate_session_to_v2(session_dir: Path) -> dict[str, Any]:
+    """Move a single-document (v1) session to the blob + journal layout.
+
+    Returns the current metadata with blob references unresolved. Sessions
+    already in the v2 layout are left untouched.
+    """
+    metadata = read_metadata(session_dir, resolve_blobs=False)
+    if metadata.get("format_version") == SESSION_FORMAT_VERSION:
+        return metadata
+
+    blobs = folded_blobs(metadata)
+    for key in BLOB_KEYS:
+        if key in metadata:
+            blobs[key] = write_blob(session_dir, metadata.pop(key))
+    metadata["blobs"] = blobs
+    metadata["format_version"] = SESSION_FORMAT_VERSION
+
+    # The journal (title edits on a v1 session) is already folded in; it is
+    # kept since replaying it over the new header changes nothing, which
+    # keeps a concurrent append from being lost.
+    write_metadata(metadata, session_dir)
+    return metadata
@@ -0,0 +1,250 @@
+"""On-disk layout of a session directory.
+
+Version 2 splits session metadata in three parts:
+
+- ``meta.json``: the header, written once when the session is first saved
+  (and when the journal is compacted).
+- ``meta.journal.jsonl``: append-only records for the state that changes
+  every turn (stats, title, message count and fingerprint, loops, ...).
+  Each record sets the keys it carries; folding them over the header in
+  order yields the current metadata.
+- ``blobs/<sha256>.json``: immutable, content-addressed copies of the large
+  and rarely changing values (config, tool specs, system prompt). The header
+  and journal reference them by digest under ``blobs``.
+
+``messages.idx`` is a sidecar of ``messages.jsonl`` holding the end offset
+of every line as little-endian uint64, so readers can seek to any message.
+It is a cache: when it does not match the log it is rebuilt on read.
+
+Version 1 sessions keep everything in ``meta.json``; they read the same way
+and are upgraded by ``session_migration.migrate_session_to_v2``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+from pathlib import Path
+import struct
+import tempfile
+from typing import Any
+
+from vibe.core.session.durability import session_durability
+from vibe.core.utils import jsoncodec
+from vibe.core.utils.io import read_safe
+
+METADATA_FILENAME = "meta.json"
+MESSAGES_FILENAME = "messages.jsonl"
+METADATA_JOURNAL_FILENAME = "meta.journal.jsonl"
+BLOBS_DIRNAME = "blobs"
+MESSAGES_INDEX_FILENAME = "messages.idx"
+
+SESSION_FORMAT_VERSION = 2
+BLOB_KEYS = ("config", "tools_available", "system_prompt")
+# Journal records are folded into the header once there are this many.
+JOURNAL_COMPACT_THRESHOLD = 256
+
+_OFFSET = struct.Struct("<Q")
+_SCAN_BLOCK_SIZE = 1 << 20
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="wb", suffix=".json.tmp", dir=str(path.parent), delete=False
+        ) as f:
+            temp_path = Path(f.name)
+            f.write(data)
+            f.flush()
+            session_durability.sync_replacement(f)
+
+        os.replace(temp_path, str(path))
+    finally:
+        if temp_path and temp_path.exists() and temp_path.is_file():
+            temp_path.unlink()
+
+
+def write_metadata(metadata: Any, session_dir: Path) -> None:
+    _write_atomic(
+        session_dir / METADATA_FILENAME, jsoncodec.dumpb(metadata, indent=True)
+    )
+
+
+def blob_digest(encoded: bytes) -> str:
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def write_blob(session_dir: Path, value: Any, *, known: str | None = None) -> str:
+    """Store ``value`` under its content digest, once, and return the digest.
+
+    ``known`` is a digest already stored for this session; a match skips the
+    filesystem check.
+    """
+    encoded = jsoncodec.dumpb(value)
+    digest = blob_digest(encoded)
+    path = session_dir / BLOBS_DIRNAME / f"{digest}.json"
+    if digest != known and not path.is_file():
+        path.parent.mkdir(exist_ok=True)
+        _write_atomic(path, encoded)
+    return digest
+
+
+def read_blob(session_dir: Path, digest: str) -> Any:
+    return jsoncodec.loads(
+        read_safe(session_dir / BLOBS_DIRNAME / f"{digest}.json").text
+    )
+
+
+def append_journal(session_dir: Path, *records: dict[str, Any]) -> None:
+    with (session_dir / METADATA_JOURNAL_FILENAME).open("ab") as f:
+        for record in records:
+            f.write(jsoncodec.dumpb(record) + b"\n")
+        f.flush()
+        session_durability.sync(f)
+
+
+def read_journal(session_dir: Path) -> list[dict[str, Any]]:
+    journal_path = session_dir / METADATA_JOURNAL_FILENAME
+    if not journal_path.is_file():
+        return []
+
+    records: list[dict[str, Any]] = []
+    for line in read_safe(journal_path).text.splitlines():
+        try:
+            record = jsoncodec.loads(line)
+        except json.JSONDecodeError:
+            # A torn final append: everything before it is intact.
+            break
+        if isinstance(record, dict):
+            records.append(record)
+    return records
+
+
+def folded_blobs(metadata: dict[str, Any]) -> dict[str, str]:
+    blobs = metadata.get("blobs")
+    return dict(blobs) if isinstance(blobs, dict) else {}
+
+
+def fold_journal(
+    metadata: dict[str, Any], records: list[dict[str, Any]]
+) -> dict[str, Any]:
+    folded = dict(metadata)
+    blobs = folded_blobs(metadata)
+    for record in records:
+        folded.update(record)
+        blobs.update(folded_blobs(record))
+    if blobs:
+        folded["blobs"] = blobs
+    return folded
+
+
+def read_metadata(session_dir: Path, *, resolve_blobs: bool = True) -> dict[str, Any]:
+    """Current metadata of a session, in the single-document (v1) shape.
+
+    With ``resolve_blobs`` the blob references are replaced by their values;
+    otherwise they are left under ``blobs`` so listing sessions never touches
+    the large values.
+    """
+    metadata = jsoncodec.loads(read_safe(session_dir / METADATA_FILENAME).text)
+    if not isinstance(metadata, dict):
+        raise ValueError(
+            f"Session metadata must be an object: {session_dir / METADATA_FILENAME}"
+        )
+
+    metadata = fold_journal(metadata, read_journal(session_dir))
+    if resolve_blobs:
+        for key, digest in folded_blobs(metadata).items():
+            metadata[key] = read_blob(session_dir, digest)
+        metadata.pop("blobs", None)
+    return metadata
+
+
+def compact_metadata(session_dir: Path) -> None:
+    """Fold the journal into the header and drop it.
+
+    Journal records only set keys, so a crash between the two steps replays
+    them over an already folded header with the same result.
+    """
+    write_metadata(read_metadata(session_dir, resolve_blobs=False), session_dir)
+    (session_dir / METADATA_JOURNAL_FILENAME).unlink(missing_ok=True)
+
+
+def _pack_offsets(offsets: list[int]) -> bytes:
+    return b"".join(_OFFSET.pack(offset) for offset in offsets)
+
+
+def write_message_index(session_dir: Path, line_ends: list[int]) -> None:
+    path = session_dir / MESSAGES_INDEX_FILENAME
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        temp_path.write_bytes(_pack_offsets(line_ends))
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def append_message_index(session_dir: Path, start: int, line_ends: list[int]) -> None:
+    """Extend the index with lines appended to the log at offset ``start``.
+
+    An index that does not end at ``start`` is stale and left for the next
+    reader to rebuild.
+    """
+    path = session_dir / MESSAGES_INDEX_FILENAME
+    if start == 0:
+        write_message_index(session_dir, line_ends)
+        return
+    try:
+        with path.open("r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size < _OFFSET.size or size % _OFFSET.size:
+                return
+            f.seek(size - _OFFSET.size)
+            if _OFFSET.unpack(f.read(_OFFSET.size))[0] != start:
+                return
+            f.write(_pack_offsets(line_ends))
+    except FileNotFoundError:
+        return
+
+
+def _scan_line_ends(messages_path: Path) -> list[int]:
+    line_ends: list[int] = []
+    offset = 0
+    with messages_path.open("rb") as f:
+        while block := f.read(_SCAN_BLOCK_SIZE):
+            start = 0
+            while (newline := block.find(b"\n", start)) != -1:
+                line_ends.append(offset + newline + 1)
+                start = newline + 1
+            offset += len(block)
+    # A final line without a newline is still a line.
+    if offset and (not line_ends or line_ends[-1] != offset):
+        line_ends.append(offset)
+    return line_ends
+
+
+def read_message_index(session_dir: Path) -> list[int]:
+    """End offsets of the lines of ``messages.jsonl``.
+
+    Read from the sidecar index when it matches the log's size, otherwise
+    rebuilt by scanning the log and written back.
+    """
+    messages_path = session_dir / MESSAGES_FILENAME
+    size = messages_path.stat().st_size
+    try:
+        data = (session_dir / MESSAGES_INDEX_FILENAME).read_bytes()
+    except OSError:
+        data = b""
+    if data and not len(data) % _OFFSET.size:
+        line_ends = [offset for (offset,) in _OFFSET.iter_unpack(data)]
+        if line_ends[-1] == size:
+            return line_ends
+    elif not data and size == 0:
+        return []
+
+    line_ends = _scan_line_ends(messages_path)
+    with contextlib.suppress(OSError):
+        write_message_index(session_dir, line_ends)
+    return line_ends
@@ -644,8 +644,8 @@ Custom agents are TOML files in `~/.vibe/agents/NAME.toml`.
   - Loops fire only when the agent is idle and the input bar is focused. At
     most one loop fires per poll. Overdue loops fire once on the next poll
     (no catch-up); `next_fire_at` advances to `now + interval`.
-  - Loops are persisted in the session metadata (`loops` field of `meta.json`)
-    and restored on `--resume`/`--continue`.
+  - Loops are persisted in the session metadata (`loops` field, appended to
+    `meta.journal.jsonl`) and restored on `--resume`/`--continue`.
 - `/terminal-setup` - Configure Shift+Enter for newlines
 - `/proxy-setup` - Configure proxy and SSL certificate settings
 - `/leanstall` - Install the Lean 4 agent (leanstral)
@@ -23,8 +23,8 @@ from vibe.core.telemetry.types import (
     TeleportFailureDetails,
     TeleportFailureStage,
 )
-from vibe.core.utils import get_server_url_from_api_base, get_user_agent
-from vibe.core.utils.http import VibeAsyncHTTPClient, build_ssl_context
+from vibe.core.utils import get_server_url_from_api_base, get_user_agent, jsoncodec
+from vibe.core.utils.http import VibeAsyncHTTPClient, http_pool
 
 if TYPE_CHECKING:
     from vibe.core.agent_loop import ToolDecision
@@ -108,9 +108,7 @@ class TelemetryClient:
     def client(self) -> VibeAsyncHTTPClient:
         if self._client is None:
             self._client = VibeAsyncHTTPClient(
-                timeout=httpx.Timeout(5.0),
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-                verify=build_ssl_context(),
+                timeout=httpx.Timeout(5.0), transport=http_pool.transport()
             )
         return self._client
 
@@ -181,7 +179,7 @@ class TelemetryClient:
             try:
                 await self.client.post(
                     telemetry_url,
-                    json=payload,
+                    content=jsoncodec.dumpb(payload),
                     headers={
                         "Content-Type": "application/json",
                         "Authorization": f"Bearer {mistral_api_key}",
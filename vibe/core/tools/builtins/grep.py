@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import binascii
 from collections.abc import AsyncGenerator
 from enum import StrEnum, auto
+import json
+import os
 from pathlib import Path
 import shutil
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
+from vibe.core.search import shared_search_index
 from vibe.core.tools.base import (
     BaseTool,
     BaseToolConfig,
@@ -21,12 +26,24 @@ from vibe.core.tools.permissions import PermissionContext
 from vibe.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
 from vibe.core.tools.utils import resolve_file_tool_permission
 from vibe.core.types import ToolStreamEvent
-from vibe.core.utils import kill_async_subprocess
+from vibe.core.utils import jsoncodec, kill_async_subprocess
 from vibe.core.utils.io import decode_safe, read_safe
 
 if TYPE_CHECKING:
     from vibe.core.types import ToolResultEvent
 
+_READ_CHUNK_SIZE = 64 * 1024
+# Seconds between "matches so far" progress events on long searches.
+_PROGRESS_INTERVAL = 1.0
+# An unterminated line longer than this many output budgets ends the search:
+# keeping it cannot fit the budget, and it may be a minified file.
+_MAX_PENDING_LINE_BUDGETS = 4
+# Index candidates are passed on the command line. Past these many files or
+# characters the index is not selective enough to pay off, and Windows caps
+# the command line at 32K characters.
+_MAX_CANDIDATE_FILES = 1_000
+_MAX_CANDIDATE_ARGS_CHARS = 24_000
+
 
 class GrepBackend(StrEnum):
     RIPGREP = auto()
@@ -81,6 +98,18 @@ class GrepToolConfig(BaseToolConfig):
         default=".vibeignore",
         description="Name of the file to read for additional exclusion patterns.",
     )
+    use_json_output: bool = Field(
+        default=True,
+        description="Read structured matches from `rg --json` instead of "
+        "splitting `file:line:content` output.",
+    )
+    use_search_index: bool = Field(
+        default=False,
+        description="Narrow searches under the working directory to the files a "
+        "background trigram index says may match. The index honours the exclude "
+        "patterns, the .vibeignore file and the root .gitignore, but not nested "
+        ".gitignore files.",
+    )
 
 
 class GrepArgs(BaseModel):
@@ -140,9 +169,13 @@ class GrepResult(BaseModel):
     was_truncated: bool = Field(
         description="True if output was cut short by max_matches or max_output_bytes."
     )
+    # Matches read from `rg --json`; empty when the output was plain text.
+    _structured_matches: list[GrepMatch] = PrivateAttr(default_factory=list)
 
     @property
     def parsed_matches(self) -> list[GrepMatch]:
+        if self._structured_matches:
+            return list(self._structured_matches)
         results: list[GrepMatch] = []
         for line in self.matches.splitlines():
             if match := GrepMatch.from_output_line(line):
@@ -150,6 +183,107 @@ class GrepResult(BaseModel):
         return results
 
 
+def _rg_data(field: dict[str, Any]) -> bytes:
+    """Bytes of an rg ``--json`` data field: ``{"text": ...}`` or ``{"bytes": ...}``."""
+    if (text := field.get("text")) is not None:
+        return str(text).encode()
+    return base64.b64decode(field.get("bytes") or "")
+
+
+class _MatchCollector:
+    """Accumulates search output until the global match or byte budget is hit.
+
+    ``--max-count`` only bounds matches per file, so the search process is
+    stopped once ``full`` turns true. Lines are kept as bytes and decoded
+    once in ``result``, like the whole output used to be.
+    """
+
+    def __init__(
+        self, max_matches: int, max_output_bytes: int, *, json_output: bool
+    ) -> None:
+        self._max_matches = max_matches
+        self._max_output_bytes = max_output_bytes
+        self._json_output = json_output
+        self._pending = bytearray()
+        self._lines: list[bytes] = []
+        self._matches: list[GrepMatch] = []
+        self._size = 0
+        self.full = False
+
+    @property
+    def match_count(self) -> int:
+        return len(self._lines)
+
+    def feed(self, chunk: bytes) -> None:
+        self._pending += chunk
+        *lines, rest = self._pending.split(b"\n")
+        self._pending = bytearray(rest)
+        for raw in lines:
+            if self.full:
+                return
+            self._add(bytes(raw))
+        if len(self._pending) > self._max_output_bytes * _MAX_PENDING_LINE_BUDGETS:
+            self.full = True
+
+    def finish(self) -> None:
+        if self._pending and not self.full:
+            self._add(bytes(self._pending))
+        self._pending.clear()
+
+    def result(self) -> GrepResult:
+        output = b"\n".join(self._lines)
+        text = decode_safe(output, from_subprocess=True).text if output else ""
+        result = GrepResult(
+            matches=text[: self._max_output_bytes],
+            match_count=len(self._lines),
+            was_truncated=self.full,
+        )
+        result._structured_matches = self._matches
+        return result
+
+    def _add(self, raw: bytes) -> None:
+        if self._json_output:
+            if (parsed := self._parse_json_line(raw)) is None:
+                return
+            line, match = parsed
+        else:
+            line, match = raw.rstrip(b"\r"), None
+            if not line:
+                return
+
+        if len(self._lines) >= self._max_matches:
+            self.full = True
+            return
+        self._size += len(line) + (1 if self._lines else 0)
+        self._lines.append(line)
+        if match is not None:
+            self._matches.append(match)
+        if self._size > self._max_output_bytes:
+            self.full = True
+
+    @staticmethod
+    def _parse_json_line(raw: bytes) -> tuple[bytes, GrepMatch] | None:
+        try:
+            event = jsoncodec.loads(raw)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(event, dict) or event.get("type") != "match":
+            return None
+        data = event.get("data") or {}
+        try:
+            path = _rg_data(data.get("path") or {})
+            content = _rg_data(data.get("lines") or {}).rstrip(b"\r\n")
+        except (binascii.Error, ValueError):
+            return None
+        line_number = data.get("line_number")
+        if not isinstance(line_number, int):
+            line_number = None
+
+        line = b"%s:%s:%s" % (path, str(line_number or "").encode(), content)
+        match = GrepMatch(path=str(Path(os.fsdecode(path)).resolve()), line=line_number)
+        return line, match
+
+
 class Grep(
     BaseTool[GrepArgs, GrepResult, GrepToolConfig, BaseToolState],
     ToolUIData[GrepArgs, GrepResult],
@@ -181,12 +315,63 @@ class Grep(
         self._validate_args(args)
 
         exclude_patterns = self._collect_exclude_patterns()
-        cmd = self._build_command(args, exclude_patterns, backend)
-        stdout = await self._execute_search(cmd)
+        search_paths = self._indexed_search_paths(args, exclude_patterns, backend)
+        if search_paths == []:
+            yield GrepResult(matches="", match_count=0, was_truncated=False)
+            return
+        cmd = self._build_command(args, exclude_patterns, backend, search_paths)
+        collector = _MatchCollector(
+            args.max_matches or self.config.default_max_matches,
+            self.config.max_output_bytes,
+            json_output=self._uses_json_output(backend),
+        )
+        async for match_count in self._execute_search(cmd, collector):
+            if ctx is not None:
+                yield ToolStreamEvent(
+                    tool_name=self.get_name(),
+                    tool_call_id=ctx.tool_call_id,
+                    message=f"Found {match_count} matches so far",
+                )
 
-        yield self._parse_output(
-            stdout, args.max_matches or self.config.default_max_matches
+        yield collector.result()
+
+    def _indexed_search_paths(
+        self, args: GrepArgs, exclude_patterns: list[str], backend: GrepBackend
+    ) -> list[str] | None:
+        """Files to search instead of ``args.path``, or ``None`` to search it all.
+
+        Paths are spelled relative to ``args.path`` so matches are reported
+        the same way as from a directory search.
+        """
+        if not (self.config.use_search_index and args.use_default_ignore):
+            return None
+        search_root = Path(args.path).expanduser()
+        if not search_root.is_absolute():
+            search_root = Path.cwd() / search_root
+        if not search_root.is_dir():
+            return None
+
+        index = shared_search_index(Path.cwd(), exclude_patterns)
+        candidates = index.candidates(
+            args.pattern,
+            search_root,
+            # ripgrep skips hidden files; GNU grep searches them.
+            skip_hidden=backend == GrepBackend.RIPGREP,
+            limit=_MAX_CANDIDATE_FILES,
         )
+        if candidates is None:
+            return None
+        resolved_root = search_root.resolve()
+        paths = [
+            os.path.join(args.path, candidate.relative_to(resolved_root))
+            for candidate in candidates
+        ]
+        if sum(len(path) + 1 for path in paths) > _MAX_CANDIDATE_ARGS_CHARS:
+            return None
+        return paths
+
+    def _uses_json_output(self, backend: GrepBackend) -> bool:
+        return backend == GrepBackend.RIPGREP and self.config.use_json_output
 
     def _validate_args(self, args: GrepArgs) -> None:
         if not args.pattern.strip():
@@ -222,11 +407,19 @@ class Grep(
         return patterns
 
     def _build_command(
-        self, args: GrepArgs, exclude_patterns: list[str], backend: GrepBackend
+        self,
+        args: GrepArgs,
+        exclude_patterns: list[str],
+        backend: GrepBackend,
+        search_paths: list[str] | None = None,
     ) -> list[str]:
         if backend == GrepBackend.RIPGREP:
-            return self._build_ripgrep_command(args, exclude_patterns)
-        return self._build_gnu_grep_command(args, exclude_patterns)
+            cmd = self._build_ripgrep_command(args, exclude_patterns)
+        else:
+            cmd = self._build_gnu_grep_command(args, exclude_patterns)
+        if search_paths is not None:
+            cmd[-1:] = search_paths
+        return cmd
 
     def _build_ripgrep_command(
         self, args: GrepArgs, exclude_patterns: list[str]
@@ -235,12 +428,14 @@ class Grep(
 
         cmd = [
             "rg",
+            *(["--json"] if self.config.use_json_output else []),
             "--line-number",
             "--no-heading",
             "--with-filename",
             "--smart-case",
             "--no-binary",
-            # Request one extra to detect truncation
+            # Per file: one extra detects truncation. The global limit is
+            # enforced while reading the output.
             "--max-count",
             str(max_matches + 1),
         ]
@@ -276,62 +471,63 @@ class Grep(
 
         return cmd
 
-    async def _execute_search(self, cmd: list[str]) -> str:
+    async def _execute_search(
+        self, cmd: list[str], collector: _MatchCollector
+    ) -> AsyncGenerator[int, None]:
+        """Stream the command's output into ``collector``.
+
+        Yields the match count every ``_PROGRESS_INTERVAL`` seconds, and kills
+        the process as soon as the collector is full.
+        """
         try:
             proc = await asyncio.create_subprocess_exec(
                 *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
             )
-
-            try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    proc.communicate(), timeout=self.config.default_timeout
+        except Exception as exc:
+            raise ToolError(f"Error running grep: {exc}") from exc
+        assert proc.stdout is not None and proc.stderr is not None
+        # Drained concurrently: a full stderr pipe would block the search.
+        stderr_task = asyncio.create_task(proc.stderr.read())
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.default_timeout
+        next_progress = loop.time() + _PROGRESS_INTERVAL
+        finished = False
+        try:
+            while not collector.full:
+                chunk = await asyncio.wait_for(
+                    proc.stdout.read(_READ_CHUNK_SIZE),
+                    timeout=max(0.0, deadline - loop.time()),
                 )
-            except TimeoutError:
+                if not chunk:
+                    finished = True
+                    break
+                collector.feed(chunk)
+                if loop.time() >= next_progress:
+                    next_progress = loop.time() + _PROGRESS_INTERVAL
+                    yield collector.match_count
+        except TimeoutError:
+            raise ToolError(f"Search timed out after {self.config.default_timeout}s")
+        except Exception as exc:
+            raise ToolError(f"Error running grep: {exc}") from exc
+        finally:
+            if not finished:
                 await kill_async_subprocess(proc, kill_process_group=False)
-                raise ToolError(
-                    f"Search timed out after {self.config.default_timeout}s"
-                )
-
-            stdout = (
-                decode_safe(stdout_bytes, from_subprocess=True).text
-                if stdout_bytes
-                else ""
-            )
+                stderr_task.cancel()
+        if not finished:
+            return
+
+        collector.finish()
+        returncode = await proc.wait()
+        stderr_bytes = await stderr_task
+        if returncode not in {0, 1}:
             stderr = (
                 decode_safe(stderr_bytes, from_subprocess=True).text
                 if stderr_bytes
                 else ""
             )
-
-            if proc.returncode not in {0, 1}:
-                error_msg = stderr or f"Process exited with code {proc.returncode}"
-                raise ToolError(f"grep error: {error_msg}")
-
-            return stdout
-
-        except ToolError:
-            raise
-        except Exception as exc:
-            raise ToolError(f"Error running grep: {exc}") from exc
-
-    def _parse_output(self, stdout: str, max_matches: int) -> GrepResult:
-        output_lines = stdout.splitlines() if stdout else []
-
-        truncated_lines = output_lines[:max_matches]
-        truncated_output = "\n".join(truncated_lines)
-
-        was_truncated = (
-            len(output_lines) > max_matches
-            or len(truncated_output) > self.config.max_output_bytes
-        )
-
-        final_output = truncated_output[: self.config.max_output_bytes]
-
-        return GrepResult(
-            matches=final_output,
-            match_count=len(truncated_lines),
-            was_truncated=was_truncated,
-        )
+            error_msg = stderr or f"Process exited with code {returncode}"
+            raise ToolError(f"grep error: {error_msg}")
 
     @classmethod
     def format_call_display(cls, args: GrepArgs) -> ToolCallDisplay:
@@ -23,7 +23,7 @@ from vibe.core.tools.permissions import (
 )
 from vibe.core.tools.ui import ToolCallDisplay, ToolResultDisplay, ToolUIData
 from vibe.core.types import ToolStreamEvent
-from vibe.core.utils.http import VibeAsyncHTTPClient, build_ssl_context
+from vibe.core.utils.http import VibeAsyncHTTPClient, http_pool
 
 if TYPE_CHECKING:
     from vibe.core.types import ToolCallEvent, ToolResultEvent
@@ -195,7 +195,7 @@ class WebFetch(
         async with VibeAsyncHTTPClient(
             follow_redirects=True,
             timeout=httpx.Timeout(timeout),
-            verify=build_ssl_context(),
+            transport=http_pool.transport(),
         ) as client:
             response = await client.get(url, headers=headers)
 
@@ -35,7 +35,7 @@ from vibe.core.tools.mcp_sampling import MCPSamplingHandler
 from vibe.core.tools.remote import MCPTool, MCPToolResult, RemoteTool, _OpenArgs
 from vibe.core.tools.ui import ToolResultDisplay
 from vibe.core.types import ToolStreamEvent
-from vibe.core.utils.http import VibeAsyncHTTPClient, build_ssl_context
+from vibe.core.utils.http import VibeAsyncHTTPClient, http_pool
 from vibe.core.utils.io import decode_safe
 
 if TYPE_CHECKING:
@@ -129,7 +129,7 @@ def create_vibe_mcp_http_client(
         headers=headers,
         auth=auth,
         timeout=httpx.Timeout(_MCP_DEFAULT_TIMEOUT, read=_MCP_DEFAULT_SSE_READ_TIMEOUT),
-        verify=build_ssl_context(),
+        transport=http_pool.transport(),
     )
 
 
@@ -17,7 +17,7 @@ from vibe.core.config import (
     OtelSpanExporterConfig,
     resolve_api_key,
 )
-from vibe.core.utils import get_server_url_from_api_base
+from vibe.core.utils import HTTPPoolStats, get_server_url_from_api_base, http_pool
 
 if TYPE_CHECKING:
     from opentelemetry import trace
@@ -176,14 +176,31 @@ async def agent_span(
     if session_id:
         ctx = baggage.set_baggage(gen_ai_attributes.GEN_AI_CONVERSATION_ID, session_id)
         token = context.attach(ctx)
+    pool_before = http_pool.total_stats()
     try:
         async with _safe_span(f"invoke_agent {VIBE_AGENT_NAME}", attributes) as span:
-            yield span
+            try:
+                yield span
+            finally:
+                _set_http_pool_attributes(span, http_pool.total_stats() - pool_before)
     finally:
         if token is not None:
             context.detach(token)
 
 
+def _set_http_pool_attributes(span: trace.Span, delta: HTTPPoolStats) -> None:
+    # The pool is process-wide, so concurrent sessions share these counters.
+    try:
+        span.set_attributes({
+            "vibe.http.requests": delta.requests,
+            "vibe.http.connections_opened": delta.connections_opened,
+            "vibe.http.connections_reused": delta.connections_reused,
+            "vibe.http.tls_handshakes": delta.tls_handshakes,
+        })
+    except Exception:
+        logger.warning("Failed to record HTTP pool stats", exc_info=True)
+
+
 @asynccontextmanager
 async def tool_span(
     *, tool_name: str, call_id: str, arguments: str
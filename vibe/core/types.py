@@ -13,6 +13,7 @@ from uuid import uuid4
 if TYPE_CHECKING:
     from vibe.core.tools.base import BaseTool
     from vibe.core.tools.permissions import RequiredPermission
+    from vibe.core.utils.tokens import TokenEstimator
 else:
     BaseTool = Any
 
@@ -62,6 +63,8 @@ class AgentStats(BaseModel):
     last_turn_completion_tokens: int = 0
     last_turn_duration: float = 0.0
     tokens_per_second: float = 0.0
+    # Connection setup moved off the request path by pre-warming the provider.
+    prewarm_time_saved: float = 0.0
 
     input_price_per_million: float = 0.0
     output_price_per_million: float = 0.0
@@ -458,6 +461,149 @@ class LLMChunk(BaseModel):
         )
 
 
+class _ToolCallAccumulator:
+    __slots__ = ("arguments", "id", "index", "name", "type")
+
+    def __init__(self, tc: ToolCall, index: int) -> None:
+        self.id = tc.id
+        self.index = index
+        self.type: Literal["function"] = tc.type
+        self.name = tc.function.name
+        self.arguments: list[str] | None = (
+            None if tc.function.arguments is None else [tc.function.arguments]
+        )
+
+    def merge(self, tc: ToolCall) -> None:
+        new_name = tc.function.name
+        if self.name and new_name and self.name != new_name:
+            raise ValueError("Can't accumulate messages with different tool call names")
+        if new_name and not self.name:
+            self.name = new_name
+        if self.arguments is None:
+            self.arguments = []
+        self.arguments.append(tc.function.arguments or "")
+
+    def build(self) -> ToolCall:
+        return ToolCall(
+            id=self.id,
+            index=self.index,
+            function=FunctionCall(
+                name=self.name,
+                arguments=None if self.arguments is None else "".join(self.arguments),
+            ),
+            type=self.type,
+        )
+
+
+class StreamAccumulator:
+    """Linear-time equivalent of folding streamed chunks with ``LLMChunk.__add__``.
+
+    Folding with ``+`` re-concatenates every text field and rebuilds the
+    message on each delta, which is quadratic over long streams. This keeps
+    text parts in lists and tool call fragments by index, and only builds the
+    final ``LLMChunk`` once in :meth:`build`.
+    """
+
+    def __init__(self) -> None:
+        self._first_chunk: LLMChunk | None = None
+        self._first: LLMMessage | None = None
+        self._content: list[str] = []
+        self._reasoning_content: list[str] = []
+        self._reasoning_signature: list[str] = []
+        self._reasoning_state: list[str] | None = None
+        self._reasoning_message_id: str | None = None
+        self._images: list[ImageAttachment] | None = None
+        self._user_display_content: UserDisplayContentMetadata | None = None
+        self._tool_calls: dict[int, _ToolCallAccumulator] = {}
+        self._usage: LLMUsage | None = None
+        self._correlation_id: str | None = None
+        self._stop: StopInfo | None = None
+        self._count = 0
+
+    @property
+    def usage(self) -> LLMUsage | None:
+        return self._usage
+
+    def add(self, chunk: LLMChunk) -> None:
+        if self._first_chunk is None:
+            self._first_chunk = chunk
+        self._add_message(chunk.message)
+        if chunk.usage is not None:
+            self._usage = (
+                chunk.usage if self._usage is None else self._usage + chunk.usage
+            )
+        self._correlation_id = chunk.correlation_id or self._correlation_id
+        self._stop = chunk.stop or self._stop
+        self._count += 1
+
+    def _check_compatible(self, first: LLMMessage, msg: LLMMessage) -> None:
+        if first.role != msg.role:
+            raise ValueError("Can't accumulate messages with different roles")
+        if first.name != msg.name:
+            raise ValueError("Can't accumulate messages with different names")
+        if first.tool_call_id != msg.tool_call_id:
+            raise ValueError("Can't accumulate messages with different tool_call_ids")
+
+    def _add_message(self, msg: LLMMessage) -> None:
+        if self._first is None:
+            self._first = msg
+        else:
+            self._check_compatible(self._first, msg)
+        if self._images is None:
+            self._images = msg.images
+        if self._user_display_content is None:
+            self._user_display_content = msg.user_display_content
+
+        if msg.content:
+            self._content.append(msg.content)
+        if msg.reasoning_content:
+            self._reasoning_content.append(msg.reasoning_content)
+        if msg.reasoning_signature:
+            self._reasoning_signature.append(msg.reasoning_signature)
+        if msg.reasoning_state:
+            if self._reasoning_state is None:
+                self._reasoning_state = []
+            self._reasoning_state.extend(msg.reasoning_state)
+        self._reasoning_message_id = (
+            self._reasoning_message_id or msg.reasoning_message_id
+        )
+
+        for tc in msg.tool_calls or []:
+            if tc.index is None:
+                raise ValueError("Tool call chunk missing index")
+            if (existing := self._tool_calls.get(tc.index)) is None:
+                self._tool_calls[tc.index] = _ToolCallAccumulator(tc, tc.index)
+            else:
+                existing.merge(tc)
+
+    def build(self) -> LLMChunk:
+        if self._first_chunk is None or self._first is None:
+            raise ValueError("Can't build a chunk from an empty stream")
+        if self._count == 1:
+            return self._first_chunk
+        first = self._first
+        message = LLMMessage(
+            role=first.role,
+            content="".join(self._content) or None,
+            images=self._images,
+            reasoning_content="".join(self._reasoning_content) or None,
+            reasoning_state=self._reasoning_state,
+            reasoning_signature="".join(self._reasoning_signature) or None,
+            reasoning_message_id=self._reasoning_message_id,
+            tool_calls=[tc.build() for tc in self._tool_calls.values()] or None,
+            name=first.name,
+            tool_call_id=first.tool_call_id,
+            message_id=first.message_id,
+            user_display_content=self._user_display_content,
+        )
+        return LLMChunk(
+            message=message,
+            usage=self._usage,
+            correlation_id=self._correlation_id,
+            stop=self._stop,
+        )
+
+
 class BaseEvent(BaseModel, ABC):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -582,6 +728,33 @@ type SwitchAgentCallback = Callable[[str], Awaitable[None]]
 type ClearContextCallback = Callable[[], Awaitable[None]]
 
 
+# Per-message framing (role markers, separators) and a flat charge per image.
+_MESSAGE_OVERHEAD_TOKENS = 4
+_IMAGE_TOKENS = 1_500
+
+
+def _estimate_message_tokens(msg: LLMMessage, estimator: TokenEstimator) -> int:
+    tokens = _MESSAGE_OVERHEAD_TOKENS + len(msg.images or ()) * _IMAGE_TOKENS
+    for text in (msg.content, msg.reasoning_content):
+        if text:
+            tokens += estimator.count(text)
+    for tc in msg.tool_calls or ():
+        tokens += estimator.count(tc.function.name or "")
+        tokens += estimator.count(tc.function.arguments or "")
+    return tokens
+
+
+def _token_key(msg: LLMMessage) -> tuple[Any, ...]:
+    # Fields are compared by identity: assigning one swaps the stored object.
+    return (
+        msg,
+        msg.content,
+        msg.reasoning_content,
+        msg.images,
+        *((tc.function.name, tc.function.arguments) for tc in msg.tool_calls or ()),
+    )
+
+
 class MessageList(Sequence[LLMMessage]):
     def __init__(
         self,
@@ -592,6 +765,11 @@ class MessageList(Sequence[LLMMessage]):
         self._observer = observer
         self._reset_hooks: list[Callable[[], None]] = []
         self._silent = False
+        self._token_estimator: TokenEstimator | None = None
+        self._token_counts: list[tuple[tuple[Any, ...], int]] = []
+        # Prompt tokens not carried by the messages (tool schemas, request
+        # framing, estimator error), learned from the last real usage.
+        self._token_overhead: int | None = None
         if self._observer:
             for msg in self._data:
                 self._observer(msg)
@@ -621,6 +799,51 @@ class MessageList(Sequence[LLMMessage]):
         for hook in self._reset_hooks:
             hook()
 
+    def estimate_tokens(self, estimator: TokenEstimator) -> int:
+        """Estimated tokens of the messages themselves.
+
+        Per-message counts are cached, so only messages added or changed
+        since the last call are counted again.
+        """
+        if estimator is not self._token_estimator:
+            self._token_estimator = estimator
+            self._token_counts = []
+        counts = self._token_counts
+        del counts[len(self._data) :]
+        total = 0
+        for i, msg in enumerate(self._data):
+            key = _token_key(msg)
+            if i < len(counts) and all(
+                a is b for a, b in zip(counts[i][0], key, strict=True)
+            ):
+                total += counts[i][1]
+                continue
+            tokens = _estimate_message_tokens(msg, estimator)
+            if i < len(counts):
+                counts[i] = (key, tokens)
+            else:
+                counts.append((key, tokens))
+            total += tokens
+        return total
+
+    def calibrate_tokens(self, prompt_tokens: int, estimator: TokenEstimator) -> None:
+        """Record the real prompt size of a request made with these messages."""
+        self._token_overhead = prompt_tokens - self.estimate_tokens(estimator)
+
+    def projected_tokens(self, estimator: TokenEstimator) -> int:
+        """Prompt tokens a request with the current messages would use.
+
+        Returns 0 until a request has been calibrated: the overhead of tool
+        schemas is unknown before then.
+        """
+        if self._token_overhead is None:
+            return 0
+        return max(0, self.estimate_tokens(estimator) + self._token_overhead)
+
+    def replace(self, i: int, msg: LLMMessage) -> None:
+        """Swap the message at ``i`` silently (never notifies)."""
+        self._data[i] = msg
+
     def update_system_prompt(self, new: str, *, notify: bool = False) -> None:
         """Replace the system prompt, or insert it if none exists yet.
 
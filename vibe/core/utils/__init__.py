@@ -14,11 +14,15 @@ from vibe.core.utils.concurrency import (
 )
 from vibe.core.utils.display import compact_complete_display
 from vibe.core.utils.http import (
+    HTTPPoolSettings,
+    HTTPPoolStats,
     VibeAsyncHTTPClient,
     build_ssl_context,
+    configure_http_pool,
     configure_ssl_context,
     get_server_url_from_api_base,
     get_user_agent,
+    http_pool,
 )
 from vibe.core.utils.matching import name_matches
 from vibe.core.utils.merge import MergeConflictError, MergeStrategy
@@ -34,7 +38,7 @@ from vibe.core.utils.platform import (
     resolve_windows_shell,
 )
 from vibe.core.utils.retry import async_generator_retry, async_retry
-from vibe.core.utils.sse import iter_sse_lines
+from vibe.core.utils.sse import iter_sse_events, iter_sse_lines
 from vibe.core.utils.tags import (
     CANCELLATION_TAG,
     KNOWN_TAGS,
@@ -57,6 +61,8 @@ __all__ = [
     "AsyncExecutor",
     "CancellationReason",
     "ConversationLimitException",
+    "HTTPPoolSettings",
+    "HTTPPoolStats",
     "MergeConflictError",
     "MergeStrategy",
     "TaggedText",
@@ -67,6 +73,7 @@ __all__ = [
     "async_retry",
     "build_ssl_context",
     "compact_complete_display",
+    "configure_http_pool",
     "configure_ssl_context",
     "get_platform_display_name",
     "get_platform_id",
@@ -75,9 +82,11 @@ __all__ = [
     "get_user_agent",
     "get_user_cancellation_message",
     "get_windows_bash_path",
+    "http_pool",
     "is_dangerous_directory",
     "is_user_cancellation_event",
     "is_windows",
+    "iter_sse_events",
     "iter_sse_lines",
     "kill_async_subprocess",
     "name_matches",
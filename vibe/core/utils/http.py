@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
+import contextlib
+from dataclasses import dataclass, field, replace
 import functools
+import importlib.util
 import ipaddress
 import os
 import re
 import ssl
+import time
 from typing import Any
 from urllib.parse import urlparse
 from urllib.request import getproxies
+import weakref
 
 import certifi
 import httpx
@@ -77,6 +84,25 @@ class _EnvProxyTransport(httpx.AsyncBaseTransport):
             await transport.aclose()
 
 
+def _env_proxy_transport(transport_kwargs: dict[str, Any]) -> _EnvProxyTransport | None:
+    proxy_info = getproxies()
+    proxies = {
+        scheme: proxy_url
+        for scheme in ("http", "https", "all")
+        if (proxy_url := _normalize_proxy_url(proxy_info.get(scheme)))
+    }
+    if not proxies:
+        return None
+    return _EnvProxyTransport(
+        proxies,
+        tuple(
+            part.strip() for part in proxy_info.get("no", "").split(",") if part.strip()
+        ),
+        trust_env=False,
+        **transport_kwargs,
+    )
+
+
 class VibeAsyncHTTPClient(httpx.AsyncClient):
     """HTTPX client that works around HTTPX's CIDR NO_PROXY limitation."""
 
@@ -87,29 +113,323 @@ class VibeAsyncHTTPClient(httpx.AsyncClient):
             and kwargs.get("proxy") is None
             and kwargs.get("mounts") is None
         ):
-            proxy_info = getproxies()
-            proxies = {
-                scheme: proxy_url
-                for scheme in ("http", "https", "all")
-                if (proxy_url := _normalize_proxy_url(proxy_info.get(scheme)))
+            transport_kwargs = {
+                key: kwargs[key]
+                for key in ("verify", "cert", "http1", "http2", "limits")
+                if key in kwargs
             }
-            if proxies:
-                transport_kwargs: dict[str, Any] = {"trust_env": False}
-                for key in ("verify", "cert", "http1", "http2", "limits"):
-                    if key in kwargs:
-                        transport_kwargs[key] = kwargs.pop(key)
-                kwargs["transport"] = _EnvProxyTransport(
-                    proxies,
-                    tuple(
-                        part.strip()
-                        for part in proxy_info.get("no", "").split(",")
-                        if part.strip()
-                    ),
-                    **transport_kwargs,
-                )
+            if (transport := _env_proxy_transport(transport_kwargs)) is not None:
+                for key in transport_kwargs:
+                    del kwargs[key]
+                kwargs["transport"] = transport
         super().__init__(**kwargs)
 
 
+@dataclass(frozen=True, slots=True)
+class HTTPPoolSettings:
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+
+
+@dataclass(slots=True)
+class HTTPPoolStats:
+    requests: int = 0
+    connections_opened: int = 0
+    connections_reused: int = 0
+    tls_handshakes: int = 0
+    # Handshake time of prewarmed connections later reused by a real request.
+    prewarm_time_saved: float = 0.0
+
+    def __add__(self, other: HTTPPoolStats) -> HTTPPoolStats:
+        return HTTPPoolStats(
+            requests=self.requests + other.requests,
+            connections_opened=self.connections_opened + other.connections_opened,
+            connections_reused=self.connections_reused + other.connections_reused,
+            tls_handshakes=self.tls_handshakes + other.tls_handshakes,
+            prewarm_time_saved=self.prewarm_time_saved + other.prewarm_time_saved,
+        )
+
+    def __sub__(self, other: HTTPPoolStats) -> HTTPPoolStats:
+        return HTTPPoolStats(
+            requests=self.requests - other.requests,
+            connections_opened=self.connections_opened - other.connections_opened,
+            connections_reused=self.connections_reused - other.connections_reused,
+            tls_handshakes=self.tls_handshakes - other.tls_handshakes,
+            prewarm_time_saved=self.prewarm_time_saved - other.prewarm_time_saved,
+        )
+
+
+# Request extension marking prewarm probes, which are not counted as requests.
+PREWARM_EXTENSION = "vibe_prewarm"
+
+# Origins idle for longer than this (or the keep-alive expiry, if longer) have
+# their pool closed and their stats folded into the registry totals.
+IDLE_ORIGIN_TTL = 300.0
+
+
+def _origin(url: httpx.URL) -> str:
+    port = url.port or {"http": 80, "https": 443}.get(url.scheme)
+    return f"{url.scheme}://{url.host}:{port}"
+
+
+class _PooledTransport(httpx.AsyncBaseTransport):
+    """Client-facing view of the shared pools.
+
+    Routes every request to the pool of its origin, so one client may follow
+    redirects across hosts. Closing it leaves the shared connections open.
+    """
+
+    def __init__(self, registry: HTTPPoolRegistry) -> None:
+        self._registry = registry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        registry = self._registry
+        origin = _origin(request.url)
+        await registry._evict_idle()
+        entry = registry._pool_for(origin)
+        stats = registry._stats.setdefault(origin, HTTPPoolStats())
+        prewarm = bool(request.extensions.get(PREWARM_EXTENSION))
+        pending_saving: float | None = None
+        if not prewarm:
+            stats.requests += 1
+            pending_saving = registry._prewarmed.pop(origin, None)
+        opened = False
+        outer_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            nonlocal opened
+            if event_name == "connection.connect_tcp.complete":
+                opened = True
+                stats.connections_opened += 1
+            elif event_name == "connection.start_tls.complete":
+                stats.tls_handshakes += 1
+            if outer_trace is not None:
+                await outer_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        entry.in_flight += 1
+        try:
+            response = await entry.transport.handle_async_request(request)
+        except BaseException:
+            await registry._release(entry)
+            raise
+        if not opened and not prewarm:
+            stats.connections_reused += 1
+            # Only a request that rides the warmed connection saved its setup.
+            if pending_saving is not None:
+                stats.prewarm_time_saved += pending_saving
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _ReleasingStream(response.stream, registry, entry)
+        return response
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Hands the pool back to the registry once the response body is closed."""
+
+    def __init__(
+        self, stream: httpx.AsyncByteStream, registry: HTTPPoolRegistry, entry: _Pool
+    ) -> None:
+        self._stream = stream
+        self._registry = registry
+        self._entry: _Pool | None = entry
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if (entry := self._entry) is not None:
+                self._entry = None
+                await self._registry._release(entry)
+
+
+@dataclass(slots=True, eq=False)
+class _Pool:
+    transport: httpx.AsyncBaseTransport
+    in_flight: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    retired: bool = False
+
+
+class HTTPPoolRegistry:
+    """Process-wide connection pools, one per origin.
+
+    Clients opt in with ``transport=http_pool.transport()``. httpcore pools
+    are bound to the event loop that created them, so pools are kept per
+    running loop; settings and stats are shared. Pools left idle for
+    ``IDLE_ORIGIN_TTL`` are closed, and pools replaced by ``configure`` are
+    closed once their in-flight responses finish.
+    """
+
+    def __init__(self, settings: HTTPPoolSettings | None = None) -> None:
+        self._settings = settings or HTTPPoolSettings()
+        self._pools: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[tuple[str, int], _Pool]
+        ] = weakref.WeakKeyDictionary()
+        self._stats: dict[str, HTTPPoolStats] = {}
+        # Handshake time of each origin's prewarmed connection, credited to
+        # ``prewarm_time_saved`` by the next real request if it reuses it.
+        self._prewarmed: dict[str, float] = {}
+        # Totals of evicted origins, so ``total_stats`` never goes backwards.
+        self._evicted_stats = HTTPPoolStats()
+        self._last_sweep = time.monotonic()
+        self._closing: set[asyncio.Task[None]] = set()
+
+    @property
+    def settings(self) -> HTTPPoolSettings:
+        return self._settings
+
+    def configure(self, settings: HTTPPoolSettings) -> None:
+        if settings == self._settings:
+            return
+        self._settings = settings
+        dropped, self._pools = self._pools, weakref.WeakKeyDictionary()
+        for loop, pools in list(dropped.items()):
+            for entry in pools.values():
+                entry.retired = True
+            idle = [entry for entry in pools.values() if not entry.in_flight]
+            if idle and not loop.is_closed():
+                loop.call_soon_threadsafe(self._spawn_close, loop, idle)
+
+    def transport(self) -> httpx.AsyncBaseTransport:
+        return _PooledTransport(self)
+
+    def _pool_for(self, origin: str) -> _Pool:
+        pools = self._pools.setdefault(asyncio.get_running_loop(), {})
+        verify = build_ssl_context()
+        # Keyed on the SSL context too, so trust store changes get fresh pools.
+        key = (origin, id(verify))
+        if (entry := pools.get(key)) is None:
+            entry = pools[key] = _Pool(self._build_pool(verify))
+        return entry
+
+    def _build_pool(self, verify: ssl.SSLContext) -> httpx.AsyncBaseTransport:
+        settings = self._settings
+        http2 = settings.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            from vibe.core.logger import logger
+
+            logger.warning(
+                "HTTP/2 requested but the h2 package is not installed; "
+                "install mistral-vibe[http2]"
+            )
+            http2 = False
+        transport_kwargs: dict[str, Any] = {
+            "verify": verify,
+            "http2": http2,
+            "limits": httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+        }
+        return _env_proxy_transport(transport_kwargs) or httpx.AsyncHTTPTransport(
+            trust_env=False, **transport_kwargs
+        )
+
+    async def _release(self, entry: _Pool) -> None:
+        entry.in_flight -= 1
+        entry.last_used = time.monotonic()
+        if entry.retired and not entry.in_flight:
+            await _close_pools([entry])
+
+    def _spawn_close(
+        self, loop: asyncio.AbstractEventLoop, entries: list[_Pool]
+    ) -> None:
+        task = loop.create_task(_close_pools(entries))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _evict_idle(self) -> None:
+        now = time.monotonic()
+        ttl = max(IDLE_ORIGIN_TTL, self._settings.keepalive_expiry)
+        if now - self._last_sweep < ttl:
+            return
+        self._last_sweep = now
+        pools = self._pools.get(asyncio.get_running_loop(), {})
+        idle = [
+            key
+            for key, entry in pools.items()
+            if not entry.in_flight and now - entry.last_used >= ttl
+        ]
+        await _close_pools([pools.pop(key) for key in idle])
+        live = {origin for pools in self._pools.values() for origin, _ in pools}
+        for origin in [origin for origin in self._stats if origin not in live]:
+            self._evicted_stats += self._stats.pop(origin)
+            self._prewarmed.pop(origin, None)
+
+    def stats(self) -> dict[str, HTTPPoolStats]:
+        return {origin: replace(stats) for origin, stats in self._stats.items()}
+
+    def total_stats(self) -> HTTPPoolStats:
+        total = replace(self._evicted_stats)
+        for stats in self._stats.values():
+            total += stats
+        return total
+
+    async def prewarm(self, url: str, *, timeout: float = 5.0) -> float | None:
+        """Open or validate a pooled connection to the origin of ``url``.
+
+        Sends a ``HEAD`` to the origin; any response leaves the connection in
+        the pool. Returns the seconds spent on DNS, TCP and TLS setup (``0.0``
+        when a warm connection was reused), or ``None`` when the origin was
+        unreachable. The setup time counts as saved only once a real request
+        reuses the warmed connection.
+        """
+        origin = _origin(httpx.URL(url))
+        connecting_since: float | None = None
+        handshake = 0.0
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            nonlocal connecting_since, handshake
+            if event_name == "connection.connect_tcp.started":
+                connecting_since = time.monotonic()
+            elif connecting_since is not None and event_name in {
+                "connection.connect_tcp.complete",
+                "connection.start_tls.complete",
+            }:
+                handshake = time.monotonic() - connecting_since
+
+        try:
+            async with VibeAsyncHTTPClient(
+                transport=self.transport(), timeout=timeout
+            ) as client:
+                await client.head(
+                    httpx.URL(url).copy_with(path="/", query=None),
+                    extensions={"trace": trace, PREWARM_EXTENSION: True},
+                )
+        except Exception:
+            # Best effort: the first real request simply opens its own connection.
+            self._prewarmed.pop(origin, None)
+            return None
+        if handshake:
+            self._prewarmed[origin] = handshake
+        return handshake
+
+    async def aclose(self) -> None:
+        """Close the pools of the running event loop."""
+        pools = self._pools.pop(asyncio.get_running_loop(), {})
+        await _close_pools(list(pools.values()))
+
+
+async def _close_pools(entries: list[_Pool]) -> None:
+    for entry in entries:
+        with contextlib.suppress(Exception):
+            await entry.transport.aclose()
+
+
+http_pool = HTTPPoolRegistry()
+
+
+def configure_http_pool(settings: HTTPPoolSettings) -> None:
+    http_pool.configure(settings)
+
+
 def _normalize_proxy_url(value: str | None) -> str | None:
     if value is None or not (value := value.strip()):
         return None
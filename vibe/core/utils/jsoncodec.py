@@ -0,0 +1,150 @@
+"""JSON codec used on hot paths (request bodies, stream deltas, session logs).
+
+Uses orjson or msgspec when one of them is installed and falls back to the
+standard library otherwise. Set ``VIBE_JSON_CODEC`` to ``orjson``,
+``msgspec`` or ``json`` to force a specific implementation.
+
+All implementations emit UTF-8 without ASCII escaping and raise
+``json.JSONDecodeError`` on malformed input, so callers can keep catching the
+stdlib exception whichever codec is active. orjson and msgspec only handle
+64-bit integers and reject the ``NaN``/``Infinity`` tokens the standard library
+writes; those cases are retried with the standard library, so every codec
+reads and writes them alike. The one remaining difference is that orjson and
+msgspec encode non-finite floats as ``null`` rather than ``NaN``/``Infinity``.
+
+Install the ``fast-json`` extra (``mistral-vibe[fast-json]``) to get orjson.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import importlib.util
+import json
+import os
+from typing import Any, Literal, cast
+
+type CodecName = Literal["orjson", "msgspec", "json"]
+
+_PREFERENCE: tuple[CodecName, ...] = ("orjson", "msgspec", "json")
+
+JSONDecodeError = json.JSONDecodeError
+
+
+@dataclass(frozen=True, slots=True)
+class _Codec:
+    name: CodecName
+    dumpb: Callable[[Any, bool], bytes]
+    loads: Callable[[str | bytes], Any]
+
+
+def _stdlib_codec() -> _Codec:
+    def dumpb(obj: Any, indent: bool) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode(
+            "utf-8"
+        )
+
+    return _Codec("json", dumpb, json.loads)
+
+
+def _orjson_codec() -> _Codec:
+    import orjson  # pyright: ignore[reportMissingImports]
+
+    def dumpb(obj: Any, indent: bool) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    # orjson.JSONDecodeError already subclasses json.JSONDecodeError.
+    return _Codec("orjson", dumpb, orjson.loads)
+
+
+def _msgspec_codec() -> _Codec:
+    import msgspec  # pyright: ignore[reportMissingImports]
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def dumpb(obj: Any, indent: bool) -> bytes:
+        data = encoder.encode(obj)
+        return msgspec.json.format(data, indent=2) if indent else data
+
+    def loads(data: str | bytes) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            doc = data if isinstance(data, str) else data.decode("utf-8", "replace")
+            raise JSONDecodeError(str(e), doc, 0) from e
+
+    return _Codec("msgspec", dumpb, loads)
+
+
+def _with_stdlib_fallback(codec: _Codec) -> _Codec:
+    stdlib = _stdlib_codec()
+
+    def dumpb(obj: Any, indent: bool) -> bytes:
+        try:
+            return codec.dumpb(obj, indent)
+        except (TypeError, OverflowError):
+            # Integers beyond 64 bits; unsupported types raise again below.
+            return stdlib.dumpb(obj, indent)
+
+    def loads(data: str | bytes) -> Any:
+        try:
+            return codec.loads(data)
+        except JSONDecodeError:
+            # NaN/Infinity tokens and big integers; malformed input raises again.
+            return stdlib.loads(data)
+
+    return _Codec(codec.name, dumpb, loads)
+
+
+_FACTORIES: dict[CodecName, Callable[[], _Codec]] = {
+    "orjson": lambda: _with_stdlib_fallback(_orjson_codec()),
+    "msgspec": lambda: _with_stdlib_fallback(_msgspec_codec()),
+    "json": _stdlib_codec,
+}
+
+
+def _is_available(name: CodecName) -> bool:
+    return name == "json" or importlib.util.find_spec(name) is not None
+
+
+def _select_codec() -> _Codec:
+    requested = os.environ.get("VIBE_JSON_CODEC", "").strip().lower()
+    if requested in _FACTORIES and _is_available(cast(CodecName, requested)):
+        return _FACTORIES[cast(CodecName, requested)]()
+    for name in _PREFERENCE:
+        if _is_available(name):
+            return _FACTORIES[name]()
+    return _stdlib_codec()
+
+
+_codec = _select_codec()
+
+
+def codec_name() -> CodecName:
+    return _codec.name
+
+
+def use_codec(name: CodecName) -> None:
+    """Switch the active codec, e.g. to compare implementations in benchmarks."""
+    global _codec
+    if not _is_available(name):
+        raise ValueError(f"JSON codec {name!r} is not installed")
+    _codec = _FACTORIES[name]()
+
+
+def dumpb(obj: Any, *, indent: bool = False) -> bytes:
+    return _codec.dumpb(obj, indent)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    return _codec.dumpb(obj, indent).decode("utf-8")
+
+
+def loads(data: str | bytes | bytearray) -> Any:
+    if isinstance(data, bytearray):
+        data = bytes(data)
+    return _codec.loads(data)
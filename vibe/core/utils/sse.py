@@ -1,27 +1,157 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+import re
 
 import httpx
 
+# SSE delimits lines with CRLF, LF or CR only, but httpx's aiter_lines()
+# follows str.splitlines() and also breaks on U+2028/U+0085/..., which are
+# valid unescaped inside JSON strings, truncating payloads mid-line.
+_LINE_END = re.compile(rb"\r\n|\r|\n")
+_CR = ord("\r")
 
-async def iter_sse_lines(response: httpx.Response) -> AsyncGenerator[str]:
-    # SSE delimits lines with CRLF, LF or CR only, but httpx's aiter_lines()
-    # follows str.splitlines() and also breaks on U+2028/U+0085/..., which are
-    # valid unescaped inside JSON strings, truncating payloads mid-line.
-    buffer = b""
-    async for chunk in response.aiter_bytes():
+
+class SSELineDecoder:
+    """Incrementally split a byte stream into SSE lines.
+
+    Bytes are appended to a single ``bytearray`` and only the newly arrived
+    region is scanned for delimiters, so a long line spread over many small
+    reads is neither rescanned nor copied until it is complete.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._scan_from = 0
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        buffer = self._buffer
         buffer += chunk
-        # A trailing CR may be the first half of a CRLF split across chunks.
-        held_cr = buffer.endswith(b"\r")
-        if held_cr:
-            buffer = buffer[:-1]
-        *lines, buffer = (
-            buffer.replace(b"\r\n", b"\n").replace(b"\r", b"\n").split(b"\n")
+        lines: list[bytes] = []
+        start = 0
+        end = len(buffer)
+        # Materialise the spans first: a live match pins the buffer's memory,
+        # which would make the in-place `del` below raise BufferError.
+        spans = [m.span() for m in _LINE_END.finditer(buffer, self._scan_from)]
+        self._scan_from = end
+        for line_end, next_start in spans:
+            # A trailing CR may be the first half of a CRLF split across chunks.
+            if next_start == end and buffer[line_end] == _CR:
+                self._scan_from = line_end
+                break
+            lines.append(bytes(buffer[start:line_end]))
+            start = next_start
+        if start:
+            del buffer[:start]
+            self._scan_from -= start
+        return lines
+
+    def flush(self) -> bytes | None:
+        """Return the unterminated trailing line, if any, and reset the buffer."""
+        if not self._buffer:
+            return None
+        line = bytes(self._buffer).removesuffix(b"\r")
+        self._buffer.clear()
+        self._scan_from = 0
+        return line
+
+
+@dataclass(slots=True)
+class SSEEvent:
+    data: str
+    event: str = "message"
+    id: str | None = None
+    retry: int | None = None
+
+
+class SSEEventDecoder:
+    """Assemble SSE lines into events following the WHATWG framing rules.
+
+    ``data:`` lines are joined with newlines, ``event:``/``id:``/``retry:``
+    fields are attached to the event, comments are skipped and a blank line
+    dispatches the event. With ``strict``, a line without a ``:`` separator
+    raises ``ValueError`` instead of being read as a field with no value.
+    """
+
+    def __init__(self, *, strict: bool = False) -> None:
+        self._strict = strict
+        self._data: list[str] = []
+        self._event: str | None = None
+        self._retry: int | None = None
+        self._last_id: str | None = None
+
+    def decode(self, line: str) -> SSEEvent | None:
+        if not line:
+            return self._dispatch()
+        if line.startswith(":"):
+            return None
+
+        field, sep, value = line.partition(":")
+        if not sep and self._strict:
+            raise ValueError(
+                "Stream chunk improperly formatted. "
+                f"Expected `key: value`, received `{line}`"
+            )
+        if sep and value.startswith(" "):
+            value = value[1:]
+
+        match field:
+            case "data":
+                self._data.append(value)
+            case "event":
+                self._event = value
+            case "id":
+                if "\0" not in value:
+                    self._last_id = value
+            case "retry":
+                if value.isdigit():
+                    self._retry = int(value)
+        return None
+
+    def flush(self) -> SSEEvent | None:
+        """Dispatch a pending event at end of stream.
+
+        Strictly, an unterminated event should be discarded, but several
+        providers omit the trailing blank line after their last event.
+        """
+        return self._dispatch()
+
+    def _dispatch(self) -> SSEEvent | None:
+        if not self._data:
+            self._event = None
+            return None
+        event = SSEEvent(
+            data="\n".join(self._data),
+            event=self._event or "message",
+            id=self._last_id,
+            retry=self._retry,
         )
-        if held_cr:
-            buffer += b"\r"
-        for line in lines:
-            yield line.decode("utf-8", errors="replace")
-    if buffer:
-        yield buffer.removesuffix(b"\r").decode("utf-8", errors="replace")
+        self._data = []
+        self._event = None
+        self._retry = None
+        return event
+
+
+def _decode(line: bytes) -> str:
+    return line.decode("utf-8", errors="replace")
+
+
+async def iter_sse_lines(response: httpx.Response) -> AsyncGenerator[str]:
+    decoder = SSELineDecoder()
+    async for chunk in response.aiter_bytes():
+        for line in decoder.feed(chunk):
+            yield _decode(line)
+    if (tail := decoder.flush()) is not None:
+        yield _decode(tail)
+
+
+async def iter_sse_events(
+    response: httpx.Response, *, strict: bool = False
+) -> AsyncGenerator[SSEEvent]:
+    decoder = SSEEventDecoder(strict=strict)
+    async for line in iter_sse_lines(response):
+        if (event := decoder.decode(line)) is not None:
+            yield event
+    if (event := decoder.flush()) is not None:
+        yield event
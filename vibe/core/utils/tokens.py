@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 import math
+from typing import Protocol
 
 _APPROX_BYTES_PER_TOKEN = 4
 _TRUNCATION_MARKER = "\n\n[... truncated ...]\n\n"
@@ -10,6 +12,58 @@ def approx_token_count(text: str) -> int:
     return math.ceil(len(text) / _APPROX_BYTES_PER_TOKEN)
 
 
+class TokenEstimator(Protocol):
+    """Estimates how many tokens a model's tokenizer produces for ``text``."""
+
+    def count(self, text: str) -> int: ...
+
+
+@dataclass(frozen=True, slots=True)
+class CharRatioEstimator:
+    """Estimate from the character count, charging extra for non-ASCII text.
+
+    Latin text averages ``chars_per_token`` characters per token. Characters
+    outside ASCII (accented letters, CJK, emoji) split into more tokens, so
+    each UTF-8 continuation byte adds ``tokens_per_extra_byte``: about one
+    token per CJK character.
+    """
+
+    chars_per_token: float
+    tokens_per_extra_byte: float = 0.5
+
+    def count(self, text: str) -> int:
+        tokens = len(text) / self.chars_per_token
+        if not text.isascii():
+            tokens += (len(text.encode()) - len(text)) * self.tokens_per_extra_byte
+        return math.ceil(tokens)
+
+
+# Tokenizer families by API style; Mistral backends are always "mistral".
+TOKEN_FAMILY_BY_API_STYLE = {
+    "openai": "openai",
+    "openai-responses": "openai",
+    "reasoning": "openai",
+    "anthropic": "anthropic",
+    "vertex-anthropic": "anthropic",
+}
+DEFAULT_TOKEN_FAMILY = "openai"
+
+_ESTIMATORS: dict[str, TokenEstimator] = {
+    "mistral": CharRatioEstimator(chars_per_token=3.6),
+    "openai": CharRatioEstimator(chars_per_token=3.8),
+    "anthropic": CharRatioEstimator(chars_per_token=3.4),
+}
+
+
+def register_token_estimator(family: str, estimator: TokenEstimator) -> None:
+    """Use ``estimator`` for ``family``, e.g. one backed by a real tokenizer."""
+    _ESTIMATORS[family] = estimator
+
+
+def token_estimator_for(family: str) -> TokenEstimator:
+    return _ESTIMATORS.get(family) or _ESTIMATORS[DEFAULT_TOKEN_FAMILY]
+
+
 def truncate_middle_to_tokens(text: str, max_tokens: int) -> str:
     """Shrink ``text`` to fit in ``max_tokens`` by dropping the middle.
 